@@ -6,75 +6,644 @@ Run this to verify the approach before investing time in complex implementations
 """
 
 import sys
+import math
+import multiprocessing
+import os
+import queue
 import random
+import threading
 import time
+from collections import OrderedDict, defaultdict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import chess
+import chess.polyglot
+
 from src.chess_env import ChessOpenEnv
 
+# Material values (pawns) for cutting off decided playouts
+PIECE_VALUES = {
+    chess.PAWN: 1,
+    chess.KNIGHT: 3,
+    chess.BISHOP: 3,
+    chess.ROOK: 5,
+    chess.QUEEN: 9,
+    chess.KING: 0,
+}
+MATERIAL_CUTOFF = 5.0
+
+
+@dataclass
+class Node:
+    """A position in the UCT search graph.
+
+    ``value`` is the total reward accumulated from the perspective of the
+    player who moved into this position (i.e. the side not to move here).
+    Transposed positions share one node, so the move leading here is kept
+    on the parent's ``children`` edge rather than on the node.
+    """
+    key: int = 0
+    visits: int = 0
+    value: float = 0.0
+    children: Dict[chess.Move, "Node"] = field(default_factory=dict)
+    untried_moves: List[chess.Move] = field(default_factory=list)
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def ucb1(self, parent_visits: int, exploration: float) -> float:
+        """UCB1 score used during selection."""
+        return self.value / self.visits + exploration * math.sqrt(
+            math.log(parent_visits) / self.visits
+        )
+
+    def select_child(self, exploration: float) -> Tuple[chess.Move, "Node"]:
+        """Pick the (move, child) edge maximising UCB1."""
+        return max(
+            self.children.items(),
+            key=lambda edge: edge[1].ucb1(self.visits, exploration),
+        )
+
+
+class EvalCache:
+    """Bounded LRU of Zobrist hash -> (visits, value) shared across searches."""
+
+    def __init__(self, max_size: int = 100_000):
+        """Initialize cache.
+
+        Args:
+            max_size: Maximum number of positions kept before LRU eviction
+        """
+        self.max_size = max_size
+        self._entries: "OrderedDict[int, Tuple[int, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: int) -> Optional[Tuple[int, float]]:
+        """Return cached (visits, value) for ``key`` and mark it recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: int, visits: int, value: float) -> None:
+        """Store statistics for ``key``, evicting the oldest entry if full."""
+        with self._lock:
+            self._entries[key] = (visits, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def terminal_reward(board: chess.Board) -> Optional[float]:
+    """Reward for the player who just moved, or None if the game goes on.
 
-def random_playout(env: ChessOpenEnv, max_moves: int = 50) -> float:
-    """Play random moves until game ends. Returns reward."""
+    Uses the same end conditions as ChessLogic.is_terminal().
+    """
+    outcome = board.outcome()
+    if outcome is None:
+        return None
+    return 1.0 if outcome.winner is not None else 0.0
+
+
+def random_move(board: chess.Board, rng: Optional[random.Random] = None) -> Optional[chess.Move]:
+    """Pick a random legal move straight from the board's bitboards.
+
+    Rather than materialising every legal move, draw a random piece from the
+    side-to-move occupancy bitboard, generate only that piece's pseudo-legal
+    moves and keep the first one that does not leave the king in check.
+    Pieces/moves that fail are discarded, so the loop always terminates.
+    Sampling is uniform over pieces, then over that piece's moves.
+
+    Args:
+        board: Position to move in
+        rng: Random generator to draw from (default: the global one)
+
+    Returns:
+        A legal move, or None if the side to move has none
+    """
+    randrange = (rng or random).randrange
+    squares = list(chess.scan_forward(board.occupied_co[board.turn]))
+    while squares:
+        i = randrange(len(squares))
+        moves = list(board.generate_pseudo_legal_moves(from_mask=chess.BB_SQUARES[squares[i]]))
+        while moves:
+            j = randrange(len(moves))
+            if not board.is_into_check(moves[j]):
+                return moves[j]
+            moves[j] = moves[-1]
+            moves.pop()
+        squares[i] = squares[-1]
+        squares.pop()
+    return None
+
+
+def material_balance(board: chess.Board) -> int:
+    """Material of the side to move minus the opponent's, in pawns."""
+    balance = 0
+    for piece_type, value in PIECE_VALUES.items():
+        balance += value * (
+            chess.popcount(board.pieces_mask(piece_type, board.turn))
+            - chess.popcount(board.pieces_mask(piece_type, not board.turn))
+        )
+    return balance
+
+
+def random_playout(
+    board: chess.Board,
+    max_moves: int = 50,
+    rng: Optional[random.Random] = None,
+    material_cutoff: Optional[float] = MATERIAL_CUTOFF,
+) -> float:
+    """Play random moves until game ends, then restore the board.
+
+    Only cheap end conditions are checked per ply (no legal moves,
+    insufficient material, 75-move rule); repetition is ignored. Pass a
+    private ``rng`` for reproducible playouts that do not touch the global
+    generator shared by other threads.
+
+    Once either side is more than ``material_cutoff`` pawns ahead the
+    playout stops early and scores ``tanh(balance / material_cutoff)``
+    instead of wandering on to the move limit. The balance is updated
+    incrementally on captures and promotions. Pass None to disable.
+
+    Returns reward from the perspective of the player to move when the
+    playout starts (+1 win, -1 loss, 0 draw or timeout).
+    """
+    result = 0.0  # Draw if timeout
+    balance = material_balance(board) if material_cutoff is not None else 0
     moves = 0
     while moves < max_moves:
-        legal_moves = env.get_legal_moves()
-        if not legal_moves:
+        if material_cutoff is not None and abs(balance) > material_cutoff:
+            result = math.tanh(balance / material_cutoff)
             break
         
-        move = random.choice(legal_moves)
-        obs, reward, done, truncated, info = env.step(move)
+        move = random_move(board, rng)
+        if move is None:
+            if board.is_check():
+                # Side to move is mated; even plies are ours
+                result = -1.0 if moves % 2 == 0 else 1.0
+            break
         
-        if done:
-            return reward
+        if material_cutoff is not None:
+            gain = 0
+            if board.is_en_passant(move):
+                gain = PIECE_VALUES[chess.PAWN]
+            else:
+                captured = board.piece_type_at(move.to_square)
+                if captured is not None:
+                    gain = PIECE_VALUES[captured]
+            if move.promotion:
+                gain += PIECE_VALUES[move.promotion] - PIECE_VALUES[chess.PAWN]
+            # Even plies are played by the side the balance is measured for
+            balance += gain if moves % 2 == 0 else -gain
         
+        board.push(move)
         moves += 1
+        
+        if board.is_insufficient_material() or board.halfmove_clock >= 150:
+            break
     
-    return 0.0  # Draw if timeout
+    for _ in range(moves):
+        board.pop()
+    return result
+
+
+def playout_from_fen(fen: str, seed: int, max_moves: int = 50) -> float:
+    """Process-pool entry point: random playout from ``fen``."""
+    return random_playout(chess.Board(fen), max_moves=max_moves, rng=random.Random(seed))
+
+
+def playout_value(fen: str) -> float:
+    """Default leaf evaluator: one random playout from ``fen``."""
+    return playout_from_fen(fen, random.randrange(2**32))
+
+
+class UCTSearch:
+    """UCT (UCB1 applied to trees) search that keeps its tree between moves.
+
+    One simulation = select down the tree with UCB1, expand one untried move,
+    random playout, backpropagate along the traversed path. Simulations run
+    on a scratch copy of the env's board with push/pop, so no environment is
+    constructed per simulation. After a move is played, ``advance()``
+    re-roots the tree at that child so consecutive positions reuse the
+    subtree already explored.
+
+    With ``leaf_playouts > 1`` each expanded leaf is scored by that many
+    playouts (leaf parallelization), run on ``executor`` when one is given.
+    Playouts are pure Python and hold the GIL, so pass a process pool.
+
+    With ``threads > 1`` several threads share the one tree (tree
+    parallelization), guarded by per-node locks and virtual loss. Threads
+    only scale once the playout itself stops holding the GIL.
+
+    Positions are keyed by Zobrist hash in a transposition table: expanding
+    into a position already in the table links to the existing node (making
+    the tree a DAG) and reuses its average value instead of a new playout.
+    An optional ``eval_cache`` outlives the tree: backpropagation writes
+    node statistics to it and new nodes are seeded from it.
+
+    With ``pipeline_workers > 0`` the phases run as a pipeline: the calling
+    thread selects and expands, ``pipeline_workers`` threads score leaves
+    with ``evaluator`` and one thread backpropagates, connected by queues.
+    Virtual loss lets selection continue while evaluations are in flight,
+    which pays off when ``evaluator`` waits on I/O (e.g. a remote model).
+    """
+
+    def __init__(
+        self,
+        exploration: float = 1.4,
+        leaf_playouts: int = 1,
+        executor: Optional[Executor] = None,
+        threads: int = 1,
+        virtual_loss: int = 1,
+        eval_cache: Optional[EvalCache] = None,
+        pipeline_workers: int = 0,
+        evaluator: Optional[Callable[[str], float]] = None,
+    ):
+        """Initialize search.
+
+        Args:
+            exploration: UCB1 exploration constant C
+            leaf_playouts: Number of playouts per expanded leaf
+            executor: Optional pool used to run leaf playouts in parallel
+            threads: Number of threads sharing the tree
+            virtual_loss: Visits/loss charged to in-flight paths when threaded
+            eval_cache: Optional cache of node statistics kept across searches
+            pipeline_workers: Number of evaluator threads in pipelined mode (0 = off)
+            evaluator: Value of a FEN for its side to move (default: one playout)
+        """
+        self.exploration = exploration
+        self.leaf_playouts = leaf_playouts
+        self.executor = executor
+        self.threads = threads
+        self.virtual_loss = virtual_loss
+        self.eval_cache = eval_cache
+        self.pipeline_workers = pipeline_workers
+        self.evaluator = evaluator or playout_value
+        self.root: Optional[Node] = None
+        self.root_fen: Optional[str] = None
+        # Transposition table: zobrist hash -> shared node
+        self.table: Dict[int, Node] = {}
+        self._local = threading.local()
+
+    def search(self, env: ChessOpenEnv, num_simulations: int = 100) -> Optional[str]:
+        """Run ``num_simulations`` simulations from the env's position.
+
+        Returns:
+            The most visited root move in UCI, or None if there are no legal moves
+        """
+        board = env.chess.board.copy()
+        fen = board.fen()
+        if self.root is None or self.root_fen != fen:
+            key = chess.polyglot.zobrist_hash(board)
+            self.root = self.table.get(key) or self._new_node(key, list(board.legal_moves))
+            self.table[key] = self.root
+            self.root_fen = fen
+        
+        if not self.root.untried_moves and not self.root.children:
+            return None
+        
+        if self.pipeline_workers > 0:
+            self._run_pipelined(board, num_simulations)
+        elif self.threads > 1:
+            # One scratch board per thread; the tree itself is shared
+            chunks = [num_simulations // self.threads] * self.threads
+            chunks[0] += num_simulations % self.threads
+            with ThreadPoolExecutor(max_workers=self.threads) as pool:
+                list(pool.map(
+                    lambda count: self._run(board.copy(), count, self.virtual_loss),
+                    chunks,
+                ))
+        else:
+            self._run(board, num_simulations)
+        
+        # Most visited move; equal visit counts go to the higher total value
+        best_move, _ = max(
+            self.root.children.items(),
+            key=lambda edge: (edge[1].visits, edge[1].value),
+        )
+        return best_move.uci()
+
+    def advance(self, move: str, fen: str) -> None:
+        """Re-root the tree after ``move`` was played, reaching ``fen``."""
+        child = self.root.children.get(chess.Move.from_uci(move)) if self.root else None
+        if child is not None:
+            self.root = child
+            self.root_fen = fen
+        else:
+            self.root = None
+            self.root_fen = None
+
+    def _run(self, board: chess.Board, num_simulations: int, virtual_loss: int = 0) -> None:
+        """Run ``num_simulations`` passes on ``board``, restoring it after each."""
+        for _ in range(num_simulations):
+            depth = self._simulate(board, virtual_loss)
+            for _ in range(depth):
+                board.pop()
+
+    def _run_pipelined(self, board: chess.Board, num_simulations: int) -> None:
+        """Run ``num_simulations`` passes with evaluation and backpropagation
+        on their own threads, fed through queues."""
+        # Bounded so selection runs at most a few leaves ahead of evaluation
+        eval_queue: queue.Queue = queue.Queue(maxsize=2 * self.pipeline_workers)
+        backprop_queue: queue.Queue = queue.Queue()
+        
+        def evaluate() -> None:
+            while (item := eval_queue.get()) is not None:
+                path, fen = item
+                backprop_queue.put((path, -self.evaluator(fen)))
+        
+        def backpropagate() -> None:
+            for _ in range(num_simulations):
+                path, value = backprop_queue.get()
+                self._backpropagate(path, value, virtual_loss=self.virtual_loss)
+        
+        workers = [threading.Thread(target=evaluate) for _ in range(self.pipeline_workers)]
+        workers.append(threading.Thread(target=backpropagate))
+        for worker in workers:
+            worker.start()
+        
+        # Selection and expansion walk the scratch board, so they stay on this thread
+        for _ in range(num_simulations):
+            path, reward = self._select(board, self.virtual_loss)
+            if reward is None:
+                eval_queue.put((path, board.fen()))
+            else:
+                backprop_queue.put((path, reward))
+            for _ in range(len(path) - 1):
+                board.pop()
+        
+        for _ in range(self.pipeline_workers):
+            eval_queue.put(None)
+        for worker in workers:
+            worker.join()
+
+    def _simulate(self, board: chess.Board, virtual_loss: int = 0) -> int:
+        """Run a single select/expand/playout/backpropagate pass.
+
+        Returns:
+            Number of moves pushed onto ``board`` (for the caller to pop)
+        """
+        path, reward = self._select(board, virtual_loss)
+        
+        # Playout (value from the perspective of the player who moved into the leaf)
+        if reward is not None:
+            value, weight = reward, 1
+        elif self.leaf_playouts > 1:
+            value, weight = -self._leaf_playouts(board), self.leaf_playouts
+        else:
+            value, weight = -random_playout(board, rng=self._rng()), 1
+        self._backpropagate(path, value, weight=weight, virtual_loss=virtual_loss)
+        return len(path) - 1
+
+    def _select(
+        self, board: chess.Board, virtual_loss: int = 0
+    ) -> Tuple[List[Node], Optional[float]]:
+        """Select down the tree with UCB1 and expand one untried move.
+
+        Every node entered is charged ``virtual_loss`` (extra visit, lower
+        value) until backpropagation, steering concurrent threads apart.
+
+        Returns:
+            The path from the root (``board`` is left at its last node) and
+            the leaf's value if already known, or None if it needs evaluating
+        """
+        rng = self._rng()
+        node = self.root
+        with node.lock:
+            node.visits += virtual_loss
+            node.value -= virtual_loss
+        path = [node]
+        on_path = {id(node)}
+        reward = None
+        
+        while reward is None:
+            with node.lock:
+                if node.untried_moves:
+                    move = node.untried_moves.pop(rng.randrange(len(node.untried_moves)))
+                    child = None
+                elif node.children:
+                    # Selection
+                    move, child = node.select_child(self.exploration)
+                    if id(child) in on_path:
+                        # Transposition back onto our own path: a repetition
+                        reward = 0.0
+                        break
+                    child.visits += virtual_loss
+                    child.value -= virtual_loss
+                else:
+                    break
+            
+            if child is None:
+                reward = self._expand(board, node, move, path, on_path, virtual_loss)
+                break
+            
+            board.push(move)
+            reward = terminal_reward(board)
+            path.append(child)
+            on_path.add(id(child))
+            node = child
+        
+        return path, reward
+
+    def _expand(
+        self,
+        board: chess.Board,
+        node: Node,
+        move: chess.Move,
+        path: List[Node],
+        on_path: set,
+        virtual_loss: int,
+    ) -> Optional[float]:
+        """Push ``move`` and attach its node, linking transpositions.
+
+        Returns:
+            A known value for the new leaf (terminal reward or the linked
+            node's average), or None if it still needs a playout
+        """
+        board.push(move)
+        reward = terminal_reward(board)
+        key = chess.polyglot.zobrist_hash(board)
+        
+        child = self.table.get(key)
+        if child is not None and id(child) not in on_path:
+            with child.lock:
+                if reward is None and child.visits > 0:
+                    reward = child.value / child.visits
+                child.visits += virtual_loss
+                child.value -= virtual_loss
+        else:
+            child = self._new_node(key, [] if reward is not None else list(board.legal_moves))
+            if reward is None and child.visits > 0:
+                reward = child.value / child.visits
+            child.visits += virtual_loss
+            child.value -= virtual_loss
+            # A repetition of a position on our own path stays out of the table
+            self.table.setdefault(key, child)
+        
+        with node.lock:
+            node.children[move] = child
+        path.append(child)
+        on_path.add(id(child))
+        return reward
+
+    def _new_node(self, key: int, untried_moves: List[chess.Move]) -> Node:
+        """Create a node, seeding its statistics from the eval cache."""
+        node = Node(key=key, untried_moves=untried_moves)
+        cached = self.eval_cache.get(key) if self.eval_cache is not None else None
+        if cached is not None:
+            node.visits, node.value = cached
+        return node
+
+    def _leaf_playouts(self, board: chess.Board) -> float:
+        """Average of ``leaf_playouts`` playouts from the board's position."""
+        if self.executor is None:
+            rng = self._rng()
+            rewards = [random_playout(board, rng=rng) for _ in range(self.leaf_playouts)]
+        else:
+            fen = board.fen()
+            seeds = [random.randrange(2**32) for _ in range(self.leaf_playouts)]
+            rewards = list(self.executor.map(playout_from_fen, [fen] * len(seeds), seeds))
+        return sum(rewards) / len(rewards)
+
+    def _rng(self) -> random.Random:
+        """This thread's generator, seeded from the global one on first use."""
+        rng = getattr(self._local, "rng", None)
+        if rng is None:
+            rng = self._local.rng = random.Random(random.randrange(2**32))
+        return rng
+
+    def _backpropagate(
+        self, path: List[Node], value: float, weight: int = 1, virtual_loss: int = 0
+    ) -> None:
+        """Add ``weight`` visits worth ``value`` each, flipping sign per ply.
+
+        Also reverts the virtual loss applied during selection and records
+        the updated statistics in the eval cache.
+        """
+        for visited in reversed(path):
+            with visited.lock:
+                visited.visits += weight - virtual_loss
+                visited.value += value * weight + virtual_loss
+                stats = (visited.visits, visited.value)
+            if self.eval_cache is not None:
+                self.eval_cache.put(visited.key, *stats)
+            value = -value
+
+
+class MCTSPlayer:
+    """Plays a whole game with one search, keeping work between moves.
+
+    Besides re-rooting the tree after each move, the player owns an
+    LRU eval cache keyed by Zobrist hash. It survives when the tree does not
+    (e.g. the opponent plays a move that was never expanded), so later
+    searches start from previously discovered values.
+    """
+
+    def __init__(self, num_simulations: int = 200, cache_size: int = 100_000, **search_options):
+        """Initialize player.
 
+        Args:
+            num_simulations: Simulation budget per move
+            cache_size: Maximum number of positions in the eval cache
+            **search_options: Extra UCTSearch arguments
+        """
+        self.num_simulations = num_simulations
+        self.eval_cache = EvalCache(max_size=cache_size)
+        self.search = UCTSearch(eval_cache=self.eval_cache, **search_options)
 
-def simple_mcts_move(env: ChessOpenEnv, num_simulations: int = 10) -> str:
+    def choose_move(self, env: ChessOpenEnv) -> Optional[str]:
+        """Search the env's position and return the chosen move in UCI."""
+        return self.search.search(env, num_simulations=self.num_simulations)
+
+    def observe(self, move: str, fen: str) -> None:
+        """Record a move played by either side."""
+        self.search.advance(move, fen)
+
+
+def run_mcts(fen: str, num_simulations: int, seed: int) -> Dict[str, Tuple[int, float]]:
+    """Run an independent UCT search in a worker process.
+
+    Returns:
+        Root statistics as {move: (visits, total_value)}
     """
-    Ultra-simple MCTS: Try each legal move N times, pick best average.
+    random.seed(seed)
+    env = ChessOpenEnv()
+    env.reset(fen=fen)
     
-    This is NOT full MCTS but proves the concept works.
+    search = UCTSearch()
+    search.search(env, num_simulations=num_simulations)
+    if search.root is None:
+        return {}
+    return {
+        move.uci(): (child.visits, child.value)
+        for move, child in search.root.children.items()
+    }
+
+
+def parallel_mcts_move(env: ChessOpenEnv, num_simulations: int, workers: int) -> Optional[str]:
+    """Root parallelization: ``workers`` independent trees, aggregated at the root.
+
+    The simulation budget is split evenly between processes; each worker
+    searches its own tree with a different seed and only the root-child
+    statistics are sent back and summed.
     """
-    legal_moves = env.get_legal_moves()
-    if not legal_moves:
+    if not env.get_legal_moves():
         return None
     
-    move_scores = {}
+    fen = env.state()["fen"]
+    per_worker = max(1, num_simulations // workers)
+    base_seed = random.randrange(2**32)
     
-    for move in legal_moves:
-        # Try this move multiple times
-        total_reward = 0
-        for _ in range(num_simulations):
-            # Clone environment
-            test_env = ChessOpenEnv()
-            test_env.reset(fen=env.state()["fen"])
-            
-            # Apply move
-            obs, reward, done, truncated, info = test_env.step(move)
-            
-            # Random playout
-            if not done:
-                reward = -random_playout(test_env)  # Flip for opponent
-            
-            total_reward += reward
-        
-        move_scores[move] = total_reward / num_simulations
+    with multiprocessing.Pool(workers) as pool:
+        results = pool.starmap(
+            run_mcts,
+            [(fen, per_worker, base_seed + i) for i in range(workers)],
+        )
+    
+    visits: Dict[str, int] = defaultdict(int)
+    values: Dict[str, float] = defaultdict(float)
+    for root_stats in results:
+        for move, (move_visits, move_value) in root_stats.items():
+            visits[move] += move_visits
+            values[move] += move_value
+    
+    return max(visits, key=lambda move: (visits[move], values[move]))
+
+
+def simple_mcts_move(
+    env: ChessOpenEnv,
+    num_simulations: int = 100,
+    search: Optional[UCTSearch] = None,
+    workers: int = 1,
+) -> Optional[str]:
+    """
+    UCT move selection with a total budget of ``num_simulations``.
+    
+    Pass a persistent ``search`` to reuse its tree across consecutive moves.
+    With ``workers > 1`` the budget is spread over independent trees in
+    separate processes (root parallelization); ``search`` is then unused.
+    """
+    if workers > 1:
+        return parallel_mcts_move(env, num_simulations=num_simulations, workers=workers)
     
-    # Return best move
-    best_move = max(move_scores.items(), key=lambda x: x[1])
-    return best_move[0]
+    search = search or UCTSearch()
+    return search.search(env, num_simulations=num_simulations)
 
 
-def play_game(mcts_simulations: int = 10):
+def play_game(mcts_simulations: int = 200):
     """Play one game: MCTS vs Random."""
     env = ChessOpenEnv()
     obs, info = env.reset()
+    player = MCTSPlayer(num_simulations=mcts_simulations)
     
     move_count = 0
     max_moves = 100
@@ -90,7 +659,7 @@ def play_game(mcts_simulations: int = 10):
         if current_player == "white":
             # MCTS plays white
             start_time = time.time()
-            move = simple_mcts_move(env, num_simulations=mcts_simulations)
+            move = player.choose_move(env)
             elapsed = time.time() - start_time
             
             if move is None:
@@ -108,6 +677,7 @@ def play_game(mcts_simulations: int = 10):
             print(f"Move {move_count+1}. Black (Random): {move}")
         
         obs, reward, done, truncated, info = env.step(move)
+        player.observe(move, obs["board_state"]["fen"])
         move_count += 1
         
         if done:
@@ -135,7 +705,7 @@ def main():
     try:
         env = ChessOpenEnv()
         env.reset()
-        reward = random_playout(env, max_moves=20)
+        reward = random_playout(env.chess.board, max_moves=20)
         print(f"✅ Basic playout works! Final reward: {reward}")
     except Exception as e:
         print(f"❌ Failed: {e}")
@@ -146,8 +716,34 @@ def main():
     try:
         env = ChessOpenEnv()
         env.reset()
-        move = simple_mcts_move(env, num_simulations=5)
+        move = simple_mcts_move(env, num_simulations=100)
         print(f"✅ Move selection works! Chose: {move}")
+        
+        workers = os.cpu_count() or 1
+        if workers > 1:
+            start_time = time.time()
+            move = simple_mcts_move(env, num_simulations=100 * workers, workers=workers)
+            elapsed = time.time() - start_time
+            print(f"✅ Root-parallel selection ({workers} workers) chose: {move} ({elapsed:.2f}s)")
+            
+            start_time = time.time()
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                search = UCTSearch(leaf_playouts=workers, executor=pool)
+                move = simple_mcts_move(env, num_simulations=100, search=search)
+            elapsed = time.time() - start_time
+            print(f"✅ Leaf-parallel selection ({workers} playouts/leaf) chose: {move} ({elapsed:.2f}s)")
+            
+            start_time = time.time()
+            search = UCTSearch(threads=workers)
+            move = simple_mcts_move(env, num_simulations=100, search=search)
+            elapsed = time.time() - start_time
+            print(f"✅ Tree-parallel selection ({workers} threads) chose: {move} ({elapsed:.2f}s)")
+            
+            start_time = time.time()
+            search = UCTSearch(pipeline_workers=workers)
+            move = simple_mcts_move(env, num_simulations=100, search=search)
+            elapsed = time.time() - start_time
+            print(f"✅ Pipelined selection ({workers} evaluators) chose: {move} ({elapsed:.2f}s)")
     except Exception as e:
         print(f"❌ Failed: {e}")
         return
@@ -155,7 +751,7 @@ def main():
     # Test 3: Full game
     print("\nTest 3: Playing full game...")
     try:
-        result = play_game(mcts_simulations=10)
+        result = play_game(mcts_simulations=200)
         print(f"✅ Full game works! Result: {result}")
     except Exception as e:
         print(f"❌ Failed: {e}")
@@ -168,10 +764,9 @@ def main():
     print("="*60)
     print("✅ The basic MCTS approach WORKS with your environment!")
     print("\nNext steps if you want to continue:")
-    print("1. Increase simulations (10 → 100) for stronger play")
-    print("2. Add proper UCB tree search instead of flat evaluation")
-    print("3. Add position evaluation heuristics")
-    print("4. Parallelize simulations for speed")
+    print("1. Increase simulations (200 → 2000) for stronger play")
+    print("2. Add position evaluation heuristics")
+    print("3. Parallelize simulations for speed")
     print("\nBut honestly? You already have Stockfish.")
     print("The real question: What do you actually want to build?")
 
@@ -3,17 +3,134 @@
 Manages agent creation, move generation with retry logic, and fallback behavior.
 """
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
+import asyncio
 import structlog
 import random
+import re
 import time
 from dataclasses import dataclass
+from functools import lru_cache
 
 from smolagents import CodeAgent, InferenceClientModel
 from src.models.board_state import BoardState
 
 logger = structlog.get_logger()
 
+# A UCI move is at most 5 characters; a few extra tokens allow for whitespace
+MOVE_MAX_TOKENS = 8
+
+# Patterns used by ChessAgentManager._extract_move, compiled once at import.
+# Matching is case-insensitive so agent output never has to be lowercased.
+_CODE_TAG_RE = re.compile(r'</?code>', re.IGNORECASE)
+_CODE_FENCE_RE = re.compile(r'```\w*\n?')
+_THOUGHTS_RE = re.compile(r'thoughts:.*?(?=\n|$)', re.IGNORECASE)
+_MOVE_RE = re.compile(r'\b([a-h][1-8][a-h][1-8][qrbn]?)\b', re.IGNORECASE)
+
+
+@lru_cache(maxsize=128)
+def _legal_move_pattern(legal_moves: frozenset) -> "re.Pattern[str]":
+    """Compile one alternation matching any of the given moves as a standalone word."""
+    # Longest first so a promotion like e7e8q is tried before its e7e8 prefix
+    alternatives = sorted((re.escape(move.lower()) for move in legal_moves), key=len, reverse=True)
+    return re.compile(r'\b(' + '|'.join(alternatives) + r')\b', re.IGNORECASE)
+
+# Strategy bullet points for each game phase
+_PHASE_GUIDANCE = {
+    "opening": """- Prioritize development over material gains unless clearly winning
+- Fight for the center with pawns (e4, d4 or e5, d5)
+- Castle early (within 10 moves) to ensure king safety
+- Develop knights before bishops (knights to f3/c3 or f6/c6)
+- Avoid moving same piece twice unless necessary
+- Don't bring queen out too early - she can be attacked
+""",
+    "middlegame": """- Look for tactical opportunities (forks, pins, skewers)
+- Create threats and attacks on opponent's weaknesses
+- Improve worst-placed piece or reposition for better coordination
+- Control open files with rooks, place them on 7th rank if possible
+- Target weak pawns and squares in opponent's camp
+- Calculate forcing moves (checks, captures, threats) carefully
+""",
+    "endgame": """- Activate your king - he becomes a strong piece in endgame
+- Create passed pawns and push them toward promotion
+- Cut off opponent's king from stopping your pawns
+- Rook behind passed pawns (yours or opponent's)
+- Simplify when ahead in material, complicate when behind
+- Know basic checkmate patterns (K+Q vs K, K+R vs K)
+""",
+}
+
+# Few-shot examples by position type, plus a per-personality closing line
+_FEW_SHOT_EXAMPLES = {
+    "tactical": """
+**Example 1 - Knight Fork:**
+Position: White knight on e5, Black king on e7, Black rook on c7
+Legal moves include: e5c6, e5d7, e5f7, ...
+Best move: e5d7 (knight fork - attacks both king and rook, wins the rook after king moves)
+
+**Example 2 - Discovered Attack:**
+Position: White bishop on b2 pinning Black queen on e5 to king on h8, White knight on d4
+Legal moves include: d4f5, d4e6, d4c6, ...
+Best move: d4f5 (knight moves with check, and bishop still attacks pinned queen - wins queen)
+
+**Example 3 - Back Rank Mate Threat:**
+Position: White rook on d1, Black king on g8 trapped by own pawns on f7, g7, h7
+Legal moves include: d1d8, d1d7, a2a3, ...
+Best move: d1d8 (rook to 8th rank delivers checkmate - king has no escape)
+""",
+    "development": """
+**Example 1 - Central Pawn Development:**
+Position: Opening, White to move, e2 pawn can advance
+Legal moves include: e2e4, e2e3, d2d4, g1f3, ...
+Best move: e2e4 (controls center squares d5 and f5, opens diagonals for bishop and queen)
+
+**Example 2 - Knight Development:**
+Position: Early opening, center pawns placed, knights still on starting squares
+Legal moves include: g1f3, g1h3, b1c3, b1a3, ...
+Best move: g1f3 (develops knight to natural square, controls center, prepares castling)
+
+**Example 3 - Castling for King Safety:**
+Position: Middlegame, king still on e1, pieces developed, path clear to castle
+Legal moves include: e1g1, f1e2, h1g1, d2d4, ...
+Best move: e1g1 (castles kingside - improves king safety and connects rooks)
+""",
+    "positional": """
+**Example 1 - Rook to Open File:**
+Position: Open d-file, White rook on a1, no pieces blocking d-file
+Legal moves include: a1d1, a1b1, a1c1, f3d4, ...
+Best move: a1d1 (places rook on open file, controls key central file, pressures d7 pawn)
+
+**Example 2 - Improving Worst Piece:**
+Position: White knight passively placed on a3, excellent outpost on e5 available
+Legal moves include: a3b5, a3c4, a3c2, a3b1, ...
+Best move: a3c4 (improves knight toward center, prepares to reach e5 outpost next move)
+
+**Example 3 - Creating Passed Pawn:**
+Position: White pawns on a4 and b5, Black pawn on a5, move b5b6 available
+Legal moves include: b5b6, b5a6, a4b5, f3e5, ...
+Best move: b5b6 (creates dangerous passed pawn, forces opponent to deal with promotion threat)
+""",
+}
+
+_FEW_SHOT_EMPHASIS = {
+    "aggressive": "\n*Prioritize forcing moves, attacks, and initiative-seizing moves like these examples.*",
+    "defensive": "\n*Learn from these examples but ensure king safety and piece security first.*",
+    "tactical": "\n*These tactical patterns are your bread and butter - spot them relentlessly.*",
+}
+
+
+def _build_fewshot_table() -> Dict[tuple, str]:
+    """Precompute few-shot example text for every (position_type, personality) pair."""
+    personalities = ("aggressive", "defensive", "tactical", "balanced", "positional")
+    return {
+        (position_type, personality): examples + _FEW_SHOT_EMPHASIS.get(personality, "")
+        for position_type, examples in _FEW_SHOT_EXAMPLES.items()
+        for personality in personalities
+    }
+
+
+_FEW_SHOT = _build_fewshot_table()
+
 
 @dataclass
 class AgentConfig:
@@ -55,6 +172,7 @@ class ChessAgentManager:
     def __init__(self):
         """Initialize the agent manager."""
         self.agents: Dict[str, CodeAgent] = {}
+        self.models: Dict[str, InferenceClientModel] = {}
         self.configs: Dict[str, AgentConfig] = {}
         logger.info("agent_manager_initialized")
     
@@ -105,7 +223,8 @@ class ChessAgentManager:
                 system_prompt_preview=system_prompt[:100] + "...",
             )
             
-            # Create agent with chess and chess.engine imports
+            # Move generation calls the model directly (see _complete); the
+            # CodeAgent is kept for callers that want the full agent loop
             agent = CodeAgent(
                 tools=[],
                 model=model,
@@ -113,6 +232,7 @@ class ChessAgentManager:
             )
             
             self.agents[agent_id] = agent
+            self.models[agent_id] = model
             
             logger.info(
                 "agent_created",
@@ -127,6 +247,25 @@ class ChessAgentManager:
             logger.error("agent_creation_failed", agent_id=agent_id, error=str(e))
             raise
     
+    def get_or_create_agent(self, agent_id: str, personality: str = "balanced") -> CodeAgent:
+        """Get an existing agent, creating it if missing.
+        
+        The agent (and its model client) is rebuilt only when it doesn't exist
+        yet or was created with a different personality.
+        
+        Args:
+            agent_id: Unique identifier for the agent
+            personality: Personality the agent should play with
+        
+        Returns:
+            The agent for agent_id
+        """
+        config = self.configs.get(agent_id)
+        if config is not None and config.personality == personality:
+            return self.agents[agent_id]
+        
+        return self.create_agent(agent_id, personality=personality)
+    
     def get_agent_move(
         self,
         agent_id: str,
@@ -167,8 +306,8 @@ class ChessAgentManager:
             try:
                 start_time = time.time()
                 
-                # Run agent
-                result = agent.run(prompt)
+                # Single chat completion for the move
+                result = self._complete(agent_id, prompt)
                 
                 elapsed = time.time() - start_time
                 
@@ -208,6 +347,37 @@ class ChessAgentManager:
         )
         raise ValueError(f"Agent {agent_id} failed to generate valid move after {config.max_retries} attempts")
     
+    async def get_agent_moves_batch(
+        self,
+        requests: List[Tuple[str, BoardState, List[str]]],
+    ) -> List[str]:
+        """Get moves for several positions concurrently.
+        
+        Each request runs get_agent_move (with its retry logic) in a worker
+        thread so the inference round-trips overlap instead of running back to
+        back. Move generation is a stateless chat completion, so requests for
+        the same agent can run concurrently too.
+        
+        Args:
+            requests: List of (agent_id, board_state, legal_moves) tuples
+            
+        Returns:
+            Moves in UCI notation, in the same order as requests
+        """
+        start_time = time.time()
+        moves = await asyncio.gather(*(
+            asyncio.to_thread(self.get_agent_move, agent_id, board_state, legal_moves)
+            for agent_id, board_state, legal_moves in requests
+        ))
+        
+        logger.info(
+            "agent_moves_batch_complete",
+            batch_size=len(requests),
+            elapsed=time.time() - start_time,
+        )
+        
+        return list(moves)
+    
     def get_agent_move_with_candidates(
         self,
         agent_id: str,
@@ -249,7 +419,7 @@ class ChessAgentManager:
         # Try with retries
         for attempt in range(config.max_retries):
             try:
-                result = agent.run(prompt)
+                result = self._complete(agent_id, prompt)
                 move = self._extract_move(result, candidates)
                 
                 if move and move in candidates:
@@ -285,6 +455,28 @@ class ChessAgentManager:
         )
         return fallback_move
     
+    def _complete(self, agent_id: str, prompt: str) -> str:
+        """Ask the agent's model for a move with a single chat completion.
+        
+        Picking a UCI string from a list does not need the CodeAgent's
+        plan/execute loop, so the prompt goes straight to the model and the
+        reply is capped at a few tokens.
+        
+        Args:
+            agent_id: Agent identifier
+            prompt: Complete move prompt
+            
+        Returns:
+            Raw model reply, to be parsed with _extract_move
+        """
+        config = self.configs[agent_id]
+        message = self.models[agent_id].generate(
+            [{"role": "user", "content": [{"type": "text", "text": prompt}]}],
+            max_tokens=MOVE_MAX_TOKENS,
+            temperature=config.temperature,
+        )
+        return message.content or ""
+    
     def _build_candidate_constrained_prompt(
         self,
         board_state: BoardState,
@@ -342,8 +534,6 @@ You are: {board_state.current_player.upper()}
         personality: str,
     ) -> str:
         """Build comprehensive prompt for agent move generation with chess principles and examples."""
-        system_prompt = self.SYSTEM_PROMPTS.get(personality, self.SYSTEM_PROMPTS["balanced"])
-        
         # Determine game phase for phase-specific guidance
         move_count = len(game_history) if game_history else 0
         game_phase = self._determine_game_phase(move_count, board_state.fen)
@@ -351,60 +541,9 @@ You are: {board_state.current_player.upper()}
         # Detect position type for conditional few-shot examples
         position_type = self._analyze_position_type(board_state, legal_moves)
         
-        prompt = f"""{system_prompt}
-
-=== CHESS EVALUATION FRAMEWORK ===
-
-**Fundamental Principles:**
-1. **Material**: Value pieces appropriately (Pawn=1, Knight/Bishop=3, Rook=5, Queen=9). Avoid unnecessary losses.
-2. **Center Control**: Dominate central squares (e4, e5, d4, d5) with pawns and pieces. The center is the key battleground.
-3. **Development**: Activate pieces early - knights before bishops, castle within first 10 moves, connect rooks.
-4. **King Safety**: Castle early, maintain pawn shield, avoid weaknesses around king. Never expose your king unnecessarily.
-5. **Pawn Structure**: Avoid doubled/isolated pawns, create passed pawns, control key squares with pawn chains.
-6. **Piece Activity**: Place pieces on active squares - knights on outposts, bishops on open diagonals, rooks on open files.
-
-**Tactical Patterns to Recognize:**
-- **Forks**: One piece attacks two or more enemy pieces simultaneously (especially knight forks)
-- **Pins**: Piece cannot move without exposing higher-value piece behind it (absolute pin if king is behind)
-- **Skewers**: Reverse pin - valuable piece forced to move, exposing lesser piece behind
-- **Discovered Attacks**: Moving one piece reveals attack from another piece behind it
-- **Double Attacks**: Simultaneously threatening two targets with different pieces
-- **Removal of Defender**: Eliminate or deflect piece protecting key square/piece
-- **Overloading**: Force opponent's piece to defend too many things at once
-- **Back Rank Threats**: Exploit weak back rank with rook/queen invasions
-
-**Phase-Specific Strategy ({game_phase.upper()}):**
-"""
-        
-        # Add phase-specific guidance
-        if game_phase == "opening":
-            prompt += """- Prioritize development over material gains unless clearly winning
-- Fight for the center with pawns (e4, d4 or e5, d5)
-- Castle early (within 10 moves) to ensure king safety
-- Develop knights before bishops (knights to f3/c3 or f6/c6)
-- Avoid moving same piece twice unless necessary
-- Don't bring queen out too early - she can be attacked
-"""
-        elif game_phase == "middlegame":
-            prompt += """- Look for tactical opportunities (forks, pins, skewers)
-- Create threats and attacks on opponent's weaknesses
-- Improve worst-placed piece or reposition for better coordination
-- Control open files with rooks, place them on 7th rank if possible
-- Target weak pawns and squares in opponent's camp
-- Calculate forcing moves (checks, captures, threats) carefully
-"""
-        else:  # endgame
-            prompt += """- Activate your king - he becomes a strong piece in endgame
-- Create passed pawns and push them toward promotion
-- Cut off opponent's king from stopping your pawns
-- Rook behind passed pawns (yours or opponent's)
-- Simplify when ahead in material, complicate when behind
-- Know basic checkmate patterns (K+Q vs K, K+R vs K)
-"""
-        
-        # Add few-shot examples based on position type
-        prompt += "\n**EXAMPLES OF STRONG MOVE SELECTION:**\n"
-        prompt += self._get_few_shot_examples(position_type, personality)
+        # Invariant preamble first so every move's prompt shares it as a prefix;
+        # only the position-specific tail below changes from move to move
+        prompt = self._prompt_preamble(personality, game_phase, position_type)
         
         # Add current position information
         prompt += f"""
@@ -426,6 +565,49 @@ Game phase: {game_phase.upper()}
         prompt += f"""
 Legal moves available: {', '.join(legal_moves)}
 
+Choose the BEST move from the legal moves list that aligns with your {personality} style.
+Respond with ONLY the move in UCI notation (e.g., 'e2e4' or 'e7e8q' for promotion).
+Do not include any explanation, reasoning, or additional text.
+
+Your move:"""
+        
+        return prompt
+    
+    @classmethod
+    @lru_cache(maxsize=16)
+    def _prompt_head(cls, personality: str) -> str:
+        """Build the part of the move prompt that is fixed for a personality.
+        
+        Args:
+            personality: Agent personality
+            
+        Returns:
+            System prompt, evaluation framework and analysis checklist
+        """
+        system_prompt = cls.SYSTEM_PROMPTS.get(personality, cls.SYSTEM_PROMPTS["balanced"])
+        
+        return f"""{system_prompt}
+
+=== CHESS EVALUATION FRAMEWORK ===
+
+**Fundamental Principles:**
+1. **Material**: Value pieces appropriately (Pawn=1, Knight/Bishop=3, Rook=5, Queen=9). Avoid unnecessary losses.
+2. **Center Control**: Dominate central squares (e4, e5, d4, d5) with pawns and pieces. The center is the key battleground.
+3. **Development**: Activate pieces early - knights before bishops, castle within first 10 moves, connect rooks.
+4. **King Safety**: Castle early, maintain pawn shield, avoid weaknesses around king. Never expose your king unnecessarily.
+5. **Pawn Structure**: Avoid doubled/isolated pawns, create passed pawns, control key squares with pawn chains.
+6. **Piece Activity**: Place pieces on active squares - knights on outposts, bishops on open diagonals, rooks on open files.
+
+**Tactical Patterns to Recognize:**
+- **Forks**: One piece attacks two or more enemy pieces simultaneously (especially knight forks)
+- **Pins**: Piece cannot move without exposing higher-value piece behind it (absolute pin if king is behind)
+- **Skewers**: Reverse pin - valuable piece forced to move, exposing lesser piece behind
+- **Discovered Attacks**: Moving one piece reveals attack from another piece behind it
+- **Double Attacks**: Simultaneously threatening two targets with different pieces
+- **Removal of Defender**: Eliminate or deflect piece protecting key square/piece
+- **Overloading**: Force opponent's piece to defend too many things at once
+- **Back Rank Threats**: Exploit weak back rank with rook/queen invasions
+
 === YOUR TASK ===
 Analyze the position using the framework above. Consider:
 1. Are there immediate tactical opportunities (checks, captures, threats)?
@@ -434,11 +616,36 @@ Analyze the position using the framework above. Consider:
 4. Is your king safe? Should you castle or improve king safety?
 5. What is your opponent's biggest threat? Should you defend or counterattack?
 
-Choose the BEST move from the legal moves list that aligns with your {personality} style.
-Respond with ONLY the move in UCI notation (e.g., 'e2e4' or 'e7e8q' for promotion).
-Do not include any explanation, reasoning, or additional text.
-
-Your move:"""
+"""
+    
+    @classmethod
+    @lru_cache(maxsize=64)
+    def _prompt_preamble(cls, personality: str, game_phase: str, position_type: str) -> str:
+        """Build the static part of the move prompt.
+        
+        Everything up to the current position depends only on personality, game
+        phase and position type, so it is built once per combination and cached.
+        Sections are ordered from most to least stable (personality, then phase,
+        then position type) so consecutive prompts share the longest possible
+        prefix for server-side prompt caching.
+        
+        Args:
+            personality: Agent personality
+            game_phase: Phase from _determine_game_phase
+            position_type: Type from _analyze_position_type
+            
+        Returns:
+            Prompt preamble (system prompt, framework, phase guidance, examples)
+        """
+        prompt = cls._prompt_head(personality)
+        
+        # Add phase-specific guidance
+        prompt += f"**Phase-Specific Strategy ({game_phase.upper()}):**\n"
+        prompt += _PHASE_GUIDANCE.get(game_phase, _PHASE_GUIDANCE["endgame"])
+        
+        # Add few-shot examples based on position type
+        prompt += "\n**EXAMPLES OF STRONG MOVE SELECTION:**\n"
+        prompt += cls._get_few_shot_examples(position_type, personality)
         
         return prompt
     
@@ -447,12 +654,12 @@ Your move:"""
         if move_count < 20:
             return "opening"
         
-        # Count major pieces to detect endgame
-        piece_counts = fen.split()[0].replace('/', '')
-        queens = piece_counts.count('Q') + piece_counts.count('q')
-        rooks = piece_counts.count('R') + piece_counts.count('r')
-        minor_pieces = (piece_counts.count('N') + piece_counts.count('n') + 
-                       piece_counts.count('B') + piece_counts.count('b'))
+        # Count major pieces to detect endgame; folding case once lets each
+        # piece type be counted for both colours in a single scan
+        placement = fen.split(' ', 1)[0].lower()
+        queens = placement.count('q')
+        rooks = placement.count('r')
+        minor_pieces = placement.count('n') + placement.count('b')
         
         # Endgame if queens off and few pieces
         if queens == 0 and (rooks + minor_pieces) <= 4:
@@ -476,79 +683,21 @@ Your move:"""
             return "tactical"
         
         # Early game (positional development)
-        fen_parts = board_state.fen.split()
-        if fen_parts[0].count('.') + fen_parts[0].count('/') > 40:  # Many empty squares
+        placement = board_state.fen.split(' ', 1)[0]
+        if placement.count('.') + placement.count('/') > 40:  # Many empty squares
             return "development"
         
         # Default to positional
         return "positional"
     
-    def _get_few_shot_examples(self, position_type: str, personality: str) -> str:
+    @staticmethod
+    def _get_few_shot_examples(position_type: str, personality: str) -> str:
         """Return few-shot examples based on position type and personality."""
-        examples = ""
-        
-        if position_type == "tactical":
-            examples += """
-**Example 1 - Knight Fork:**
-Position: White knight on e5, Black king on e7, Black rook on c7
-Legal moves include: e5c6, e5d7, e5f7, ...
-Best move: e5d7 (knight fork - attacks both king and rook, wins the rook after king moves)
-
-**Example 2 - Discovered Attack:**
-Position: White bishop on b2 pinning Black queen on e5 to king on h8, White knight on d4
-Legal moves include: d4f5, d4e6, d4c6, ...
-Best move: d4f5 (knight moves with check, and bishop still attacks pinned queen - wins queen)
-
-**Example 3 - Back Rank Mate Threat:**
-Position: White rook on d1, Black king on g8 trapped by own pawns on f7, g7, h7
-Legal moves include: d1d8, d1d7, a2a3, ...
-Best move: d1d8 (rook to 8th rank delivers checkmate - king has no escape)
-"""
-        
-        elif position_type == "development":
-            examples += """
-**Example 1 - Central Pawn Development:**
-Position: Opening, White to move, e2 pawn can advance
-Legal moves include: e2e4, e2e3, d2d4, g1f3, ...
-Best move: e2e4 (controls center squares d5 and f5, opens diagonals for bishop and queen)
-
-**Example 2 - Knight Development:**
-Position: Early opening, center pawns placed, knights still on starting squares
-Legal moves include: g1f3, g1h3, b1c3, b1a3, ...
-Best move: g1f3 (develops knight to natural square, controls center, prepares castling)
-
-**Example 3 - Castling for King Safety:**
-Position: Middlegame, king still on e1, pieces developed, path clear to castle
-Legal moves include: e1g1, f1e2, h1g1, d2d4, ...
-Best move: e1g1 (castles kingside - improves king safety and connects rooks)
-"""
-        
-        else:  # positional
-            examples += """
-**Example 1 - Rook to Open File:**
-Position: Open d-file, White rook on a1, no pieces blocking d-file
-Legal moves include: a1d1, a1b1, a1c1, f3d4, ...
-Best move: a1d1 (places rook on open file, controls key central file, pressures d7 pawn)
-
-**Example 2 - Improving Worst Piece:**
-Position: White knight passively placed on a3, excellent outpost on e5 available
-Legal moves include: a3b5, a3c4, a3c2, a3b1, ...
-Best move: a3c4 (improves knight toward center, prepares to reach e5 outpost next move)
-
-**Example 3 - Creating Passed Pawn:**
-Position: White pawns on a4 and b5, Black pawn on a5, move b5b6 available
-Legal moves include: b5b6, b5a6, a4b5, f3e5, ...
-Best move: b5b6 (creates dangerous passed pawn, forces opponent to deal with promotion threat)
-"""
-        
-        # Add personality-specific emphasis
-        if personality == "aggressive":
-            examples += "\n*Prioritize forcing moves, attacks, and initiative-seizing moves like these examples.*"
-        elif personality == "defensive":
-            examples += "\n*Learn from these examples but ensure king safety and piece security first.*"
-        elif personality == "tactical":
-            examples += "\n*These tactical patterns are your bread and butter - spot them relentlessly.*"
-        
+        examples = _FEW_SHOT.get((position_type, personality))
+        if examples is None:
+            # Unknown position types use the positional set, unknown personalities add no emphasis
+            examples = (_FEW_SHOT_EXAMPLES.get(position_type, _FEW_SHOT_EXAMPLES["positional"])
+                        + _FEW_SHOT_EMPHASIS.get(personality, ""))
         return examples
     
     def _extract_move(self, result: Any, legal_moves: List[str]) -> Optional[str]:
@@ -561,32 +710,39 @@ Best move: b5b6 (creates dangerous passed pawn, forces opponent to deal with pro
         Returns:
             Valid move in UCI notation or None
         """
+        if not legal_moves:
+            return None
+        
+        # Lowercase -> canonical spelling, for O(1) validation of matches
+        legal_lower = {move.lower(): move for move in legal_moves}
+        
         # Convert result to string
-        result_str = str(result).strip().lower()
+        result_str = str(result).strip()
         
         # Clean up code blocks and XML-like tags
-        import re
         # Remove <code> tags and </code> tags
-        result_str = re.sub(r'</?code>', '', result_str)
+        result_str = _CODE_TAG_RE.sub('', result_str)
         # Remove markdown code blocks
-        result_str = re.sub(r'```\w*\n?', '', result_str)
+        result_str = _CODE_FENCE_RE.sub('', result_str)
         # Remove "thoughts:" prefix if present
-        result_str = re.sub(r'thoughts:.*?(?=\n|$)', '', result_str, flags=re.IGNORECASE)
-        
-        # Try to find a legal move in the result (exact match)
-        for move in legal_moves:
-            # Check if the move appears as a standalone word
-            if re.search(r'\b' + re.escape(move.lower()) + r'\b', result_str):
+        result_str = _THOUGHTS_RE.sub('', result_str)
+        
+        # Find every legal move that appears as a standalone word in one scan,
+        # then prefer them in legal-move order
+        pattern = _legal_move_pattern(frozenset(legal_lower))
+        found = {match.lower() for match in pattern.findall(result_str)}
+        for move_lower, move in legal_lower.items():
+            if move_lower in found:
                 return move
         
         # Try extracting just the move notation
         # Look for patterns like e2e4, e7e8q, etc.
-        move_pattern = r'\b([a-h][1-8][a-h][1-8][qrbn]?)\b'
-        matches = re.findall(move_pattern, result_str)
+        matches = _MOVE_RE.findall(result_str)
         
         for match in matches:
-            if match in legal_moves:
-                return match
+            move = legal_lower.get(match.lower())
+            if move is not None:
+                return move
         
         return None
     
@@ -601,6 +757,7 @@ Best move: b5b6 (creates dangerous passed pawn, forces opponent to deal with pro
         """
         if agent_id in self.agents:
             del self.agents[agent_id]
+            del self.models[agent_id]
             del self.configs[agent_id]
             logger.info("agent_removed", agent_id=agent_id)
             return True
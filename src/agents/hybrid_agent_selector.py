@@ -5,18 +5,82 @@ while preserving agent personality differentiation. Includes opening book integr
 for fast, grandmaster-level opening play.
 """
 
-from typing import Optional, List, Tuple
+from typing import Optional, Dict, List, Tuple
 import structlog
 import chess
 
 from src.utils.stockfish_evaluator import StockfishEvaluator
 from src.utils.opening_book_client import OpeningBookClient
 from src.utils.tablebase_client import TablebaseClient
-from src.agents.agent_manager import ChessAgentManager
+from src.agents.agent_manager import AgentConfig, ChessAgentManager
 from src.models.board_state import BoardState
 
 logger = structlog.get_logger()
 
+_FORCING_ALERT = "**CRITICAL: There are {forcing_count} forcing moves available!**\n"
+_DEFENSIVE_GUIDANCE = (
+    "- Prefer safe, solid moves that maintain piece security\n"
+    "- Choose prophylactic moves that prevent opponent threats\n"
+)
+_POSITIONAL_GUIDANCE = (
+    "- Prefer moves that improve long-term position\n"
+    "- Choose moves that enhance pawn structure and piece placement\n"
+)
+_BALANCED_GUIDANCE = (
+    "- Evaluate both tactical and positional factors\n"
+    "- Choose the move that offers the best practical chances\n"
+    "- Don't avoid exchanges - trading pieces is a normal part of chess\n"
+)
+
+# Personalities whose prompt lists forcing moves first, and those that also
+# get checks tagged (the rest only see captures tagged)
+_FORCING_FIRST_PERSONALITIES = frozenset({"aggressive", "tactical"})
+_CHECK_TAGGED_PERSONALITIES = _FORCING_FIRST_PERSONALITIES | {"defensive"}
+
+# Closing guidance per personality as (with forcing moves, without forcing moves).
+# The first entry is a format string taking {forcing_count}.
+_PERSONALITY_GUIDANCE: Dict[str, Tuple[str, str]] = {
+    "aggressive": (
+        _FORCING_ALERT
+        + "- You MUST choose one of the FORCING MOVES (captures/checks) unless it's clearly losing\n"
+        "- Quiet moves are BORING - only pick them if all forcing moves are terrible\n"
+        "- Actively look for ways to trade pieces and create imbalances\n",
+        "- Look for the most aggressive, initiative-seizing move\n"
+        "- Actively look for ways to trade pieces and create imbalances\n",
+    ),
+    "tactical": (
+        _FORCING_ALERT
+        + "- You MUST choose one of the FORCING MOVES (captures/checks) - this is what tactics means!\n"
+        "- Quiet moves avoid tactics - only pick them if all forcing moves fail tactically\n"
+        "- Look for piece exchanges that lead to tactical opportunities\n",
+        "- Look for the most forcing, concrete move available\n"
+        "- Look for piece exchanges that lead to tactical opportunities\n",
+    ),
+    "defensive": (_DEFENSIVE_GUIDANCE, _DEFENSIVE_GUIDANCE),
+    "positional": (_POSITIONAL_GUIDANCE, _POSITIONAL_GUIDANCE),
+    "balanced": (_BALANCED_GUIDANCE, _BALANCED_GUIDANCE),
+}
+
+# Per-candidate blocks of the hybrid prompt, filled from the move_info dicts
+_FMT_FORCING = (
+    "**Candidate {index}**: {move}{tag}\n"
+    "  - Evaluation: {score}\n"
+    "  - Continuation: {pv}\n"
+    "  - 🔥 THIS IS A FORCING MOVE - CREATE THREATS!\n\n"
+)
+_FMT_QUIET = (
+    "**Candidate {index}**: {move}\n"
+    "  - Evaluation: {score}\n"
+    "  - Continuation: {pv}\n\n"
+)
+_FMT_CANDIDATE = (
+    "**Candidate {index}**: {move}{tag}\n"
+    "  - Evaluation: {score}\n"
+    "  - Continuation: {pv}\n"
+    "{note}\n"
+)
+_SAFE_NOTE = "  - 🛡️ Safe and solid choice\n"
+
 
 class HybridAgentMoveSelector:
     """Hybrid move selector combining Stockfish evaluation with LLM personality."""
@@ -43,6 +107,10 @@ class HybridAgentMoveSelector:
         self.num_candidates = num_candidates
         self.opening_book = opening_book_client
         self.tablebase = tablebase_client
+        # Resolved once so post-opening moves skip the book with one comparison
+        self._opening_book_max_move = opening_book_client.max_move if opening_book_client else 0
+        # agent_id -> (config it was built from, (personality, system_prompt))
+        self._agent_meta_cache: Dict[str, Tuple[Optional[AgentConfig], Tuple[str, str]]] = {}
         
         logger.info(
             "hybrid_selector_initialized",
@@ -80,130 +148,203 @@ class HybridAgentMoveSelector:
             - "tablebase": Perfect move from Syzygy endgame tablebase
             - "hybrid": Stockfish candidates + LLM selection
             - "llm-fallback": Pure LLM when Stockfish unavailable
+            - "forced": The only legal move in the position
         """
+        # Nothing to choose between; skip the lookups and the LLM round-trip
+        legal_iter = iter(board.legal_moves)
+        only_move = next(legal_iter, None)
+        if only_move is not None and next(legal_iter, None) is None:
+            logger.debug("forced_move_selected", agent_id=agent_id, move=only_move.uci())
+            return only_move.uci(), "forced"
+        
         # Calculate move number (history length / 2 + 1 for white's move, + 0.5 for black's)
         move_number = len(game_history or []) + 1
         
-        # Try opening book first (if in opening phase)
-        if self.opening_book and self.opening_book.should_use_opening_book(move_number):
+        use_opening_book = move_number <= self._opening_book_max_move
+        
+        # Both lookup services are keyed by FEN; serialize the position once
+        fen = board.fen() if use_opening_book or self.tablebase else None
+        
+        # Opening book, then tablebase, then Stockfish candidates + LLM selection
+        result = None
+        if use_opening_book:
+            result = self._try_opening_book(agent_id, board, fen, move_number)
+        if result is None and self.tablebase:
+            result = self._try_tablebase(agent_id, board, fen, move_number)
+        if result is None:
+            result = self._try_hybrid(agent_id, board, board_state, game_history, game_id)
+        if result is not None:
+            return result
+        
+        return self._get_llm_fallback_move(agent_id, board, board_state, game_history), "llm-fallback"
+    
+    def _try_opening_book(
+        self,
+        agent_id: str,
+        board: chess.Board,
+        fen: str,
+        move_number: int,
+    ) -> Optional[Tuple[str, str]]:
+        """Pick a legal move from the opening book.
+        
+        Returns:
+            (move_uci, "opening_book"), or None if the book has no usable move
+        """
+        try:
+            opening_moves = self.opening_book.query_opening_book(fen)
+            
+            if not opening_moves:
+                logger.debug(
+                    "opening_book_no_moves",
+                    agent_id=agent_id,
+                    move_number=move_number,
+                )
+                return None
+            
+            # Get agent personality
+            personality, _ = self._get_agent_meta(agent_id)
+            is_white = board.turn == chess.WHITE
+            
+            move_uci = self.opening_book.select_opening_move(
+                opening_moves=opening_moves,
+                personality=personality,
+                is_white=is_white,
+            )
+            
+            if not move_uci:
+                return None
+            
+            # Validate move is legal
             try:
-                fen = board.fen()
-                opening_moves = self.opening_book.query_opening_book(fen)
-                
-                if opening_moves:
-                    # Get agent personality
-                    agent_config = self.agent_manager.configs.get(agent_id)
-                    personality = agent_config.personality if agent_config else "balanced"
-                    is_white = board.turn == chess.WHITE
-                    
-                    move_uci = self.opening_book.select_opening_move(
-                        opening_moves=opening_moves,
-                        personality=personality,
-                        is_white=is_white,
-                    )
-                    
-                    if move_uci:
-                        # Validate move is legal
-                        try:
-                            move = chess.Move.from_uci(move_uci)
-                            if move in board.legal_moves:
-                                logger.info(
-                                    "opening_book_move_selected",
-                                    agent_id=agent_id,
-                                    move=move_uci,
-                                    move_number=move_number,
-                                    personality=personality,
-                                )
-                                return move_uci, "opening_book"
-                            else:
-                                logger.warning(
-                                    "opening_book_illegal_move",
-                                    agent_id=agent_id,
-                                    move=move_uci,
-                                )
-                        except ValueError as e:
-                            logger.warning(
-                                "opening_book_invalid_uci",
-                                agent_id=agent_id,
-                                move=move_uci,
-                                error=str(e),
-                            )
-                else:
-                    logger.debug(
-                        "opening_book_no_moves",
-                        agent_id=agent_id,
-                        move_number=move_number,
-                    )
-                    
-            except Exception as e:
+                move = chess.Move.from_uci(move_uci)
+            except ValueError as e:
                 logger.warning(
-                    "opening_book_query_failed",
+                    "opening_book_invalid_uci",
                     agent_id=agent_id,
+                    move=move_uci,
                     error=str(e),
                 )
+                return None
+            
+            if not board.is_legal(move):
+                logger.warning(
+                    "opening_book_illegal_move",
+                    agent_id=agent_id,
+                    move=move_uci,
+                )
+                return None
+            
+            logger.info(
+                "opening_book_move_selected",
+                agent_id=agent_id,
+                move=move_uci,
+                move_number=move_number,
+                personality=personality,
+            )
+            return move_uci, "opening_book"
+            
+        except Exception as e:
+            logger.warning(
+                "opening_book_query_failed",
+                agent_id=agent_id,
+                error=str(e),
+            )
+            return None
+    
+    def _try_tablebase(
+        self,
+        agent_id: str,
+        board: chess.Board,
+        fen: str,
+        move_number: int,
+    ) -> Optional[Tuple[str, str]]:
+        """Pick the tablebase move for endgame positions (7 or fewer pieces).
+        
+        Losing positions return None so the hybrid agent can look for the
+        best practical try.
         
-        # Try tablebase for endgame positions (7 or fewer pieces)
-        if self.tablebase:
+        Returns:
+            (move_uci, "tablebase"), or None if the tablebase move is not used
+        """
+        try:
+            tablebase_result = self.tablebase.query_position(fen)
+            
+            if not tablebase_result:
+                return None
+            
+            move_uci = tablebase_result["uci"]
+            wdl = tablebase_result.get("wdl")
+            category = tablebase_result.get("category")
+            
+            # Validate move is legal
             try:
-                fen = board.fen()
-                tablebase_result = self.tablebase.query_position(fen)
-                
-                if tablebase_result:
-                    move_uci = tablebase_result["uci"]
-                    wdl = tablebase_result.get("wdl")
-                    category = tablebase_result.get("category")
-                    
-                    # Validate move is legal
-                    try:
-                        move = chess.Move.from_uci(move_uci)
-                        if move in board.legal_moves:
-                            # Use tablebase move if it's winning or drawing
-                            # For losing positions, fall through to hybrid agent for best practical try
-                            if self.tablebase.is_winning(wdl) or self.tablebase.is_drawing(wdl):
-                                logger.info(
-                                    "tablebase_move_selected",
-                                    agent_id=agent_id,
-                                    move=move_uci,
-                                    wdl=wdl,
-                                    category=category,
-                                    move_number=move_number,
-                                )
-                                return move_uci, "tablebase"
-                            else:
-                                logger.debug(
-                                    "tablebase_losing_fallback_to_hybrid",
-                                    agent_id=agent_id,
-                                    move=move_uci,
-                                    wdl=wdl,
-                                )
-                        else:
-                            logger.warning(
-                                "tablebase_illegal_move",
-                                agent_id=agent_id,
-                                move=move_uci,
-                            )
-                    except ValueError as e:
-                        logger.warning(
-                            "tablebase_invalid_uci",
-                            agent_id=agent_id,
-                            move=move_uci,
-                            error=str(e),
-                        )
-                        
-            except Exception as e:
+                move = chess.Move.from_uci(move_uci)
+            except ValueError as e:
                 logger.warning(
-                    "tablebase_query_failed",
+                    "tablebase_invalid_uci",
                     agent_id=agent_id,
+                    move=move_uci,
                     error=str(e),
                 )
+                return None
+            
+            if not board.is_legal(move):
+                logger.warning(
+                    "tablebase_illegal_move",
+                    agent_id=agent_id,
+                    move=move_uci,
+                )
+                return None
+            
+            # Use tablebase move if it's winning or drawing
+            if not (self.tablebase.is_winning(wdl) or self.tablebase.is_drawing(wdl)):
+                logger.debug(
+                    "tablebase_losing_fallback_to_hybrid",
+                    agent_id=agent_id,
+                    move=move_uci,
+                    wdl=wdl,
+                )
+                return None
+            
+            logger.info(
+                "tablebase_move_selected",
+                agent_id=agent_id,
+                move=move_uci,
+                wdl=wdl,
+                category=category,
+                move_number=move_number,
+            )
+            return move_uci, "tablebase"
+            
+        except Exception as e:
+            logger.warning(
+                "tablebase_query_failed",
+                agent_id=agent_id,
+                error=str(e),
+            )
+            return None
+    
+    def _try_hybrid(
+        self,
+        agent_id: str,
+        board: chess.Board,
+        board_state: BoardState,
+        game_history: Optional[List[str]],
+        game_id: Optional[str],
+    ) -> Optional[Tuple[str, str]]:
+        """Let the agent choose among Stockfish's top candidates.
         
+        Returns:
+            (move_uci, "hybrid"), or None if Stockfish is unavailable, returns
+            no candidates or the selection fails
+        """
         # Check if Stockfish is available
         if not self.evaluator.is_available():
             logger.warning(
                 "stockfish_unavailable_using_llm_fallback",
                 agent_id=agent_id,
             )
-            return self._get_llm_fallback_move(agent_id, board, board_state, game_history), "llm-fallback"
+            return None
         
         # Get top candidates from Stockfish
         try:
@@ -218,7 +359,17 @@ class HybridAgentMoveSelector:
                     "stockfish_returned_no_candidates_using_fallback",
                     agent_id=agent_id,
                 )
-                return self._get_llm_fallback_move(agent_id, board, board_state, game_history), "llm-fallback"
+                return None
+            
+            # A single candidate leaves the agent nothing to pick
+            if len(candidates) == 1:
+                move_uci = candidates[0][0].uci()
+                logger.debug(
+                    "hybrid_single_candidate_selected",
+                    agent_id=agent_id,
+                    move=move_uci,
+                )
+                return move_uci, "hybrid"
             
             # Get move from agent constrained to candidates
             move_uci = self._get_hybrid_agent_move(
@@ -226,6 +377,7 @@ class HybridAgentMoveSelector:
                 board_state=board_state,
                 candidates=candidates,
                 game_history=game_history,
+                board=board,
             )
             
             logger.info(
@@ -243,7 +395,30 @@ class HybridAgentMoveSelector:
                 agent_id=agent_id,
                 error=str(e),
             )
-            return self._get_llm_fallback_move(agent_id, board, board_state, game_history), "llm-fallback"
+            return None
+    
+    def _get_agent_meta(self, agent_id: str) -> Tuple[str, str]:
+        """Get an agent's personality and system prompt.
+        
+        Entries are cached per agent and rebuilt when the agent manager holds
+        a different config for the agent (e.g. after it was re-created).
+        
+        Args:
+            agent_id: Agent identifier
+            
+        Returns:
+            Tuple of (personality, system_prompt); unknown agents are "balanced"
+        """
+        config = self.agent_manager.configs.get(agent_id)
+        cached = self._agent_meta_cache.get(agent_id)
+        if cached is not None and cached[0] is config:
+            return cached[1]
+        
+        personality = config.personality if config else "balanced"
+        system_prompts = self.agent_manager.SYSTEM_PROMPTS
+        meta = (personality, system_prompts.get(personality, system_prompts["balanced"]))
+        self._agent_meta_cache[agent_id] = (config, meta)
+        return meta
     
     def _get_hybrid_agent_move(
         self,
@@ -251,6 +426,7 @@ class HybridAgentMoveSelector:
         board_state: BoardState,
         candidates: List[Tuple[chess.Move, int, List[chess.Move]]],
         game_history: Optional[List[str]],
+        board: Optional[chess.Board] = None,
     ) -> str:
         """Get move from agent constrained to Stockfish candidates.
         
@@ -259,6 +435,7 @@ class HybridAgentMoveSelector:
             board_state: Board state for context
             candidates: List of (move, score, pv_line) from Stockfish
             game_history: Optional game history
+            board: Board at board_state's position, if the caller has one
             
         Returns:
             Move in UCI notation
@@ -269,25 +446,25 @@ class HybridAgentMoveSelector:
             candidates=candidates,
             game_history=game_history,
             agent_id=agent_id,
+            board=board,
         )
         
-        # Get agent from manager
-        agent = self.agent_manager.agents.get(agent_id)
-        if not agent:
+        if agent_id not in self.agent_manager.agents:
             raise ValueError(f"Agent {agent_id} not found")
         
         config = self.agent_manager.configs.get(agent_id)
         candidate_moves = [move.uci() for move, _, _ in candidates]
+        candidate_set = frozenset(candidate_moves)
         
         # Try to get valid move from agent with retries
         for attempt in range(config.max_retries):
             try:
-                result = agent.run(enhanced_prompt)
+                result = self.agent_manager._complete(agent_id, enhanced_prompt)
                 
                 # Extract move and validate it's from candidates
                 selected_move = self.agent_manager._extract_move(result, candidate_moves)
                 
-                if selected_move and selected_move in candidate_moves:
+                if selected_move and selected_move in candidate_set:
                     logger.debug(
                         "agent_selected_valid_candidate",
                         agent_id=agent_id,
@@ -326,6 +503,7 @@ class HybridAgentMoveSelector:
         candidates: List[Tuple[chess.Move, int, List[chess.Move]]],
         game_history: Optional[List[str]],
         agent_id: str,
+        board: Optional[chess.Board] = None,
     ) -> str:
         """Build enhanced prompt including Stockfish candidates with scores and PV lines.
         
@@ -334,15 +512,14 @@ class HybridAgentMoveSelector:
             candidates: List of (move, score, pv_line) from Stockfish
             game_history: Optional game history
             agent_id: Agent identifier for personality
+            board: Board at board_state's position; parsed from the FEN if None
             
         Returns:
             Enhanced prompt string
         """
-        config = self.agent_manager.configs.get(agent_id)
-        personality = config.personality if config else "balanced"
-        system_prompt = self.agent_manager.SYSTEM_PROMPTS.get(personality, self.agent_manager.SYSTEM_PROMPTS["balanced"])
+        personality, system_prompt = self._get_agent_meta(agent_id)
         
-        prompt = f"""{system_prompt}
+        parts = [f"""{system_prompt}
 
 === HYBRID MOVE SELECTION ===
 
@@ -354,16 +531,22 @@ Do NOT suggest any other moves - they may be tactically unsound.
 
 === STOCKFISH TOP CANDIDATES ===
 
-"""
+"""]
         
         # Check if any candidates are forcing (captures/checks)
         forcing_moves = []
         quiet_moves = []
         
+        # Each candidate is pushed and popped on a private board; copying the
+        # caller's board is ~100x cheaper than re-parsing the FEN
+        board_obj = board.copy(stack=False) if board is not None else chess.Board(board_state.fen)
+        
+        # Only these personalities get check-specific guidance; for the others
+        # the capture tag is enough and the push/pop per candidate is skipped
+        needs_forcing = personality in _CHECK_TAGGED_PERSONALITIES
+        
         # Add candidates with scores and continuations
         for i, (move, score, pv_line) in enumerate(candidates, 1):
-            move_san = board_state.fen  # We'll format this better with actual SAN
-            
             # Format score
             if abs(score) >= 10000:
                 score_str = f"Mate in {abs(score) // 10000}" if score > 0 else f"Mated in {abs(score) // 10000}"
@@ -374,23 +557,18 @@ Do NOT suggest any other moves - they may be tactically unsound.
             pv_str = " ".join([m.uci() for m in pv_line[:5]]) if pv_line else "N/A"
             
             # Check if move is forcing (capture/check)
-            move_obj = chess.Move.from_uci(move.uci())
-            board_obj = chess.Board(board_state.fen)
-            is_capture = board_obj.is_capture(move_obj)
-            board_obj.push(move_obj)
-            gives_check = board_obj.is_check()
-            forcing_tag = "" 
-            is_forcing = False
+            is_capture = board_obj.is_capture(move)
+            gives_check = needs_forcing and board_obj.gives_check(move)
+            is_forcing = is_capture or gives_check
             
             if is_capture and gives_check:
                 forcing_tag = " ⚡ [CAPTURE+CHECK]"
-                is_forcing = True
             elif is_capture:
                 forcing_tag = " 🎯 [CAPTURE]"
-                is_forcing = True
             elif gives_check:
                 forcing_tag = " ⚠️ [CHECK]"
-                is_forcing = True
+            else:
+                forcing_tag = ""
             
             move_info = {
                 "index": i,
@@ -407,89 +585,59 @@ Do NOT suggest any other moves - they may be tactically unsound.
                 quiet_moves.append(move_info)
         
         # If there are forcing moves and personality is aggressive/tactical, show those FIRST with emphasis
-        if forcing_moves and personality in ["aggressive", "tactical"]:
-            prompt += "**FORCING MOVES (CAPTURES/CHECKS) - PRIORITIZE THESE:**\n\n"
-            for info in forcing_moves:
-                prompt += f"**Candidate {info['index']}**: {info['move']}{info['tag']}\n"
-                prompt += f"  - Evaluation: {info['score']}\n"
-                prompt += f"  - Continuation: {info['pv']}\n"
-                prompt += f"  - 🔥 THIS IS A FORCING MOVE - CREATE THREATS!\n\n"
+        if forcing_moves and personality in _FORCING_FIRST_PERSONALITIES:
+            parts.append("**FORCING MOVES (CAPTURES/CHECKS) - PRIORITIZE THESE:**\n\n")
+            parts.append("".join(_FMT_FORCING.format(**info) for info in forcing_moves))
             
             if quiet_moves:
-                prompt += "\n**QUIET MOVES (Less Interesting):**\n\n"
-                for info in quiet_moves:
-                    prompt += f"**Candidate {info['index']}**: {info['move']}\n"
-                    prompt += f"  - Evaluation: {info['score']}\n"
-                    prompt += f"  - Continuation: {info['pv']}\n\n"
+                parts.append("\n**QUIET MOVES (Less Interesting):**\n\n")
+                parts.append("".join(_FMT_QUIET.format(**info) for info in quiet_moves))
         else:
-            # Standard presentation for all moves
-            all_moves = forcing_moves + quiet_moves
-            for info in all_moves:
-                prompt += f"**Candidate {info['index']}**: {info['move']}{info['tag']}\n"
-                prompt += f"  - Evaluation: {info['score']}\n"
-                prompt += f"  - Continuation: {info['pv']}\n"
-                
-                # Add personality-specific annotations
-                if info['is_forcing'] and personality in ["aggressive", "tactical"]:
-                    prompt += f"  - � Forcing move - creates threats!\n"
-                elif personality == "defensive" and not info['is_forcing']:
-                    prompt += f"  - 🛡️ Safe and solid choice\n"
-                
-                prompt += "\n"
+            # Standard presentation for all moves; aggressive/tactical only get
+            # here without forcing moves, so only defensive quiet moves are annotated
+            annotate_safe = personality == "defensive"
+            parts.append("".join(
+                _FMT_CANDIDATE.format(
+                    note=_SAFE_NOTE if annotate_safe and not info["is_forcing"] else "",
+                    **info,
+                )
+                for info in forcing_moves + quiet_moves
+            ))
         
         # Add selection guidance
-        prompt += f"""
+        parts.append(f"""
 === YOUR TASK ===
 
 Current position: {board_state.fen}
 You are playing as: {board_state.current_player.upper()}
-"""
+""")
         
         if game_history:
-            recent = game_history[-6:] if len(game_history) > 6 else game_history
-            prompt += f"Recent moves: {' '.join(recent)}\n"
+            recent = game_history[-6:]
+            parts.append(f"Recent moves: {' '.join(recent)}\n")
         
         if board_state.is_check:
-            prompt += "\n⚠️ YOU ARE IN CHECK!\n"
+            parts.append("\n⚠️ YOU ARE IN CHECK!\n")
         
-        prompt += f"""
+        parts.append(f"""
 Select the BEST move from the candidates above that matches your {personality} style:
-"""
+""")
         
-        if personality == "aggressive":
-            if forcing_moves:
-                prompt += f"**CRITICAL: There are {len(forcing_moves)} forcing moves available!**\n"
-                prompt += "- You MUST choose one of the FORCING MOVES (captures/checks) unless it's clearly losing\n"
-                prompt += "- Quiet moves are BORING - only pick them if all forcing moves are terrible\n"
-            else:
-                prompt += "- Look for the most aggressive, initiative-seizing move\n"
-            prompt += "- Actively look for ways to trade pieces and create imbalances\n"
-        elif personality == "defensive":
-            prompt += "- Prefer safe, solid moves that maintain piece security\n"
-            prompt += "- Choose prophylactic moves that prevent opponent threats\n"
-        elif personality == "tactical":
-            if forcing_moves:
-                prompt += f"**CRITICAL: There are {len(forcing_moves)} forcing moves available!**\n"
-                prompt += "- You MUST choose one of the FORCING MOVES (captures/checks) - this is what tactics means!\n"
-                prompt += "- Quiet moves avoid tactics - only pick them if all forcing moves fail tactically\n"
-            else:
-                prompt += "- Look for the most forcing, concrete move available\n"
-            prompt += "- Look for piece exchanges that lead to tactical opportunities\n"
-        elif personality == "positional":
-            prompt += "- Prefer moves that improve long-term position\n"
-            prompt += "- Choose moves that enhance pawn structure and piece placement\n"
-        else:  # balanced
-            prompt += "- Evaluate both tactical and positional factors\n"
-            prompt += "- Choose the move that offers the best practical chances\n"
-            prompt += "- Don't avoid exchanges - trading pieces is a normal part of chess\n"
-        
-        prompt += """
+        forcing_text, plain_text = _PERSONALITY_GUIDANCE.get(
+            personality, _PERSONALITY_GUIDANCE["balanced"]
+        )
+        if forcing_moves:
+            parts.append(forcing_text.format(forcing_count=len(forcing_moves)))
+        else:
+            parts.append(plain_text)
+        
+        parts.append("""
 Respond with ONLY the move in UCI notation (e.g., 'e2e4').
 Do not include explanations or additional text.
 
-Your selected move:"""
+Your selected move:""")
         
-        return prompt
+        return "".join(parts)
     
     def _get_llm_fallback_move(
         self,
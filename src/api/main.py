@@ -3,19 +3,22 @@
 Provides REST API endpoints for the chess environment following OpenEnv spec.
 """
 
-from dotenv import load_dotenv
-load_dotenv(override=True)  # Override shell environment variables with .env file
-
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Tuple
 import structlog
 import os
 from pathlib import Path
 
 from src.state_manager import StateManager
+from src.agents.agent_manager import ChessAgentManager
+from src.game_manager.game_orchestrator import GameOrchestrator
+from src.utils.stockfish_evaluator import StockfishPool
 from src.api.routes import router
 
 # Configure structured logging
@@ -29,6 +32,61 @@ structlog.configure(
 
 logger = structlog.get_logger()
 
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Server configuration, read from the environment once."""
+    
+    max_games: int = 100
+    cors_origins: Tuple[str, ...] = ("http://localhost:3000", "http://localhost:8080")
+    host: str = "0.0.0.0"
+    port: int = 8000
+    reload: bool = False
+    agent_move_workers: int = 4
+    evaluation_engines: int = 2
+    
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """Build settings from environment variables, falling back to defaults."""
+        return cls(
+            max_games=int(os.getenv("MAX_CONCURRENT_GAMES", "100")),
+            cors_origins=tuple(
+                os.getenv("CORS_ORIGINS", "http://localhost:3000,http://localhost:8080").split(",")
+            ),
+            host=os.getenv("API_HOST", "0.0.0.0"),
+            port=int(os.getenv("API_PORT", "8000")),
+            reload=os.getenv("RELOAD", "false").lower() == "true",
+            agent_move_workers=int(os.getenv("AGENT_MOVE_WORKERS", "4")),
+            evaluation_engines=int(os.getenv("EVALUATION_ENGINES", "2")),
+        )
+
+
+settings = Settings.from_env()
+
+# Landing page served at "/" when web/index.html is absent
+FALLBACK_INDEX_HTML = """
+    <html>
+        <head><title>Chess OpenEnv Demo API</title></head>
+        <body style="font-family: sans-serif; max-width: 800px; margin: 50px auto; padding: 20px;">
+            <h1>Chess OpenEnv Demo API</h1>
+            <p>Multi-agent chess environment using OpenEnv 0.1 specification</p>
+            <h2>Quick Start</h2>
+            <ol>
+                <li>POST /api/v1/reset - Initialize a new game</li>
+                <li>POST /api/v1/step - Make a move</li>
+                <li>GET /api/v1/state/{game_id} - Check game state</li>
+                <li>GET /api/v1/render/{game_id} - View board visualization</li>
+            </ol>
+            <ul>
+                <li><a href="/docs">API Documentation (Swagger)</a></li>
+                <li><a href="/health">Health Check</a></li>
+                <li><a href="/api/v1/metrics">Metrics</a></li>
+            </ul>
+        </body>
+    </html>
+    """
+
 # Global state manager
 state_manager: StateManager = None
 
@@ -39,13 +97,32 @@ async def lifespan(app: FastAPI):
     global state_manager
     
     # Startup
-    max_games = int(os.getenv("MAX_CONCURRENT_GAMES", "100"))
-    state_manager = StateManager(max_games=max_games)
-    logger.info("application_started", max_concurrent_games=max_games)
+    state_manager = StateManager(max_games=settings.max_games)
+    
+    # Read the landing page once instead of hitting the disk on every request
+    index_path = web_dir / "index.html"
+    app.state.index_html = (
+        index_path.read_text() if index_path.exists() else FALLBACK_INDEX_HTML
+    )
+    
+    # One agent manager and orchestrator for the app's lifetime, so agents and
+    # their model clients survive between /agent-move requests
+    agent_move_pool = ThreadPoolExecutor(
+        max_workers=settings.agent_move_workers,
+        thread_name_prefix="agent-move",
+    )
+    app.state.agent_mgr = ChessAgentManager()
+    app.state.orchestrator = GameOrchestrator(app.state.agent_mgr, executor=agent_move_pool)
+    
+    # Warm engines for the /evaluate endpoints
+    app.state.evaluator_pool = StockfishPool(size=settings.evaluation_engines)
+    logger.info("application_started", max_concurrent_games=settings.max_games)
     
     yield
     
     # Shutdown
+    agent_move_pool.shutdown(wait=False)
+    app.state.evaluator_pool.close()
     if state_manager:
         stats = state_manager.get_stats()
         logger.info("application_shutdown", final_stats=stats)
@@ -60,10 +137,9 @@ app = FastAPI(
 )
 
 # Configure CORS
-cors_origins = os.getenv("CORS_ORIGINS", "http://localhost:3000,http://localhost:8080").split(",")
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=cors_origins,
+    allow_origins=list(settings.cors_origins),
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -81,31 +157,7 @@ if web_dir.exists():
 @app.get("/", response_class=HTMLResponse)
 async def root():
     """Root endpoint with web interface."""
-    web_path = Path(__file__).parent.parent.parent / "web" / "index.html"
-    if web_path.exists():
-        return HTMLResponse(content=web_path.read_text())
-    
-    return HTMLResponse(content="""
-    <html>
-        <head><title>Chess OpenEnv Demo API</title></head>
-        <body style="font-family: sans-serif; max-width: 800px; margin: 50px auto; padding: 20px;">
-            <h1>Chess OpenEnv Demo API</h1>
-            <p>Multi-agent chess environment using OpenEnv 0.1 specification</p>
-            <h2>Quick Start</h2>
-            <ol>
-                <li>POST /reset - Initialize a new game</li>
-                <li>POST /step - Make a move</li>
-                <li>GET /state/{game_id} - Check game state</li>
-                <li>GET /render/{game_id} - View board visualization</li>
-            </ol>
-            <ul>
-                <li><a href="/docs">API Documentation (Swagger)</a></li>
-                <li><a href="/health">Health Check</a></li>
-                <li><a href="/api/v1/metrics">Metrics</a></li>
-            </ul>
-        </body>
-    </html>
-    """)
+    return HTMLResponse(content=app.state.index_html)
 
 
 @app.get("/health")
@@ -120,23 +172,19 @@ async def health():
     }
 
 
-# Import and include API routes
-from src.api import routes
-
-app.include_router(routes.router)
-
-
 if __name__ == "__main__":
     import uvicorn
+    from dotenv import load_dotenv
     
-    host = os.getenv("API_HOST", "0.0.0.0")
-    port = int(os.getenv("API_PORT", "8000"))
-    reload = os.getenv("RELOAD", "false").lower() == "true"
+    # Only the server entry point reads .env (overriding shell variables);
+    # under the uvicorn CLI pass --env-file instead
+    load_dotenv(override=True)
+    server_settings = Settings.from_env()
     
     uvicorn.run(
         "src.api.main:app",
-        host=host,
-        port=port,
-        reload=reload,
+        host=server_settings.host,
+        port=server_settings.port,
+        reload=server_settings.reload,
         log_level="info"
     )
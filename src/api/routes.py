@@ -7,20 +7,45 @@ Implements OpenEnv 0.1 REST API specification:
 - GET /render/{game_id} - Render board visualization
 """
 
-from fastapi import APIRouter, HTTPException, Query, Response
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
 from fastapi.responses import HTMLResponse, StreamingResponse
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Dict, Any, Callable, List, Tuple
+import asyncio
+import base64
+import os
 import structlog
 import uuid
 import json
 
 from src.chess_env import ChessOpenEnv
+from src.commentary.triggers import CommentaryTrigger
 
 logger = structlog.get_logger()
 
 router = APIRouter()
 
+# Maximum game IDs accepted by GET /games?ids=...
+LIST_GAMES_MAX_IDS = 100
+
+# Batch evaluation limits; the shared pool keeps engine calls off the event loop
+EVALUATE_BATCH_MAX_ITEMS = 100
+EVALUATE_BATCH_TIMEOUT = 60.0
+_EVALUATION_POOL = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1,
+    thread_name_prefix="evaluate",
+)
+
+# Single-item evaluations currently running, so identical concurrent requests
+# share one engine call
+_evaluations_in_flight: Dict[Tuple[str, ...], asyncio.Future] = {}
+
+# Upper bound on one /agent-move (LLM selection plus engine evaluation)
+AGENT_MOVE_TIMEOUT = 60.0
+
 
 def get_state_manager():
     """Get state manager from main app to avoid circular import."""
@@ -28,6 +53,25 @@ def get_state_manager():
     return state_manager
 
 
+def get_orchestrator(request: Request):
+    """Get the game orchestrator built at application startup."""
+    return request.app.state.orchestrator
+
+
+def get_evaluator_pool(request: Request):
+    """Get the Stockfish engine pool started at application startup."""
+    return request.app.state.evaluator_pool
+
+
+def _model_response(model: BaseModel) -> Response:
+    """Serialize a response model straight to JSON with pydantic-core.
+    
+    Skips jsonable_encoder walking large payloads such as the observation's
+    board tensor; the route's response_model still documents the schema.
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
 # Request/Response models
 class ResetRequest(BaseModel):
     """Request body for /reset endpoint."""
@@ -98,8 +142,9 @@ async def reset_environment(request: ResetRequest):
             black_personality=request.black_personality,
         )
         
-        # Store game in state manager
+        # Store game in state manager, keeping the live env for later requests
         state_mgr.create_game(env.game)
+        state_mgr.set_env(env)
         
         logger.info(
             "game_reset",
@@ -111,11 +156,11 @@ async def reset_environment(request: ResetRequest):
             custom_fen=request.fen is not None,
         )
         
-        return ResetResponse(
+        return _model_response(ResetResponse(
             game_id=game_id,
             observation=observation,
             info=info,
-        )
+        ))
         
     except Exception as e:
         logger.error("reset_failed", error=str(e))
@@ -131,17 +176,11 @@ async def step_environment(request: StepRequest):
     state_mgr = get_state_manager()
     
     try:
-        # Get game from state manager
-        game = state_mgr.get_game(request.game_id)
-        if not game:
+        # Get the game's environment (rebuilt from FEN only on a cache miss)
+        env = state_mgr.get_env(request.game_id)
+        if not env:
             raise HTTPException(status_code=404, detail=f"Game {request.game_id} not found")
         
-        # Recreate environment from stored game
-        env = ChessOpenEnv(game_id=request.game_id)
-        env.game = game
-        env.chess.board = env.chess.board.__class__(game.board_state.fen)
-        env._move_count = game.total_moves
-        
         # Execute step
         observation, reward, terminated, truncated, info = env.step(request.action)
         
@@ -156,14 +195,14 @@ async def step_environment(request: StepRequest):
             terminated=terminated,
         )
         
-        return StepResponse(
+        return _model_response(StepResponse(
             game_id=request.game_id,
             observation=observation,
             reward=reward,
             terminated=terminated,
             truncated=truncated,
             info=info,
-        )
+        ))
         
     except ValueError as e:
         logger.warning("invalid_move", game_id=request.game_id, action=request.action, error=str(e))
@@ -186,22 +225,7 @@ async def get_state(game_id: str):
         if not game:
             raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
         
-        return {
-            "game_id": game_id,
-            "status": game.status.value,
-            "result": game.result.value,
-            "move_count": game.total_moves,
-            "current_player": game.board_state.current_player,
-            "fen": game.board_state.fen,
-            "is_terminal": game.is_terminal(),
-            "is_check": game.board_state.is_check,
-            "is_checkmate": game.board_state.is_checkmate,
-            "is_stalemate": game.board_state.is_stalemate,
-            "white_agent": game.white_agent_id,
-            "black_agent": game.black_agent_id,
-            "created_at": game.created_at.isoformat(),
-            "updated_at": game.updated_at.isoformat(),
-        }
+        return game.to_state_dict()
         
     except HTTPException:
         raise
@@ -214,30 +238,33 @@ async def get_state(game_id: str):
 async def render_board(
     game_id: str,
     mode: str = Query("svg", description="Render mode: 'svg' or 'ascii'"),
-    size: int = Query(400, description="Board size in pixels (SVG only)")
+    size: int = Query(400, description="Board size in pixels (SVG only)"),
+    if_none_match: Optional[str] = Header(None),
 ):
     """Render board visualization.
     
     OpenEnv /render endpoint - returns visual representation of board.
+    SVG responses carry the position's Zobrist hash as ETag, so pollers get
+    304 Not Modified until a move is made.
     """
     state_mgr = get_state_manager()
     
     try:
-        game = state_mgr.get_game(game_id)
-        if not game:
+        env = state_mgr.get_env(game_id)
+        if not env:
             raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
         
-        # Recreate environment for rendering
-        env = ChessOpenEnv(game_id=game_id)
-        env.chess.board = env.chess.board.__class__(game.board_state.fen)
+        if mode == "svg":
+            headers = {
+                "ETag": f'"{env.zobrist:016x}"',
+                "Cache-Control": "no-cache",
+            }
+            if if_none_match and headers["ETag"] in if_none_match:
+                return Response(status_code=304, headers=headers)
+            return HTMLResponse(content=env.render(mode=mode, size=size), headers=headers)
         
-        # Render board
         rendered = env.render(mode=mode, size=size)
-        
-        if mode == "svg":
-            return HTMLResponse(content=rendered)
-        else:
-            return {"game_id": game_id, "board": rendered}
+        return {"game_id": game_id, "board": rendered}
         
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -251,19 +278,40 @@ async def render_board(
 @router.get("/games")
 async def list_games(
     limit: int = Query(10, description="Maximum number of games to return"),
-    active_only: bool = Query(False, description="Only return active games")
+    active_only: bool = Query(False, description="Only return active games"),
+    ids: Optional[List[str]] = Query(
+        None,
+        description=f"Return these games (up to {LIST_GAMES_MAX_IDS}) instead of the most recent; unknown IDs are skipped",
+    ),
+    fields: str = Query(
+        "summary",
+        description="'summary' for list fields, 'full' for the same shape as /state/{game_id}",
+    ),
 ):
-    """List all games."""
+    """List all games, or fetch several games' state in one call."""
     state_mgr = get_state_manager()
     
+    if fields not in ("summary", "full"):
+        raise HTTPException(status_code=400, detail=f"Unknown fields value: {fields}")
+    if ids is not None and len(ids) > LIST_GAMES_MAX_IDS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {LIST_GAMES_MAX_IDS} ids per request",
+        )
+    
     try:
-        games = state_mgr.list_games(limit=limit)
+        if ids is not None:
+            games = [g for g in map(state_mgr.get_game, ids) if g is not None]
+        else:
+            games = state_mgr.list_games(limit=limit, active_only=active_only)
         
-        if active_only:
+        if ids is not None and active_only:
             games = [g for g in games if not g.is_terminal()]
         
-        return {
-            "games": [
+        if fields == "full":
+            entries = [g.to_state_dict() for g in games]
+        else:
+            entries = [
                 {
                     "game_id": g.game_id,
                     "status": g.status.value,
@@ -275,8 +323,12 @@ async def list_games(
                     "created_at": g.created_at.isoformat(),
                 }
                 for g in games
-            ],
+            ]
+        
+        return {
+            "games": entries,
             "total": len(games),
+            "total_active": state_mgr.count_active(),
         }
         
     except Exception as e:
@@ -319,7 +371,10 @@ async def get_stats():
 
 
 @router.post("/agent-move")
-async def agent_move(request: AgentMoveRequest):
+async def agent_move(
+    request: AgentMoveRequest,
+    orchestrator=Depends(get_orchestrator),
+):
     """Execute a move using an LLM agent.
     
     This endpoint uses the game orchestrator to generate a move using an LLM,
@@ -327,20 +382,15 @@ async def agent_move(request: AgentMoveRequest):
     """
     state_mgr = get_state_manager()
     
-    # Get game from state manager
-    game = state_mgr.get_game(request.game_id)
-    if not game:
+    # Get the game's environment (rebuilt from FEN only on a cache miss)
+    env = state_mgr.get_env(request.game_id)
+    if not env:
         raise HTTPException(status_code=404, detail=f"Game {request.game_id} not found")
+    game = env.game
     
     logger.debug("agent_move_requested", game_id=request.game_id)
     
     try:
-        # Recreate environment from stored game (like step endpoint does)
-        env = ChessOpenEnv(game_id=request.game_id)
-        env.game = game
-        env.chess.board = env.chess.board.__class__(game.board_state.fen)
-        env._move_count = game.total_moves
-        
         # Get current player
         current_player = 'white' if env.chess.board.turn else 'black'
         agent_id = game.white_agent_id if current_player == 'white' else game.black_agent_id
@@ -358,41 +408,23 @@ async def agent_move(request: AgentMoveRequest):
             black_personality_stored=game.black_personality,
         )
         
-        # Import dependencies
-        from src.agents.agent_manager import ChessAgentManager
-        from src.game_manager.game_orchestrator import GameOrchestrator
-        import asyncio
-        from concurrent.futures import ThreadPoolExecutor
-        
-        # Create agent manager and orchestrator
-        agent_mgr = ChessAgentManager()
-        
-        # Create agent if it doesn't exist
-        try:
-            agent_mgr.create_agent(agent_id, personality=personality)
-            logger.info("agent_created", agent_id=agent_id, personality=personality)
-        except ValueError:
-            # Agent already exists
-            pass
-        
-        orchestrator = GameOrchestrator(agent_mgr)
+        orchestrator.agent_manager.get_or_create_agent(agent_id, personality=personality)
         
         logger.info("requesting_agent_move", 
                    game_id=request.game_id,
                    agent_id=agent_id,
                    personality=personality)
         
-        # Execute one move using orchestrator in thread pool (takes 2-30 seconds)
-        loop = asyncio.get_event_loop()
-        with ThreadPoolExecutor() as pool:
-            result = await loop.run_in_executor(
-                pool,
-                lambda: asyncio.run(orchestrator.run_game_step(
-                    env=env,
-                    agent_id=agent_id,
-                    move_history=[]
-                ))
-            )
+        # Execute one move (takes 2-30 seconds); the orchestrator runs the
+        # blocking selection in the agent-move pool and awaits commentary here.
+        # The timeout covers selection only: once the move is applied the
+        # result is returned and the stored game updated.
+        result = await orchestrator.run_game_step(
+            env=env,
+            agent_id=agent_id,
+            move_history=[],
+            move_timeout=AGENT_MOVE_TIMEOUT,
+        )
         
         logger.info("agent_move_generated",
                    game_id=request.game_id,
@@ -424,6 +456,9 @@ async def agent_move(request: AgentMoveRequest):
         
         return response
         
+    except asyncio.TimeoutError:
+        logger.error("agent_move_timed_out", game_id=request.game_id, timeout=AGENT_MOVE_TIMEOUT)
+        raise HTTPException(status_code=504, detail="Agent move timed out")
     except Exception as e:
         logger.error("agent_move_failed",
                     game_id=request.game_id,
@@ -431,31 +466,150 @@ async def agent_move(request: AgentMoveRequest):
         raise HTTPException(status_code=500, detail=f"Agent move failed: {str(e)}")
 
 
-@router.get("/metrics")
-async def metrics():
-    """Prometheus metrics endpoint."""
-    state_mgr = get_state_manager()
-    stats = state_mgr.get_stats()
-    
-    # Build Prometheus format metrics
-    metrics_text = f"""# HELP chess_games_total Total number of games
+# Prometheus exposition text, filled from StateManager.get_stats()
+_METRICS_TEMPLATE = """# HELP chess_games_total Total number of games
 # TYPE chess_games_total gauge
-chess_games_total {stats['total_games']}
+chess_games_total {total_games}
 
 # HELP chess_games_active Active games count
 # TYPE chess_games_active gauge
-chess_games_active {stats['active_games']}
+chess_games_active {active_games}
 
 # HELP chess_games_completed Completed games count
 # TYPE chess_games_completed gauge
-chess_games_completed {stats['completed_games']}
+chess_games_completed {completed_games}
 
 # HELP chess_capacity_used_percent Capacity utilization percentage
 # TYPE chess_capacity_used_percent gauge
-chess_capacity_used_percent {stats['capacity_used_percent']}
+chess_capacity_used_percent {capacity_used_percent}
 """
+
+
+@router.get("/metrics")
+async def metrics():
+    """Prometheus metrics endpoint."""
+    state_mgr = get_state_manager()
+    stats = state_mgr.get_stats()
     
-    return Response(content=metrics_text, media_type="text/plain")
+    return Response(
+        content=_METRICS_TEMPLATE.format_map(stats),
+        media_type="text/plain",
+        headers={"Cache-Control": "max-age=5"},
+    )
+
+
+def _sse_frame(payload: Dict[str, Any]) -> bytes:
+    """Encode one Server-Sent Events data frame."""
+    return b"data: " + json.dumps(payload).encode("utf-8") + b"\n\n"
+
+
+def _sse_audio_frame(audio: str) -> bytes:
+    """Encode an audio chunk frame; base64 needs no JSON escaping."""
+    return b'data: {"audio": "' + audio.encode("ascii") + b'"}\n\n'
+
+
+def _coalesced_audio_frame(chunks: List[str]) -> bytes:
+    """Encode several base64 PCM chunks as one audio frame.
+    
+    The browser schedules decoded chunks back to back, so one frame carrying
+    the concatenated PCM plays the same as the separate frames.
+    """
+    if len(chunks) == 1:
+        return _sse_audio_frame(chunks[0])
+    pcm = b"".join(base64.b64decode(chunk) for chunk in chunks)
+    return _sse_audio_frame(base64.b64encode(pcm).decode("ascii"))
+
+
+_SSE_DONE = _sse_frame({"done": True})
+_SSE_UNAVAILABLE = _sse_frame({"error": "Audio commentary not available", "done": True})
+
+# Commentary SSE: frames buffered ahead of a slow client, and the base64 sizes
+# below which audio chunks are merged and above which a merged frame is sent
+SSE_QUEUE_SIZE = 32
+SSE_AUDIO_COALESCE_BELOW = 1024
+SSE_AUDIO_COALESCE_MAX = 4096
+
+
+async def _produce_commentary_frames(
+    client, prompt: str, failure_event: str, queue: asyncio.Queue
+) -> None:
+    """Encode realtime commentary events into SSE frames on queue, then None.
+    
+    Runs of small audio chunks are merged into one frame. The bounded queue
+    pauses the upstream stream while the client falls behind.
+    
+    Args:
+        client: Realtime audio client
+        prompt: Commentary prompt
+        failure_event: Log event name if the stream raises
+        queue: Bounded queue drained by the response
+    """
+    pending: List[str] = []
+    pending_size = 0
+    
+    try:
+        async for event in client.stream_commentary_audio(prompt, voice_style="excited"):
+            audio = event.get('audio')
+            small = bool(audio) and len(audio) < SSE_AUDIO_COALESCE_BELOW
+            
+            if pending and (not small or pending_size + len(audio) > SSE_AUDIO_COALESCE_MAX):
+                await queue.put(_coalesced_audio_frame(pending))
+                pending, pending_size = [], 0
+            
+            if small:
+                pending.append(audio)
+                pending_size += len(audio)
+            elif audio:
+                await queue.put(_sse_audio_frame(audio))
+            
+            if event.get('text'):
+                await queue.put(_sse_frame({'text': event['text']}))
+            
+            if event.get('done') or event.get('error'):
+                # Merged audio goes out before the frame that ends the stream
+                if pending:
+                    await queue.put(_coalesced_audio_frame(pending))
+                    pending = []
+                
+                if event.get('done'):
+                    await queue.put(_SSE_DONE)
+                else:
+                    await queue.put(_sse_frame({'error': event['error'], 'done': True}))
+                break
+        
+        if pending:
+            await queue.put(_coalesced_audio_frame(pending))
+                
+    except Exception as e:
+        logger.error(failure_event, error=str(e))
+        if pending:
+            await queue.put(_coalesced_audio_frame(pending))
+        await queue.put(_sse_frame({'error': str(e), 'done': True}))
+    
+    # Not in a finally: once the response has cancelled this task nobody
+    # drains the queue, and waiting for room in it would never return
+    await queue.put(None)
+
+
+async def _stream_commentary_events(client, prompt: str, failure_event: str):
+    """Relay realtime commentary events as SSE frames until done or error.
+    
+    Args:
+        client: Realtime audio client
+        prompt: Commentary prompt
+        failure_event: Log event name if the stream raises
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=SSE_QUEUE_SIZE)
+    producer = asyncio.create_task(
+        _produce_commentary_frames(client, prompt, failure_event, queue)
+    )
+    
+    try:
+        while (frame := await queue.get()) is not None:
+            yield frame
+    finally:
+        # Stop the upstream stream if the client disconnected early
+        producer.cancel()
 
 
 @router.get("/commentary/introduction")
@@ -474,7 +628,7 @@ async def stream_introduction(white_agent: str = Query("White"), black_agent: st
         if not client or not client.is_available():
             # Return error event
             async def error_stream():
-                yield f"data: {json.dumps({'error': 'Audio commentary not available', 'done': True})}\n\n".encode('utf-8')
+                yield _SSE_UNAVAILABLE
             
             return StreamingResponse(
                 error_stream(),
@@ -482,39 +636,13 @@ async def stream_introduction(white_agent: str = Query("White"), black_agent: st
             )
         
         # Generate energetic introduction
-        async def generate():
-            try:
-                prompt = f"""Welcome to this exciting chess match! Today we have {white_agent} playing as White against {black_agent} as Black! 
+        prompt = f"""Welcome to this exciting chess match! Today we have {white_agent} playing as White against {black_agent} as Black! 
 This is going to be an intense battle of strategy and tactics - and like Kimi, these drivers actually know where the finish line is! 
 Both players are ready at the board, the pieces are set, and White is about to make the opening move. 
 Bwoah, let's see what happens! The game begins NOW!"""
-                
-                async for event in client.stream_commentary_audio(prompt, voice_style="excited"):
-                    if event.get('audio'):
-                        data = json.dumps({'audio': event['audio']})
-                        yield f"data: {data}\n\n".encode('utf-8')
-                    
-                    if event.get('text'):
-                        data = json.dumps({'text': event['text']})
-                        yield f"data: {data}\n\n".encode('utf-8')
-                    
-                    if event.get('done'):
-                        data = json.dumps({'done': True})
-                        yield f"data: {data}\n\n".encode('utf-8')
-                        break
-                    
-                    if event.get('error'):
-                        data = json.dumps({'error': event['error'], 'done': True})
-                        yield f"data: {data}\n\n".encode('utf-8')
-                        break
-                        
-            except Exception as e:
-                logger.error("introduction_stream_failed", error=str(e))
-                data = json.dumps({'error': str(e), 'done': True})
-                yield f"data: {data}\n\n".encode('utf-8')
         
         return StreamingResponse(
-            generate(),
+            _stream_commentary_events(client, prompt, "introduction_stream_failed"),
             media_type="text/event-stream",
             headers={
                 "Cache-Control": "no-cache",
@@ -527,6 +655,53 @@ Bwoah, let's see what happens! The game begins NOW!"""
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@dataclass(frozen=True)
+class _StreamTriggerContext:
+    """Trigger context for /commentary/stream, shaped like what _build_prompt reads.
+    
+    Frozen so it can key the prompt cache.
+    """
+    trigger: CommentaryTrigger
+    player: str
+    move: str  # UCI move (we'll use san_move for now)
+    san_move: str
+    move_number: int
+    eval_before: Optional[int] = None
+    eval_after: Optional[int] = None
+    eval_swing: Optional[int] = None
+    centipawn_loss: float = 0.0
+    quality: str = "good"
+    is_best_move: bool = False
+    best_move_alternative: Optional[str] = None
+    game_phase: str = "middlegame"
+    material_balance: int = 0
+    position_type: str = "normal"
+    is_check: bool = False
+    is_checkmate: bool = False
+    tactical_motif: Optional[str] = None
+    fen_before_move: Optional[str] = None
+
+
+@lru_cache(maxsize=512)
+def _build_stream_prompt(context: _StreamTriggerContext, fen: Optional[str]) -> str:
+    """Build the template-based commentary prompt, cached per move context.
+    
+    Args:
+        context: Stream trigger context
+        fen: Current position FEN, used for strategic analysis
+        
+    Returns:
+        Formatted prompt string
+    """
+    from src.commentary.commentary_generator import get_commentary_generator
+    
+    game_context = {
+        "move_number": context.move_number,
+        "fen": fen,
+    }
+    return get_commentary_generator()._build_prompt(context, game_context)
+
+
 @router.get("/commentary/stream")
 async def stream_commentary(
     san_move: str = Query(..., description="Move in Standard Algebraic Notation (e.g., 'Nf3', 'e4')"),
@@ -543,9 +718,6 @@ async def stream_commentary(
     Uses actual move data and Stockfish evaluation to generate grandmaster-level commentary.
     """
     from src.commentary.realtime_audio_client import get_realtime_client
-    from src.commentary.triggers import CommentaryTrigger
-    from dataclasses import dataclass
-    
     logger.info("commentary_stream_requested", 
                 san_move=san_move, 
                 player=player, 
@@ -558,36 +730,13 @@ async def stream_commentary(
         if not client or not client.is_available():
             # Return error event
             async def error_stream():
-                yield f"data: {json.dumps({'error': 'Audio commentary not available', 'done': True})}\n\n".encode('utf-8')
+                yield _SSE_UNAVAILABLE
             
             return StreamingResponse(
                 error_stream(),
                 media_type="text/event-stream"
             )
         
-        # Build a simplified trigger context-like object for prompt generation
-        # Use dataclass to match what _build_prompt expects
-        @dataclass
-        class SimpleTriggerContext:
-            trigger: CommentaryTrigger
-            player: str
-            move: str  # UCI move (we'll use san_move for now)
-            san_move: str
-            move_number: int
-            eval_before: Optional[int] = None
-            eval_after: Optional[int] = None
-            eval_swing: Optional[int] = None
-            centipawn_loss: float = 0.0
-            quality: str = "good"
-            is_best_move: bool = False
-            best_move_alternative: Optional[str] = None
-            game_phase: str = "middlegame"
-            material_balance: int = 0
-            position_type: str = "normal"
-            is_check: bool = False
-            is_checkmate: bool = False
-            tactical_motif: Optional[str] = None
-        
         # Determine trigger type
         try:
             trigger_enum = CommentaryTrigger[trigger.upper()]
@@ -615,7 +764,7 @@ async def stream_commentary(
             game_phase = "endgame"
         
         # Create simplified context
-        context = SimpleTriggerContext(
+        context = _StreamTriggerContext(
             trigger=trigger_enum,
             player=player,
             move=san_move,  # Using san_move for both move and san_move
@@ -628,18 +777,6 @@ async def stream_commentary(
             game_phase=game_phase,
         )
         
-        # Import CommentaryGenerator to use its prompt building
-        from src.commentary.commentary_generator import CommentaryGenerator
-        
-        # Create a temporary generator instance just for prompt building
-        temp_generator = CommentaryGenerator()
-        
-        # Build the proper chess commentary prompt
-        game_context = {
-            "move_number": move_number or 1,
-            "fen": fen,
-        }
-        
         # Without evaluation data, create a simpler, more engaging prompt
         if evaluation is None and eval_change is None:
             # Simple prompt that works without evaluation
@@ -677,7 +814,7 @@ Keep it analytical and concise - maximum 3 sentences!"""
         else:
             # Try to use the template-based prompt
             try:
-                prompt = temp_generator._build_prompt(context, game_context)
+                prompt = _build_stream_prompt(context, fen)
             except Exception as e:
                 logger.warning("prompt_build_failed", error=str(e))
                 # Fallback to simple prompt
@@ -693,34 +830,8 @@ Generate analytical 2-3 sentence commentary about this move. Be objective and in
                     prompt_length=len(prompt))
         
         # Stream commentary audio with proper prompt
-        async def generate():
-            try:
-                async for event in client.stream_commentary_audio(prompt, voice_style="excited"):
-                    if event.get('audio'):
-                        data = json.dumps({'audio': event['audio']})
-                        yield f"data: {data}\n\n".encode('utf-8')
-                    
-                    if event.get('text'):
-                        data = json.dumps({'text': event['text']})
-                        yield f"data: {data}\n\n".encode('utf-8')
-                    
-                    if event.get('done'):
-                        data = json.dumps({'done': True})
-                        yield f"data: {data}\n\n".encode('utf-8')
-                        break
-                    
-                    if event.get('error'):
-                        data = json.dumps({'error': event['error'], 'done': True})
-                        yield f"data: {data}\n\n".encode('utf-8')
-                        break
-                        
-            except Exception as e:
-                logger.error("commentary_stream_failed", error=str(e))
-                data = json.dumps({'error': str(e), 'done': True})
-                yield f"data: {data}\n\n".encode('utf-8')
-        
         return StreamingResponse(
-            generate(),
+            _stream_commentary_events(client, prompt, "commentary_stream_failed"),
             media_type="text/event-stream",
             headers={
                 "Cache-Control": "no-cache",
@@ -762,19 +873,141 @@ class EvaluateMoveResponse(BaseModel):
     available: bool
 
 
+class EvaluatePositionsBatchRequest(BaseModel):
+    """Request body for batch position evaluation."""
+    items: List[EvaluatePositionRequest] = Field(
+        ..., max_length=EVALUATE_BATCH_MAX_ITEMS, description="Positions to evaluate"
+    )
+
+
+class EvaluatePositionsBatchResponse(BaseModel):
+    """Response body for batch position evaluation.
+    
+    results is aligned with the request items; failed items are None and
+    described in errors by index.
+    """
+    results: List[Optional[EvaluatePositionResponse]]
+    errors: List[Dict[str, Any]]
+
+
+class EvaluateMovesBatchRequest(BaseModel):
+    """Request body for batch move evaluation."""
+    items: List[EvaluateMoveRequest] = Field(
+        ..., max_length=EVALUATE_BATCH_MAX_ITEMS, description="Moves to evaluate"
+    )
+
+
+class EvaluateMovesBatchResponse(BaseModel):
+    """Response body for batch move evaluation.
+    
+    results is aligned with the request items; failed items are None and
+    described in errors by index.
+    """
+    results: List[Optional[EvaluateMoveResponse]]
+    errors: List[Dict[str, Any]]
+
+
+def _evaluate_position_item(evaluator, fen: str) -> EvaluatePositionResponse:
+    """Evaluate one position with an available evaluator."""
+    import chess
+    
+    board = chess.Board(fen)
+    evaluation = evaluator.evaluate_position(board)
+    best_move = evaluator.get_best_move(board)
+    
+    return EvaluatePositionResponse(
+        fen=fen,
+        evaluation=evaluation,
+        best_move=best_move.uci() if best_move else None,
+        available=True
+    )
+
+
+def _evaluate_move_item(evaluator, fen: str, move_uci: str) -> EvaluateMoveResponse:
+    """Evaluate one move with an available evaluator."""
+    import chess
+    
+    board = chess.Board(fen)
+    move = chess.Move.from_uci(move_uci)
+    
+    return EvaluateMoveResponse(
+        move=move_uci,
+        evaluation=evaluator.evaluate_move(board, move),
+        available=True
+    )
+
+
+async def _run_evaluation_batch(
+    calls: List[Tuple[Callable, ...]],
+) -> Tuple[List[Any], List[Dict[str, Any]]]:
+    """Fan evaluation calls out over the shared pool.
+    
+    Args:
+        calls: (function, *args) tuples, one per batch item
+        
+    Returns:
+        Tuple of (results, errors) with results aligned to calls
+        
+    Raises:
+        HTTPException: 504 if the batch exceeds EVALUATE_BATCH_TIMEOUT
+    """
+    loop = asyncio.get_running_loop()
+    futures = [loop.run_in_executor(_EVALUATION_POOL, fn, *args) for fn, *args in calls]
+    
+    try:
+        outcomes = await asyncio.wait_for(
+            asyncio.gather(*futures, return_exceptions=True),
+            timeout=EVALUATE_BATCH_TIMEOUT,
+        )
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail="Batch evaluation timed out")
+    
+    results = []
+    errors = []
+    for index, outcome in enumerate(outcomes):
+        if isinstance(outcome, Exception):
+            results.append(None)
+            errors.append({"index": index, "error": str(outcome)})
+        else:
+            results.append(outcome)
+    
+    return results, errors
+
+
+async def _run_evaluation_coalesced(key: Tuple[str, ...], pool, fn: Callable, *args: Any) -> Any:
+    """Run one pooled evaluation, joining an identical one already running.
+    
+    Args:
+        key: Identifies the evaluation (kind plus its inputs)
+        pool: Stockfish engine pool
+        fn: Evaluation function taking (evaluator, *args)
+        *args: Arguments for fn after the evaluator
+        
+    Returns:
+        The evaluation result
+    """
+    future = _evaluations_in_flight.get(key)
+    if future is None:
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(_EVALUATION_POOL, pool.run, fn, *args)
+        _evaluations_in_flight[key] = future
+        future.add_done_callback(lambda _: _evaluations_in_flight.pop(key, None))
+    
+    # Shielded so one caller disconnecting doesn't cancel the shared result
+    return await asyncio.shield(future)
+
+
 @router.post("/evaluate/position", response_model=EvaluatePositionResponse)
-async def evaluate_position(request: EvaluatePositionRequest):
+async def evaluate_position(
+    request: EvaluatePositionRequest,
+    pool=Depends(get_evaluator_pool),
+):
     """Evaluate a chess position using Stockfish.
     
     Returns centipawn evaluation and best move recommendation.
     """
-    from src.utils.stockfish_evaluator import get_evaluator
-    import chess
-    
     try:
-        evaluator = get_evaluator()
-        
-        if not evaluator.is_available():
+        if not pool.is_available():
             return EvaluatePositionResponse(
                 fen=request.fen,
                 evaluation=None,
@@ -782,16 +1015,8 @@ async def evaluate_position(request: EvaluatePositionRequest):
                 available=False
             )
         
-        # Parse FEN and evaluate
-        board = chess.Board(request.fen)
-        evaluation = evaluator.evaluate_position(board)
-        best_move = evaluator.get_best_move(board)
-        
-        return EvaluatePositionResponse(
-            fen=request.fen,
-            evaluation=evaluation,
-            best_move=best_move.uci() if best_move else None,
-            available=True
+        return await _run_evaluation_coalesced(
+            ("position", request.fen), pool, _evaluate_position_item, request.fen
         )
         
     except Exception as e:
@@ -800,35 +1025,24 @@ async def evaluate_position(request: EvaluatePositionRequest):
 
 
 @router.post("/evaluate/move", response_model=EvaluateMoveResponse)
-async def evaluate_move(request: EvaluateMoveRequest):
+async def evaluate_move(
+    request: EvaluateMoveRequest,
+    pool=Depends(get_evaluator_pool),
+):
     """Evaluate quality of a specific move using Stockfish.
     
     Returns centipawn loss, move quality rating, and comparison to best move.
     """
-    from src.utils.stockfish_evaluator import get_evaluator
-    import chess
-    
     try:
-        evaluator = get_evaluator()
-        
-        if not evaluator.is_available():
+        if not pool.is_available():
             return EvaluateMoveResponse(
                 move=request.move,
                 evaluation={"error": "Stockfish not available"},
                 available=False
             )
         
-        # Parse FEN and move
-        board = chess.Board(request.fen)
-        move = chess.Move.from_uci(request.move)
-        
-        # Evaluate move
-        evaluation = evaluator.evaluate_move(board, move)
-        
-        return EvaluateMoveResponse(
-            move=request.move,
-            evaluation=evaluation,
-            available=True
+        return await _run_evaluation_coalesced(
+            ("move", request.fen, request.move), pool, _evaluate_move_item, request.fen, request.move
         )
         
     except Exception as e:
@@ -836,18 +1050,74 @@ async def evaluate_move(request: EvaluateMoveRequest):
         raise HTTPException(status_code=400, detail=f"Evaluation failed: {str(e)}")
 
 
-@router.get("/evaluate/status")
-async def evaluation_status():
-    """Check if Stockfish evaluation is available."""
-    from src.utils.stockfish_evaluator import get_evaluator
+@router.post("/evaluate/positions/batch", response_model=EvaluatePositionsBatchResponse)
+async def evaluate_positions_batch(
+    request: EvaluatePositionsBatchRequest,
+    pool=Depends(get_evaluator_pool),
+):
+    """Evaluate many positions in one request.
+    
+    Items are evaluated concurrently across the engine pool; a failing item is
+    reported in errors without failing the rest of the batch.
+    """
+    if not pool.is_available():
+        return _model_response(EvaluatePositionsBatchResponse(
+            results=[
+                EvaluatePositionResponse(fen=item.fen, evaluation=None, best_move=None, available=False)
+                for item in request.items
+            ],
+            errors=[],
+        ))
+    
+    results, errors = await _run_evaluation_batch(
+        [(pool.run, _evaluate_position_item, item.fen) for item in request.items]
+    )
+    
+    if errors:
+        logger.warning("batch_position_evaluation_errors", items=len(request.items), failed=len(errors))
+    
+    return _model_response(EvaluatePositionsBatchResponse(results=results, errors=errors))
+
+
+@router.post("/evaluate/moves/batch", response_model=EvaluateMovesBatchResponse)
+async def evaluate_moves_batch(
+    request: EvaluateMovesBatchRequest,
+    pool=Depends(get_evaluator_pool),
+):
+    """Evaluate many moves in one request.
+    
+    Items are evaluated concurrently across the engine pool; a failing item is
+    reported in errors without failing the rest of the batch.
+    """
+    if not pool.is_available():
+        return _model_response(EvaluateMovesBatchResponse(
+            results=[
+                EvaluateMoveResponse(
+                    move=item.move,
+                    evaluation={"error": "Stockfish not available"},
+                    available=False
+                )
+                for item in request.items
+            ],
+            errors=[],
+        ))
+    
+    results, errors = await _run_evaluation_batch(
+        [(pool.run, _evaluate_move_item, item.fen, item.move) for item in request.items]
+    )
     
-    evaluator = get_evaluator()
+    if errors:
+        logger.warning("batch_move_evaluation_errors", items=len(request.items), failed=len(errors))
     
+    return _model_response(EvaluateMovesBatchResponse(results=results, errors=errors))
+
+
+@router.get("/evaluate/status")
+async def evaluation_status(pool=Depends(get_evaluator_pool)):
+    """Check if Stockfish evaluation is available."""
     return {
-        "available": evaluator.is_available(),
-        "stockfish_path": evaluator.stockfish_path if evaluator else None,
-        "depth": evaluator.depth if evaluator else None,
-        "time_limit": evaluator.time_limit if evaluator else None,
+        "available": pool.is_available(),
+        "stockfish_path": pool.stockfish_path,
+        "depth": pool.depth,
+        "time_limit": pool.time_limit,
     }
-    
-    return Response(content=metrics_text, media_type="text/plain")
@@ -4,9 +4,13 @@ This environment implements the OpenEnv specification for a chess game,
 following patterns from openenv/openspiel_env.
 """
 
-from typing import Dict, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Literal, Optional, Sequence, Tuple
+import itertools
+import os
 import uuid
-import chess
+import chess.polyglot
+import numpy as np
 import structlog
 
 from src.chess_logic import ChessLogic
@@ -15,6 +19,34 @@ from src.models.game import Game, GameStatus, GameResult
 
 logger = structlog.get_logger(__name__)
 
+# Default game IDs only need to be unique within the process: a PID prefix
+# and a counter avoid a urandom read per environment
+_ID_PREFIX = f"{os.getpid():x}"
+_ID_COUNTER = itertools.count()
+
+# How observations carry board_tensor: nested lists (JSON-ready), the numpy
+# array itself, its raw bytes plus shape and dtype, or a 96-byte bitmap
+# (np.packbits of the 0/1 planes) for crossing process boundaries
+TensorFormat = Literal["list", "ndarray", "bytes", "packed"]
+TENSOR_FORMATS = ("list", "ndarray", "bytes", "packed")
+
+# (reward, status, result) for a decisive game by (PGN result, player to move
+# after the final move); the mover delivered mate and gets +1
+_TERMINAL_TABLE = {
+    ("1-0", "white"): (-1.0, GameStatus.CHECKMATE, GameResult.WHITE_WINS),
+    ("1-0", "black"): (1.0, GameStatus.CHECKMATE, GameResult.WHITE_WINS),
+    ("0-1", "white"): (1.0, GameStatus.CHECKMATE, GameResult.BLACK_WINS),
+    ("0-1", "black"): (-1.0, GameStatus.CHECKMATE, GameResult.BLACK_WINS),
+}
+
+# Game status for each drawn terminal reason from ChessLogic.is_terminal
+_DRAW_STATUS = {
+    "stalemate": GameStatus.STALEMATE,
+    "insufficient_material": GameStatus.DRAW,
+    "fifty_move_rule": GameStatus.DRAW,
+    "threefold_repetition": GameStatus.DRAW,
+}
+
 
 class ChessOpenEnv:
     """Chess environment implementing OpenEnv 0.1 specification.
@@ -26,18 +58,77 @@ class ChessOpenEnv:
     - close() -> cleanup
     
     Based on patterns from openenv/openspiel_env for turn-based games.
+    
+    Attributes:
+        zobrist: Polyglot Zobrist hash of the current position, an integer
+            cache key that is cheaper to compare than the FEN
     """
     
-    def __init__(self, game_id: Optional[str] = None):
+    # No per-instance __dict__: batches of thousands of envs add up
+    __slots__ = (
+        "game_id", "tensor_format", "include_fen", "chess", "game",
+        "zobrist", "_move_count", "_state_cache",
+    )
+    
+    def __init__(
+        self,
+        game_id: Optional[str] = None,
+        tensor_format: TensorFormat = "list",
+        include_fen: bool = True,
+        strict_uuid: bool = False,
+    ):
         """Initialize chess environment.
         
         Args:
             game_id: Optional game identifier (generated if not provided)
+            tensor_format: Observation board_tensor encoding; "ndarray" or
+                "bytes" skip the per-step list conversion for in-process use
+            include_fen: Put the FEN in observations; tensor-only agents can
+                turn it off so the string is never built
+            strict_uuid: Generate a random UUID4 game ID instead of a
+                process-unique one
+            
+        Raises:
+            ValueError: If tensor_format is unknown
         """
-        self.game_id = game_id or str(uuid.uuid4())
+        if tensor_format not in TENSOR_FORMATS:
+            raise ValueError(f"Unknown tensor format: {tensor_format}")
+        
+        if not game_id:
+            game_id = str(uuid.uuid4()) if strict_uuid else f"{_ID_PREFIX}-{next(_ID_COUNTER):x}"
+        self.game_id = game_id
+        self.tensor_format = tensor_format
+        self.include_fen = include_fen
         self.chess = ChessLogic()
         self.game: Optional[Game] = None
+        self.zobrist = chess.polyglot.zobrist_hash(self.chess.board)
         self._move_count = 0
+        # (game, board_state, updated_at, move_count, status, state dict) from the last state()
+        self._state_cache: Optional[Tuple[Any, ...]] = None
+    
+    @classmethod
+    def from_game(
+        cls,
+        game: Game,
+        tensor_format: TensorFormat = "list",
+        include_fen: bool = True,
+    ) -> "ChessOpenEnv":
+        """Rebuild an environment around a stored game.
+        
+        Args:
+            game: Game whose current position is loaded
+            tensor_format: Observation board_tensor encoding
+            include_fen: Put the FEN in observations
+            
+        Returns:
+            Environment positioned at the game's FEN
+        """
+        env = cls(game_id=game.game_id, tensor_format=tensor_format, include_fen=include_fen)
+        env.game = game
+        env.chess = ChessLogic(game.board_state.fen)
+        env.zobrist = chess.polyglot.zobrist_hash(env.chess.board)
+        env._move_count = game.total_moves
+        return env
         
     def reset(self, fen: Optional[str] = None, **kwargs) -> Tuple[Dict[str, Any], Dict[str, Any]]:
         """Reset environment to initial state.
@@ -53,6 +144,7 @@ class ChessOpenEnv:
         """
         # Reset chess logic
         board_state = self.chess.reset(fen)
+        self.zobrist = chess.polyglot.zobrist_hash(self.chess.board)
         
         # Create new game
         white_personality = kwargs.get("white_personality", "balanced")
@@ -76,10 +168,7 @@ class ChessOpenEnv:
         
         # Build observation
         observation = {
-            "board_state": {
-                "fen": board_state.fen,
-                "board_tensor": board_state.board_tensor.tolist(),
-            },
+            "board_state": self._board_observation(board_state),
             "legal_moves": board_state.legal_moves,
             "current_player": board_state.current_player,
             "is_check": board_state.is_check,
@@ -122,53 +211,34 @@ class ChessOpenEnv:
         if not self.chess.is_legal_move(action):
             raise ValueError(
                 f"Illegal move: {action}. "
-                f"Legal moves: {', '.join(self.chess.get_legal_moves()[:5])}..."
+                f"Legal moves: {', '.join(self.chess.get_legal_moves(limit=5))}..."
             )
         
-        # Get SAN before applying move
-        san_move = self.chess.get_san(action)
-        
-        # Apply move and get new state
-        board_state = self.chess.apply_move(action)
+        # Apply move and get new state; SAN comes from the same push
+        san_move, board_state = self.chess.apply_move_with_san(action)
+        self.zobrist = chess.polyglot.zobrist_hash(self.chess.board)
         self._move_count += 1
         
         # Update game state
         self.game.board_state = board_state
         
-        # Check for terminal state
-        is_terminal, terminal_reason = self.chess.is_terminal()
-        terminated = is_terminal
+        # Check for terminal state; reason and result come from one check
+        terminal_reason, result = self.chess.outcome()
+        terminated = terminal_reason is not None
         truncated = False  # Chess games end naturally, not truncated
         
         # Calculate reward (sparse rewards only at terminal states)
         reward = 0.0
         if terminated:
-            result = self.chess.get_result()
-            if result == "1-0":  # White wins
-                self.game.update_status(GameStatus.CHECKMATE, GameResult.WHITE_WINS)
-                reward = 1.0 if board_state.current_player == "black" else -1.0
-            elif result == "0-1":  # Black wins
-                self.game.update_status(GameStatus.CHECKMATE, GameResult.BLACK_WINS)
-                reward = 1.0 if board_state.current_player == "white" else -1.0
-            elif result == "1/2-1/2":  # Draw
-                status_map = {
-                    "stalemate": GameStatus.STALEMATE,
-                    "insufficient_material": GameStatus.DRAW,
-                    "fifty_move_rule": GameStatus.DRAW,
-                    "threefold_repetition": GameStatus.DRAW,
-                }
-                self.game.update_status(
-                    status_map.get(terminal_reason, GameStatus.DRAW),
-                    GameResult.DRAW
-                )
-                reward = 0.0
+            reward, status, game_result = _TERMINAL_TABLE.get(
+                (result, board_state.current_player),
+                (0.0, _DRAW_STATUS.get(terminal_reason, GameStatus.DRAW), GameResult.DRAW),
+            )
+            self.game.update_status(status, game_result)
         
         # Build observation
         observation = {
-            "board_state": {
-                "fen": board_state.fen,
-                "board_tensor": board_state.board_tensor.tolist(),
-            },
+            "board_state": self._board_observation(board_state),
             "legal_moves": board_state.legal_moves,
             "current_player": board_state.current_player,
             "is_check": board_state.is_check,
@@ -189,32 +259,74 @@ class ChessOpenEnv:
         
         return observation, reward, terminated, truncated, info
     
+    def _board_observation(self, board_state: BoardState) -> Dict[str, Any]:
+        """Build the observation's board_state entry in the configured tensor format."""
+        if self.tensor_format == "ndarray":
+            observation = {"board_tensor": board_state.board_tensor}
+        elif self.tensor_format == "packed":
+            observation = {
+                "board_tensor_packed": board_state.board_tensor_packed,
+                "board_tensor_shape": board_state.board_tensor.shape,
+            }
+        elif self.tensor_format == "bytes":
+            tensor = board_state.board_tensor
+            observation = {
+                "board_tensor": tensor.tobytes(),
+                "board_tensor_shape": tensor.shape,
+                "board_tensor_dtype": str(tensor.dtype),
+            }
+        else:
+            observation = {"board_tensor": board_state.board_tensor_list}
+        
+        if self.include_fen:
+            observation["fen"] = board_state.fen
+        return observation
+    
     def state(self) -> Dict[str, Any]:
         """Get current game state metadata.
         
+        The dict is cached until the game, board state, updated_at, move count
+        or status changes, so callers must not mutate it.
+        
         Returns:
             Dict with game metadata (id, status, move_count, etc.)
         """
-        if self.game is None:
+        game = self.game
+        if game is None:
             return {
                 "game_id": self.game_id,
                 "status": "not_initialized",
                 "message": "Call reset() to initialize environment",
             }
         
-        return {
+        cache = self._state_cache
+        if (
+            cache is not None
+            and cache[0] is game
+            and cache[1] is game.board_state
+            and cache[2] == game.updated_at
+            and cache[3] == self._move_count
+            and cache[4] is game.status
+        ):
+            return cache[5]
+        
+        state = {
             "game_id": self.game_id,
-            "status": self.game.status.value,
-            "result": self.game.result.value,
+            "status": game.status.value,
+            "result": game.result.value,
             "move_count": self._move_count,
-            "current_player": self.game.board_state.current_player,
-            "fen": self.game.board_state.fen,
-            "is_terminal": self.game.is_terminal(),
-            "white_agent": self.game.white_agent_id,
-            "black_agent": self.game.black_agent_id,
-            "created_at": self.game.created_at.isoformat(),
-            "updated_at": self.game.updated_at.isoformat(),
+            "current_player": game.board_state.current_player,
+            "fen": game.board_state.fen,
+            "is_terminal": game.is_terminal(),
+            "white_agent": game.white_agent_id,
+            "black_agent": game.black_agent_id,
+            "created_at": game.created_at.isoformat(),
+            "updated_at": game.updated_at.isoformat(),
         }
+        self._state_cache = (
+            game, game.board_state, game.updated_at, self._move_count, game.status, state
+        )
+        return state
     
     def close(self) -> None:
         """Clean up environment resources.
@@ -251,3 +363,116 @@ class ChessOpenEnv:
             List of moves in UCI notation
         """
         return self.chess.get_legal_moves() if self.chess else []
+
+
+class VectorChessEnv:
+    """Batch of independent chess environments stepped together.
+    
+    Observations come back as stacked numpy arrays written into buffers
+    allocated once, so a training loop pays no per-step allocation for the
+    batch. The buffers are reused by the next reset() or step(); copy them
+    to keep a result.
+    
+    Attributes:
+        envs: The sub-environments, in batch order
+    """
+    
+    def __init__(self, n: int, threaded: bool = False, max_workers: Optional[int] = None):
+        """Initialize the batch.
+        
+        Args:
+            n: Number of environments
+            threaded: Step sub-environments on a thread pool instead of in a loop
+            max_workers: Thread pool size (defaults to the CPU count)
+            
+        Raises:
+            ValueError: If n is not positive
+        """
+        if n < 1:
+            raise ValueError(f"Batch size must be positive, got {n}")
+        
+        self.envs = [ChessOpenEnv(tensor_format="ndarray", include_fen=False) for _ in range(n)]
+        self._tensors = np.empty((n, 8, 8, 12), dtype=np.float32)
+        self._rewards = np.zeros(n, dtype=np.float32)
+        self._terminated = np.zeros(n, dtype=bool)
+        self._executor = (
+            ThreadPoolExecutor(max_workers=max_workers or os.cpu_count(), thread_name_prefix="vector-env")
+            if threaded else None
+        )
+    
+    def __len__(self) -> int:
+        """Number of environments in the batch."""
+        return len(self.envs)
+    
+    def reset(self, fens: Optional[Sequence[Optional[str]]] = None) -> Dict[str, Any]:
+        """Reset every environment.
+        
+        Args:
+            fens: Optional starting FEN per environment (None for the initial position)
+            
+        Returns:
+            Batched observation, see step()
+        """
+        if fens is not None and len(fens) != len(self.envs):
+            raise ValueError(f"Expected {len(self.envs)} FENs, got {len(fens)}")
+        
+        self._rewards.fill(0.0)
+        self._terminated.fill(False)
+        for i, env in enumerate(self.envs):
+            observation, _ = env.reset(fen=fens[i] if fens is not None else None)
+            self._tensors[i] = observation["board_state"]["board_tensor"]
+        
+        return self._batch()
+    
+    def step(self, actions: Sequence[Optional[str]]) -> Dict[str, Any]:
+        """Apply one move in each environment.
+        
+        Args:
+            actions: UCI move per environment; None leaves that environment
+                unchanged (e.g. a finished game waiting for reset)
+            
+        Returns:
+            Dict with board_tensors (n, 8, 8, 12), rewards (n,), terminated (n,)
+            and legal_moves (list of UCI lists)
+            
+        Raises:
+            ValueError: If the action count is wrong or a move is illegal
+        """
+        if len(actions) != len(self.envs):
+            raise ValueError(f"Expected {len(self.envs)} actions, got {len(actions)}")
+        
+        if self._executor is not None:
+            # list() surfaces the first exception raised by a sub-environment
+            list(self._executor.map(self._step_one, range(len(self.envs)), actions))
+        else:
+            for i, action in enumerate(actions):
+                self._step_one(i, action)
+        
+        return self._batch()
+    
+    def _step_one(self, i: int, action: Optional[str]) -> None:
+        """Step sub-environment i and write its results into the batch buffers."""
+        if action is None:
+            self._rewards[i] = 0.0
+            return
+        
+        observation, reward, terminated, _, _ = self.envs[i].step(action)
+        self._tensors[i] = observation["board_state"]["board_tensor"]
+        self._rewards[i] = reward
+        self._terminated[i] = terminated
+    
+    def _batch(self) -> Dict[str, Any]:
+        """Package the batch buffers as an observation."""
+        return {
+            "board_tensors": self._tensors,
+            "rewards": self._rewards,
+            "terminated": self._terminated,
+            "legal_moves": [env.get_legal_moves() for env in self.envs],
+        }
+    
+    def close(self) -> None:
+        """Close every environment and stop the thread pool."""
+        for env in self.envs:
+            env.close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
@@ -3,14 +3,118 @@
 Provides high-level chess operations with validation and error handling.
 """
 
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 import chess
-import chess.svg
 from src.models.board_state import BoardState
 
 
+@lru_cache(maxsize=1 << 16)
+def _parse_uci(move_uci: str) -> chess.Move:
+    """Parse a UCI move string, reusing the Move for strings seen before.
+    
+    Chess has only a few thousand distinct UCI moves. Moves are never mutated
+    after parsing, so sharing instances is safe; invalid strings raise
+    ValueError every time since exceptions aren't cached.
+    """
+    return chess.Move.from_uci(move_uci)
+
+
+@lru_cache(maxsize=16)
+def _svg_template(size: int) -> Tuple[str, str, List[str], List[str], Dict[str, str], List[Dict[str, str]]]:
+    """Split a python-chess board rendering into reusable parts for one size.
+    
+    Everything except the ASCII description, the piece definitions, the
+    last-move squares and the piece placements is the same for every
+    position, so it is rendered once and sliced out of a reference SVG.
+    
+    Returns:
+        Tuple of (svg header, frame and coordinates, square rects by square,
+        last-move square rects by square, piece <defs> by symbol, piece
+        <use> elements by square and symbol)
+    """
+    # Imported here so headless users never load chess.svg and ElementTree
+    import re
+    import xml.etree.ElementTree as ET
+    import chess.svg
+    
+    reference = chess.svg.board(chess.Board(), size=size, coordinates=True)
+    square_rects = re.findall(r'<rect [^>]*class="square [^>]*/>', reference)
+    header = reference[:reference.index("<desc>")]
+    static = reference[reference.index("</defs>") + len("</defs>"):reference.index(square_rects[0])]
+    
+    lastmove_rects = []
+    for square, rect in zip(chess.SQUARES, square_rects):
+        shade = "light" if chess.BB_LIGHT_SQUARES & chess.BB_SQUARES[square] else "dark"
+        name = chess.SQUARE_NAMES[square]
+        lastmove_rects.append(
+            rect.replace(f'class="square {shade} {name}"', f'class="square {shade} lastmove {name}"')
+            .replace(chess.svg.DEFAULT_COLORS[f"square {shade}"], chess.svg.DEFAULT_COLORS[f"square {shade} lastmove"])
+        )
+    
+    piece_defs = {
+        symbol: ET.tostring(ET.fromstring(chess.svg.PIECES[symbol])).decode("utf-8")
+        for symbol in chess.svg.PIECES
+    }
+    
+    piece_uses = []
+    for rect in square_rects:
+        x, y = re.search(r'x="(\d+)" y="(\d+)"', rect).groups()
+        uses = {}
+        for symbol in chess.svg.PIECES:
+            piece = chess.Piece.from_symbol(symbol)
+            href = f"#{chess.COLOR_NAMES[piece.color]}-{chess.PIECE_NAMES[piece.piece_type]}"
+            uses[symbol] = f'<use href="{href}" xlink:href="{href}" transform="translate({x}, {y})" />'
+        piece_uses.append(uses)
+    
+    return header, static, square_rects, lastmove_rects, piece_defs, piece_uses
+
+
+@lru_cache(maxsize=1024)
+def _board_svg(fen: str, size: int, lastmove_uci: Optional[str] = None) -> str:
+    """Render a position as SVG; the output depends only on these arguments.
+    
+    Byte-for-byte the same as chess.svg.board(board, size=size,
+    lastmove=lastmove, coordinates=True), but assembled from the per-size
+    template instead of building an ElementTree of ~150 elements.
+    """
+    header, static, square_rects, lastmove_rects, piece_defs, piece_uses = _svg_template(size)
+    board = chess.BaseBoard(fen.split(" ", 1)[0])
+    
+    lastmove = _parse_uci(lastmove_uci) if lastmove_uci else None
+    highlighted = (lastmove.from_square, lastmove.to_square) if lastmove else ()
+    
+    defs = "".join(
+        piece_defs[chess.Piece(piece_type, color).symbol()]
+        for color in chess.COLORS
+        for piece_type in chess.PIECE_TYPES
+        if board.pieces_mask(piece_type, color)
+    )
+    rects = "".join(
+        lastmove_rects[square] if square in highlighted else square_rects[square]
+        for square in chess.SQUARES
+    )
+    uses = "".join(
+        piece_uses[square][board.piece_at(square).symbol()]
+        for square in chess.scan_forward(board.occupied)
+    )
+    
+    return (
+        f"{header}<desc><pre>{board}</pre></desc>"
+        f"{'<defs>' + defs + '</defs>' if defs else '<defs />'}"
+        f"{static}{rects}{uses}</svg>"
+    )
+
+
 class ChessLogic:
-    """Wrapper around python-chess for chess operations."""
+    """Wrapper around python-chess for chess operations.
+    
+    Legal moves are generated at most once per position: the list, its UCI
+    strings and a set of those strings are cached against the board's
+    transposition key, so they stay valid however the board is changed.
+    """
+    
+    __slots__ = ("board", "_lm_cache_key", "_lm_cache")
     
     def __init__(self, fen: Optional[str] = None):
         """Initialize chess logic with optional starting position.
@@ -19,6 +123,22 @@ class ChessLogic:
             fen: FEN string for starting position (default: standard starting position)
         """
         self.board = chess.Board(fen) if fen else chess.Board()
+        self._lm_cache_key: Optional[Tuple[Any, ...]] = None
+        self._lm_cache: Tuple[List[chess.Move], List[str], FrozenSet[str]] = ([], [], frozenset())
+    
+    def _legal_moves(self) -> Tuple[List[chess.Move], List[str], FrozenSet[str]]:
+        """Get legal moves for the current position, generating them on a cache miss.
+        
+        Returns:
+            Tuple of (moves, UCI strings, set of UCI strings); don't mutate them
+        """
+        key = self.board._transposition_key()
+        if key != self._lm_cache_key:
+            moves = list(self.board.legal_moves)
+            ucis = [move.uci() for move in moves]
+            self._lm_cache = (moves, ucis, frozenset(ucis))
+            self._lm_cache_key = key
+        return self._lm_cache
     
     def is_legal_move(self, move_uci: str) -> bool:
         """Check if a move is legal in the current position.
@@ -29,10 +149,31 @@ class ChessLogic:
         Returns:
             True if move is legal, False otherwise
         """
+        # Set lookup when this position's moves are already cached; otherwise
+        # validate just this move instead of generating all of them. is_legal
+        # also accepts king-takes-rook castling (e.g. e1h1).
+        if self.board._transposition_key() == self._lm_cache_key and move_uci in self._lm_cache[2]:
+            return True
+        
+        try:
+            move = _parse_uci(move_uci)
+        except ValueError:
+            return False
+        
+        # Cheap bitboard rejections before the full king-safety check: the
+        # source square must hold a piece of the side to move, and only pawns
+        # reaching the back rank promote
+        if self.board.color_at(move.from_square) != self.board.turn:
+            return False
+        if move.promotion and (
+            not self.board.pawns & chess.BB_SQUARES[move.from_square]
+            or not chess.BB_SQUARES[move.to_square] & chess.BB_BACKRANKS
+        ):
+            return False
+        
         try:
-            move = chess.Move.from_uci(move_uci)
-            return move in self.board.legal_moves
-        except (ValueError, AssertionError):
+            return self.board.is_legal(move)
+        except AssertionError:
             return False
     
     def apply_move(self, move_uci: str) -> BoardState:
@@ -50,20 +191,43 @@ class ChessLogic:
         if not self.is_legal_move(move_uci):
             raise ValueError(f"Illegal move: {move_uci}")
         
-        try:
-            move = chess.Move.from_uci(move_uci)
-            self.board.push(move)
-            return BoardState.from_board(self.board)
-        except (ValueError, AssertionError) as e:
-            raise ValueError(f"Invalid move format '{move_uci}': {e}")
+        # Already validated, so push without python-chess checking it again
+        self.board.push(_parse_uci(move_uci))
+        return self.get_board_state()
+    
+    def apply_move_with_san(self, move_uci: str) -> Tuple[str, BoardState]:
+        """Apply a move, returning its SAN along with the new board state.
+        
+        Cheaper than get_san followed by apply_move: the move is validated
+        once, and SAN's check/mate suffix comes from the push itself instead
+        of a separate push and pop.
+        
+        Args:
+            move_uci: Move in UCI notation
+            
+        Returns:
+            Tuple of (SAN of the move, new BoardState)
+            
+        Raises:
+            ValueError: If move is illegal or invalid format
+        """
+        if not self.is_legal_move(move_uci):
+            raise ValueError(f"Illegal move: {move_uci}")
+        
+        san = self.board.san_and_push(_parse_uci(move_uci))
+        return san, self.get_board_state()
     
-    def get_legal_moves(self) -> List[str]:
+    def get_legal_moves(self, limit: Optional[int] = None) -> List[str]:
         """Get all legal moves in current position.
         
+        Args:
+            limit: Return at most this many moves (all if None)
+            
         Returns:
             List of moves in UCI notation
         """
-        return [move.uci() for move in self.board.legal_moves]
+        ucis = self._legal_moves()[1]
+        return ucis[:limit] if limit is not None else list(ucis)
     
     def get_board_state(self) -> BoardState:
         """Get current board state.
@@ -71,7 +235,7 @@ class ChessLogic:
         Returns:
             BoardState object with current position
         """
-        return BoardState.from_board(self.board)
+        return BoardState.from_board(self.board, legal_moves=list(self._legal_moves()[1]))
     
     def render_svg(self, size: int = 400, lastmove: Optional[chess.Move] = None) -> str:
         """Render board as SVG for visualization.
@@ -83,12 +247,7 @@ class ChessLogic:
         Returns:
             SVG string representation of the board
         """
-        return chess.svg.board(
-            self.board,
-            size=size,
-            lastmove=lastmove,
-            coordinates=True,
-        )
+        return _board_svg(self.board.fen(), size, lastmove.uci() if lastmove else None)
     
     def is_terminal(self) -> Tuple[bool, Optional[str]]:
         """Check if game has ended and return reason.
@@ -99,10 +258,8 @@ class ChessLogic:
             - reason: 'checkmate', 'stalemate', 'insufficient_material', 
                      'fifty_move_rule', 'threefold_repetition', or None
         """
-        if self.board.is_checkmate():
-            return True, "checkmate"
-        if self.board.is_stalemate():
-            return True, "stalemate"
+        if not self._legal_moves()[0]:
+            return True, "checkmate" if self.board.is_check() else "stalemate"
         if self.board.is_insufficient_material():
             return True, "insufficient_material"
         if self.board.is_seventyfive_moves():  # 50-move rule
@@ -111,21 +268,32 @@ class ChessLogic:
             return True, "threefold_repetition"
         return False, None
     
+    def outcome(self) -> Tuple[Optional[str], str]:
+        """Check for the end of the game once, returning reason and result together.
+        
+        Returns:
+            Tuple of (reason, result)
+            - reason: as returned by is_terminal, or None if the game is ongoing
+            - result: '1-0', '0-1', '1/2-1/2', or '*' (ongoing)
+        """
+        is_terminal, reason = self.is_terminal()
+        if not is_terminal:
+            return None, "*"
+        
+        if reason == "checkmate":
+            # Winner is the opposite of current turn (who just got checkmated)
+            return reason, "1-0" if self.board.turn == chess.BLACK else "0-1"
+        
+        # All other terminal states are draws
+        return reason, "1/2-1/2"
+    
     def get_result(self) -> str:
         """Get game result in PGN format.
         
         Returns:
             '1-0' (white wins), '0-1' (black wins), '1/2-1/2' (draw), or '*' (ongoing)
         """
-        if not self.is_terminal()[0]:
-            return "*"
-        
-        if self.board.is_checkmate():
-            # Winner is the opposite of current turn (who just got checkmated)
-            return "1-0" if self.board.turn == chess.BLACK else "0-1"
-        else:
-            # All other terminal states are draws
-            return "1/2-1/2"
+        return self.outcome()[1]
     
     def get_fen(self) -> str:
         """Get FEN string of current position.
@@ -144,8 +312,12 @@ class ChessLogic:
         Returns:
             BoardState of the new position
         """
-        self.board = chess.Board(fen) if fen else chess.Board()
-        return BoardState.from_board(self.board)
+        # Reuse the board rather than allocating a new one per game
+        if fen:
+            self.board.set_fen(fen)
+        else:
+            self.board.reset()
+        return self.get_board_state()
     
     def get_san(self, move_uci: str) -> str:
         """Convert UCI move to SAN notation.
@@ -160,9 +332,8 @@ class ChessLogic:
             ValueError: If move is invalid
         """
         try:
-            move = chess.Move.from_uci(move_uci)
-            if move not in self.board.legal_moves:
+            if not self.is_legal_move(move_uci):
                 raise ValueError(f"Illegal move: {move_uci}")
-            return self.board.san(move)
+            return self.board.san(_parse_uci(move_uci))
         except (ValueError, AssertionError) as e:
             raise ValueError(f"Invalid move '{move_uci}': {e}")
@@ -7,20 +7,148 @@ Generates engaging, energizing commentary for chess moves based on:
 - Historical chess references
 """
 
-from typing import Optional, Dict, Any
+from collections import OrderedDict, deque
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple
+import asyncio
+import hashlib
+import random
+import string
 import structlog
 import os
-from openai import AzureOpenAI
+import time
+import chess
+from openai import AsyncAzureOpenAI, APIConnectionError, APIStatusError
 
+from src.utils.opening_detector import detect_opening
+from src.utils.strategic_analyzer import analyze_position, format_themes_for_commentary
 from .triggers import CommentaryTrigger, TriggerContext
 from .realtime_audio_client import get_realtime_client
 
 logger = structlog.get_logger()
 
+# Base delay (seconds) for jittered exponential backoff between completion retries
+_RETRY_BASE_DELAY = 0.5
+# Longest Retry-After header honoured; longer waits fall back to backoff
+_MAX_RETRY_AFTER = 30.0
+# detect_opening only matches this many opening moves, so longer histories
+# share a cache entry with their prefix
+_OPENING_MOVES = 10
+
+
+def _compile_template(template: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """Parse a str.format template into (literal text, field name) pairs."""
+    return tuple(
+        (literal, field_name)
+        for literal, field_name, _, _ in string.Formatter().parse(template)
+    )
+
+
+def _render_template(compiled: Tuple[Tuple[str, Optional[str]], ...], values: Dict[str, Any]) -> str:
+    """Render a compiled template; same output as str.format for plain {name} fields.
+    
+    Raises:
+        KeyError: If a field has no value
+    """
+    return "".join([
+        literal + format(values[field_name]) if field_name is not None else literal
+        for literal, field_name in compiled
+    ])
+
+
+def _fallback_text(context: TriggerContext) -> str:
+    """Plain move announcement used when no model output is available."""
+    return f"{context.player} plays {context.san_move}"
+
+
+@lru_cache(maxsize=512)
+def _cached_opening(moves: Tuple[str, ...]) -> Optional[Dict[str, str]]:
+    """detect_opening for a move prefix of at most _OPENING_MOVES moves."""
+    return detect_opening(list(moves))
+
+
+@lru_cache(maxsize=512)
+def _cached_themes(fen: str) -> Dict[str, List[str]]:
+    """analyze_position by FEN; treat the result as read-only.
+    
+    Raises:
+        ValueError: If the FEN is invalid
+    """
+    return analyze_position(chess.Board(fen))
+
+
+def _is_retryable(error: Exception) -> bool:
+    """True for rate limits (429), server errors (5xx) and connection failures."""
+    if isinstance(error, APIStatusError):
+        return error.status_code == 429 or error.status_code >= 500
+    return isinstance(error, APIConnectionError)
+
+
+def _retry_delay(error: Exception, attempt: int) -> float:
+    """Seconds to wait before retry number attempt + 1.
+    
+    Uses the server's Retry-After header when it gives a short wait, otherwise
+    full-jitter exponential backoff so throttled callers don't retry in step.
+    """
+    response = getattr(error, "response", None)
+    if response is not None:
+        try:
+            retry_after = float(response.headers.get("retry-after", ""))
+        except ValueError:
+            retry_after = None
+        if retry_after is not None and 0 < retry_after <= _MAX_RETRY_AFTER:
+            return retry_after
+    return random.uniform(0, _RETRY_BASE_DELAY * 2 ** attempt)
+
 
 class CommentaryGenerator:
     """Generates exciting chess commentary."""
     
+    # System prompt for text commentary (chat completions); one shared string,
+    # sent as the first message so it forms a stable cacheable prefix
+    SYSTEM_PROMPT = """You are a grandmaster-level chess commentator with ANALYTICAL depth and CURIOSITY.
+                            
+KEY RULES:
+1. NO SYCOPHANCY - NEVER say "Excellent choice", "Solid play", "Great move", "Building pressure", "Sets the stage"
+2. Be CURIOUS and ANALYTICAL - "Interesting", "This aims for...", "The idea is...", "Following the plan..."
+3. For OPENING moves (moves 1-15): ALWAYS connect to classical games, historical players, or theoretical lines
+   - Example: "This follows Fischer's approach in the 1972 World Championship"
+   - Example: "The Najdorf variation, Kasparov's favorite weapon"
+   - Example: "Echoing Botvinnik-Tal, 1960, Game 6"
+   - Example: "A theoretical novelty—deviating from the main line"
+4. Be ANALYTICAL not PRAISING - Focus on PLANS, IDEAS, and CONSEQUENCES
+5. Match tone to situation (critical for blunders, curious/analytical for opening, clinical for tactics)
+6. Reference the actual player who moved (don't mix up Black and White)
+7. VARY vocabulary - never repeat the same phrases
+                            
+FORBIDDEN PHRASES (NEVER USE):
+- "Excellent choice!" ❌
+- "Solid play!" ❌
+- "Great move!" ❌
+- "Building pressure!" ❌
+- "Sets the stage!" ❌
+- "With purpose!" ❌
+- "Right out of the gate!" ❌
+- "Let's see how [opponent] responds!" ❌
+
+GOOD examples for OPENING moves:
+- "Nf3 develops the knight, following the Italian Game setup seen in Morphy's games"
+- "This transpose into the Ruy Lopez, a favorite of Capablanca"
+- "The Sicilian Defense—Black invites sharp tactical play"
+- "Following the main theoretical line of the King's Indian"
+- "An interesting sideline, avoided by most top players"
+                            
+GOOD examples for MIDDLEGAME:
+- "The position becomes complicated after this"
+- "This creates concrete threats on the kingside"
+- "An interesting choice—White invites tactical complications"
+- "The position resembles Kasparov-Karpov 1985"
+                            
+Bad examples (NEVER use):
+- "Excellent choice!" ❌
+- "Solid play that sets the stage for a powerful middle game!" ❌
+- "Building pressure on White right out of the gate!" ❌"""
+    
     # Prompt templates for different trigger types
     PROMPT_TEMPLATES = {
         CommentaryTrigger.BLUNDER: """You are a grandmaster-level chess commentator analyzing a BLUNDER!
@@ -289,15 +417,73 @@ CRITICAL RULES:
 """,
     }
     
+    # Sampling temperature by trigger; checkmates and game starts are stock
+    # situations that don't need variety, so their responses stay consistent
+    # and worth caching. Other triggers use DEFAULT_TEMPERATURE.
+    DEFAULT_TEMPERATURE = 0.8
+    _TRIGGER_TEMPERATURE = {
+        CommentaryTrigger.CHECKMATE: 0.0,
+        CommentaryTrigger.GAME_START: 0.2,
+        CommentaryTrigger.BLUNDER: 0.5,
+        CommentaryTrigger.CRITICAL_MISTAKE: 0.5,
+    }
+    
+    # Output token budget by trigger, sized to the sentence count each template
+    # asks for (2-3 sentences vs 4-6); other triggers use DEFAULT_MAX_TOKENS
+    DEFAULT_MAX_TOKENS = 150
+    _TRIGGER_MAX_TOKENS = {
+        CommentaryTrigger.TACTICAL: 80,
+        CommentaryTrigger.SACRIFICE: 80,
+        CommentaryTrigger.DEFENSIVE_BRILLIANCE: 80,
+        CommentaryTrigger.GAME_START: 80,
+        CommentaryTrigger.POSITIONAL_MASTERCLASS: 90,
+        CommentaryTrigger.BLUNDER: 180,
+        CommentaryTrigger.BRILLIANT: 180,
+        CommentaryTrigger.CRITICAL_MISTAKE: 180,
+        CommentaryTrigger.CHECKMATE: 200,
+        CommentaryTrigger.STRATEGIC_OVERVIEW: 220,
+    }
+    
+    # Commentary is one paragraph; stop if the model starts a new section
+    STOP_SEQUENCES = ["\n\n\n"]
+    
+    # PROMPT_TEMPLATES parsed once into (literal, field) pairs for _render_template
+    _COMPILED_TEMPLATES = {
+        trigger: _compile_template(text) for trigger, text in PROMPT_TEMPLATES.items()
+    }
+    
     def __init__(self):
         """Initialize commentary generator with Azure OpenAI."""
         # Get configuration from environment
         self.mode = os.getenv("COMMENTARY_MODE", "text")  # audio, text, or both
         self.voice_style = os.getenv("COMMENTARY_VOICE_STYLE", "excited")
         
+        # Generated text/audio by prompt hash (LRU); the same trigger, move and
+        # position recur across games and need no second model call
+        self.cache_size = int(os.getenv("COMMENTARY_CACHE_SIZE", "256"))
+        self._response_cache: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        
+        # Generations currently running by cache key, and a cap on concurrent
+        # model calls so many games at once don't burst into rate limits
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self.max_concurrency = int(os.getenv("COMMENTARY_MAX_CONCURRENCY", "8"))
+        self._completion_slots = asyncio.Semaphore(self.max_concurrency)
+        
+        # Retries and circuit breaker for the text client: once the primary
+        # deployment fails breaker_threshold times within a minute (429/5xx),
+        # all completions go to the fallback deployment for breaker_cooldown seconds
+        self.max_retries = int(os.getenv("COMMENTARY_MAX_RETRIES", "2"))
+        self.breaker_threshold = int(os.getenv("COMMENTARY_BREAKER_THRESHOLD", "5"))
+        self.breaker_cooldown = float(os.getenv("COMMENTARY_BREAKER_COOLDOWN", "30"))
+        self._primary_failures: deque = deque()
+        self._breaker_open_until = 0.0
+        
         # Initialize clients based on mode
         self.text_client = None
+        self.fallback_client = None
         self.audio_client = None
+        self.text_deployment = ""
+        self.fallback_deployment = ""
         
         if self.mode in ["text", "both"]:
             # Initialize text client (GPT-4)
@@ -307,12 +493,28 @@ CRITICAL RULES:
             api_version = os.getenv("AZURE_OPENAI_API_VERSION", "2024-12-01-preview")
             
             if endpoint and api_key:
-                self.text_client = AzureOpenAI(
+                # Async client so a completion doesn't block the event loop;
+                # SDK retries are off because _complete_text retries itself
+                self.text_client = AsyncAzureOpenAI(
                     azure_endpoint=endpoint,
                     api_key=api_key,
                     api_version=api_version,
+                    max_retries=0,
                 )
                 self.text_deployment = deployment
+                
+                # Optional second deployment that takes overflow when the
+                # primary is throttled
+                fallback_endpoint = os.getenv("AZURE_OPENAI_FALLBACK_ENDPOINT")
+                fallback_key = os.getenv("AZURE_OPENAI_FALLBACK_API_KEY")
+                if fallback_endpoint and fallback_key:
+                    self.fallback_client = AsyncAzureOpenAI(
+                        azure_endpoint=fallback_endpoint,
+                        api_key=fallback_key,
+                        api_version=os.getenv("AZURE_OPENAI_FALLBACK_API_VERSION", api_version),
+                        max_retries=0,
+                    )
+                    self.fallback_deployment = os.getenv("AZURE_OPENAI_FALLBACK_DEPLOYMENT_NAME", deployment)
         
         if self.mode in ["audio", "both"]:
             # Initialize audio client (GPT Realtime)
@@ -329,8 +531,9 @@ CRITICAL RULES:
         else:
             logger.info(
                 "commentary_generator_initialized",
-                deployment=os.getenv("AZURE_OPENAI_AUDIO_DEPLOYMENT_NAME" if self.mode == "audio" else "AZURE_OPENAI_DEPLOYMENT_NAME"),
+                deployment=self.audio_client.deployment if self.mode == "audio" else self.text_deployment,
                 mode=self.mode,
+                fallback_configured=self.fallback_client is not None,
             )
     
     def is_available(self) -> bool:
@@ -355,7 +558,7 @@ CRITICAL RULES:
         # Check if any client is available
         if not self.text_client and not self.audio_client:
             return {
-                "text": f"{trigger_context.player} plays {trigger_context.san_move}",
+                "text": _fallback_text(trigger_context),
                 "audio": None,
                 "trigger": trigger_context.trigger.value,
                 "error": "Commentary generator not configured",
@@ -380,170 +583,241 @@ CRITICAL RULES:
                 "player": trigger_context.player,
             }
             
+            params = self._completion_params(trigger_context.trigger)
+            cache_key = self._cache_key(prompt, params)
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                self._response_cache.move_to_end(cache_key)
+                logger.debug("commentary_cache_hit", trigger=trigger_context.trigger.value)
+                result.update(cached)
+                return result
+            
+            # Identical prompts already being generated share that generation
+            pending = self._in_flight.get(cache_key)
+            if pending is None:
+                pending = asyncio.ensure_future(
+                    self._generate_response(prompt, trigger_context, cache_key, params)
+                )
+                self._in_flight[cache_key] = pending
+                pending.add_done_callback(lambda future: self._finish_in_flight(cache_key, future))
+            else:
+                logger.debug("commentary_request_joined", trigger=trigger_context.trigger.value)
+            
+            # Shielded so one caller being cancelled doesn't cancel the shared generation
+            result.update(await asyncio.shield(pending))
+            
+            logger.info(
+                "commentary_generated",
+                trigger=trigger_context.trigger.value,
+                text_length=len(result.get("text", "")),
+                has_audio=result.get("audio") is not None,
+            )
+            
+            return result
+            
+        except Exception as e:
+            logger.error(
+                "commentary_generation_failed",
+                error=str(e),
+                trigger=trigger_context.trigger.value,
+            )
+            return {
+                "text": _fallback_text(trigger_context),
+                "audio": None,
+                "trigger": trigger_context.trigger.value,
+                "error": str(e),
+            }
+    
+    async def _generate_response(
+        self,
+        prompt: str,
+        trigger_context: TriggerContext,
+        cache_key: str,
+        params: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Call the configured model(s) for a prompt and cache the response.
+        
+        At most max_concurrency calls run at once, so bursts from many games
+        queue here instead of hitting the API rate limit together.
+        
+        Args:
+            prompt: Prompt built by _build_prompt
+            trigger_context: Trigger context, for the fallback text
+            cache_key: Response cache key for the prompt
+            params: Sampling parameters for text completions
+            
+        Returns:
+            Dict with the generated text and audio
+        """
+        response: Dict[str, Any] = {}
+        # Audio failures fall back to text; those responses aren't cached
+        audio_failed = False
+        
+        async with self._completion_slots:
             # Route to appropriate client based on mode
             if self.mode == "audio" and self.audio_client:
                 # Audio mode: Use realtime audio API (gpt-realtime-mini)
-                logger.info("using_audio_client", deployment="gpt-realtime-mini")
+                logger.info("using_audio_client", deployment=self.audio_client.deployment)
                 audio_result = await self.audio_client.generate_commentary_audio(
                     prompt,
                     voice_style=self.voice_style,
                 )
-                result["audio"] = audio_result.get("audio")
-                result["text"] = audio_result.get("text", f"{trigger_context.player} plays {trigger_context.san_move}")
+                response["audio"] = audio_result.get("audio")
+                response["text"] = audio_result["text"] if "text" in audio_result else _fallback_text(trigger_context)
+                audio_failed = "error" in audio_result
                 
             elif self.mode == "text" and self.text_client:
                 # Text mode: Use chat completions API (GPT-4)
                 logger.info("using_text_client", deployment=self.text_deployment)
-                response = self.text_client.chat.completions.create(
-                    model=self.text_deployment,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": """You are a grandmaster-level chess commentator with ANALYTICAL depth and CURIOSITY.
-                            
-KEY RULES:
-1. NO SYCOPHANCY - NEVER say "Excellent choice", "Solid play", "Great move", "Building pressure", "Sets the stage"
-2. Be CURIOUS and ANALYTICAL - "Interesting", "This aims for...", "The idea is...", "Following the plan..."
-3. For OPENING moves (moves 1-15): ALWAYS connect to classical games, historical players, or theoretical lines
-   - Example: "This follows Fischer's approach in the 1972 World Championship"
-   - Example: "The Najdorf variation, Kasparov's favorite weapon"
-   - Example: "Echoing Botvinnik-Tal, 1960, Game 6"
-   - Example: "A theoretical novelty—deviating from the main line"
-4. Be ANALYTICAL not PRAISING - Focus on PLANS, IDEAS, and CONSEQUENCES
-5. Match tone to situation (critical for blunders, curious/analytical for opening, clinical for tactics)
-6. Reference the actual player who moved (don't mix up Black and White)
-7. VARY vocabulary - never repeat the same phrases
-                            
-FORBIDDEN PHRASES (NEVER USE):
-- "Excellent choice!" ❌
-- "Solid play!" ❌
-- "Great move!" ❌
-- "Building pressure!" ❌
-- "Sets the stage!" ❌
-- "With purpose!" ❌
-- "Right out of the gate!" ❌
-- "Let's see how [opponent] responds!" ❌
-
-GOOD examples for OPENING moves:
-- "Nf3 develops the knight, following the Italian Game setup seen in Morphy's games"
-- "This transpose into the Ruy Lopez, a favorite of Capablanca"
-- "The Sicilian Defense—Black invites sharp tactical play"
-- "Following the main theoretical line of the King's Indian"
-- "An interesting sideline, avoided by most top players"
-                            
-GOOD examples for MIDDLEGAME:
-- "The position becomes complicated after this"
-- "This creates concrete threats on the kingside"
-- "An interesting choice—White invites tactical complications"
-- "The position resembles Kasparov-Karpov 1985"
-                            
-Bad examples (NEVER use):
-- "Excellent choice!" ❌
-- "Solid play that sets the stage for a powerful middle game!" ❌
-- "Building pressure on White right out of the gate!" ❌"""
-                        },
-                        {
-                            "role": "user",
-                            "content": prompt
-                        }
-                    ],
-                    temperature=0.8,  # Slightly lower for more consistency
-                    max_tokens=150,
-                )
-                result["text"] = response.choices[0].message.content.strip()
-                result["audio"] = None
+                response["text"] = await self._complete_text(prompt, params)
+                response["audio"] = None
                 
             elif self.mode == "both":
-                # Both mode: Generate text first, then audio
+                # Both mode: audio speaks the generated text, so the realtime
+                # session is opened while the text is still being generated
                 if self.text_client:
-                    response = self.text_client.chat.completions.create(
-                        model=self.text_deployment,
-                        messages=[
-                            {
-                                "role": "system",
-                                "content": """You are a grandmaster-level chess commentator with ANALYTICAL depth and CURIOSITY.
-                            
-KEY RULES:
-1. NO SYCOPHANCY - NEVER say "Excellent choice", "Solid play", "Great move", "Building pressure", "Sets the stage"
-2. Be CURIOUS and ANALYTICAL - "Interesting", "This aims for...", "The idea is...", "Following the plan..."
-3. For OPENING moves (moves 1-15): ALWAYS connect to classical games, historical players, or theoretical lines
-   - Example: "This follows Fischer's approach in the 1972 World Championship"
-   - Example: "The Najdorf variation, Kasparov's favorite weapon"
-   - Example: "Echoing Botvinnik-Tal, 1960, Game 6"
-   - Example: "A theoretical novelty—deviating from the main line"
-4. Be ANALYTICAL not PRAISING - Focus on PLANS, IDEAS, and CONSEQUENCES
-5. Match tone to situation (critical for blunders, curious/analytical for opening, clinical for tactics)
-6. Reference the actual player who moved (don't mix up Black and White)
-7. VARY vocabulary - never repeat the same phrases
-                            
-FORBIDDEN PHRASES (NEVER USE):
-- "Excellent choice!" ❌
-- "Solid play!" ❌
-- "Great move!" ❌
-- "Building pressure!" ❌
-- "Sets the stage!" ❌
-- "With purpose!" ❌
-- "Right out of the gate!" ❌
-- "Let's see how [opponent] responds!" ❌
-
-GOOD examples for OPENING moves:
-- "Nf3 develops the knight, following the Italian Game setup seen in Morphy's games"
-- "This transpose into the Ruy Lopez, a favorite of Capablanca"
-- "The Sicilian Defense—Black invites sharp tactical play"
-- "Following the main theoretical line of the King's Indian"
-- "An interesting sideline, avoided by most top players"
-                            
-GOOD examples for MIDDLEGAME:
-- "The position becomes complicated after this"
-- "This creates concrete threats on the kingside"
-- "An interesting choice—White invites tactical complications"
-- "The position resembles Kasparov-Karpov 1985"
-                            
-Bad examples (NEVER use):
-- "Excellent choice!" ❌
-- "Solid play that sets the stage for a powerful middle game!" ❌
-- "Building pressure on White right out of the gate!" ❌"""
-                            },
-                            {
-                                "role": "user",
-                                "content": prompt
-                            }
-                        ],
-                        temperature=0.8,
-                        max_tokens=150,
-                    )
-                    result["text"] = response.choices[0].message.content.strip()
+                    text = asyncio.ensure_future(self._complete_text(prompt, params))
                 else:
-                    result["text"] = f"{trigger_context.player} plays {trigger_context.san_move}"
+                    text = _fallback_text(trigger_context)
                 
                 if self.audio_client:
                     audio_result = await self.audio_client.generate_commentary_audio(
-                        result["text"],
+                        text,
                         voice_style=self.voice_style,
                     )
-                    result["audio"] = audio_result.get("audio")
+                    response["audio"] = audio_result.get("audio")
+                    audio_failed = "error" in audio_result
+                
+                # Text errors propagate from here, as before audio was overlapped
+                response["text"] = text if isinstance(text, str) else await text
+        
+        if not audio_failed and "text" in response:
+            self._cache_response(cache_key, response)
+        
+        return response
+    
+    def _completion_params(self, trigger: CommentaryTrigger) -> Dict[str, Any]:
+        """Chat completion sampling parameters for a trigger."""
+        return {
+            "temperature": self._TRIGGER_TEMPERATURE.get(trigger, self.DEFAULT_TEMPERATURE),
+            "max_tokens": self._TRIGGER_MAX_TOKENS.get(trigger, self.DEFAULT_MAX_TOKENS),
+            "stop": self.STOP_SEQUENCES,
+        }
+    
+    def _finish_in_flight(self, cache_key: str, future: asyncio.Future) -> None:
+        """Forget a finished generation and retrieve its outcome.
+        
+        Retrieving the exception here keeps asyncio from reporting it as never
+        retrieved when every caller waiting on the generation was cancelled.
+        """
+        self._in_flight.pop(cache_key, None)
+        if not future.cancelled():
+            future.exception()
+    
+    def _cache_key(self, prompt: str, params: Dict[str, Any]) -> str:
+        """Hash everything that determines a generated response."""
+        key = "\0".join((self.mode, self.voice_style, self.text_deployment, repr(sorted(params.items())), prompt))
+        return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+    
+    def _cache_response(self, cache_key: str, result: Dict[str, Any]) -> None:
+        """Store a generated response's text and audio, evicting the oldest entry."""
+        if self.cache_size <= 0:
+            return
+        
+        self._response_cache[cache_key] = {"text": result["text"], "audio": result.get("audio")}
+        self._response_cache.move_to_end(cache_key)
+        if len(self._response_cache) > self.cache_size:
+            self._response_cache.popitem(last=False)
+    
+    async def _complete_text(self, prompt: str, params: Dict[str, Any]) -> str:
+        """Generate commentary text with the chat completions API.
+        
+        Args:
+            prompt: User prompt built by _build_prompt
+            params: Sampling parameters from _completion_params
             
-            logger.info(
-                "commentary_generated",
-                trigger=trigger_context.trigger.value,
-                text_length=len(result.get("text", "")),
-                has_audio=result.get("audio") is not None,
-            )
+        Rate limits, server errors and connection failures are retried with
+        backoff. A failed primary call moves the retry to the fallback
+        deployment when one is configured, and while the circuit breaker is
+        open the primary is skipped altogether.
+        
+        Returns:
+            Commentary text
             
-            return result
+        Raises:
+            APIStatusError: If the last attempt is rejected, or on a
+                non-retryable error
+            APIConnectionError: If the last attempt can't reach the endpoint
+        """
+        use_fallback = self.fallback_client is not None and self._breaker_open()
+        
+        for attempt in range(self.max_retries + 1):
+            if use_fallback:
+                client, deployment = self.fallback_client, self.fallback_deployment
+            else:
+                client, deployment = self.text_client, self.text_deployment
             
-        except Exception as e:
-            logger.error(
-                "commentary_generation_failed",
-                error=str(e),
-                trigger=trigger_context.trigger.value,
+            try:
+                # The system prompt is identical on every call and goes first, so
+                # the provider's prompt cache can reuse it as a prefix
+                response = await client.chat.completions.create(
+                    model=deployment,
+                    messages=[
+                        {"role": "system", "content": self.SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt},
+                    ],
+                    **params,
+                )
+                break
+            except (APIStatusError, APIConnectionError) as e:
+                if not _is_retryable(e) or attempt == self.max_retries:
+                    raise
+                
+                logger.warning(
+                    "commentary_completion_retry",
+                    deployment=deployment,
+                    attempt=attempt + 1,
+                    error=str(e),
+                )
+                if not use_fallback:
+                    self._record_primary_failure()
+                    if self.fallback_client is not None:
+                        # Overflow goes straight to the fallback, no backoff
+                        use_fallback = True
+                        continue
+                await asyncio.sleep(_retry_delay(e, attempt))
+        
+        usage = getattr(response, "usage", None)
+        details = getattr(usage, "prompt_tokens_details", None)
+        if usage is not None:
+            logger.debug(
+                "commentary_prompt_tokens",
+                prompt_tokens=usage.prompt_tokens,
+                cached_tokens=getattr(details, "cached_tokens", None),
+            )
+        
+        return response.choices[0].message.content.strip()
+    
+    def _breaker_open(self) -> bool:
+        """Whether the primary deployment is currently being bypassed."""
+        return time.monotonic() < self._breaker_open_until
+    
+    def _record_primary_failure(self) -> None:
+        """Count a retryable primary failure; open the breaker past the threshold."""
+        now = time.monotonic()
+        failures = self._primary_failures
+        failures.append(now)
+        while failures and now - failures[0] > 60:
+            failures.popleft()
+        
+        if len(failures) >= self.breaker_threshold and not self._breaker_open():
+            self._breaker_open_until = now + self.breaker_cooldown
+            failures.clear()
+            logger.warning(
+                "commentary_circuit_opened",
+                cooldown_seconds=self.breaker_cooldown,
+                fallback_configured=self.fallback_client is not None,
             )
-            return {
-                "text": f"{trigger_context.player} plays {trigger_context.san_move}",
-                "audio": None,
-                "trigger": trigger_context.trigger.value,
-                "error": str(e),
-            }
     
     def _build_prompt(
         self,
@@ -559,19 +833,15 @@ Bad examples (NEVER use):
         Returns:
             Formatted prompt string
         """
-        from src.utils.opening_detector import detect_opening
-        from src.utils.strategic_analyzer import analyze_position, format_themes_for_commentary
-        import chess
-        
-        template = self.PROMPT_TEMPLATES.get(
+        template = self._COMPILED_TEMPLATES.get(
             context.trigger,
-            self.PROMPT_TEMPLATES[CommentaryTrigger.TACTICAL]  # Default
+            self._COMPILED_TEMPLATES[CommentaryTrigger.TACTICAL]  # Default
         )
         
         # Extract opening context
         opening_context = "Position from the starting position"
         if game_context and "history" in game_context:
-            opening_info = detect_opening(game_context["history"])
+            opening_info = _cached_opening(tuple(game_context["history"][:_OPENING_MOVES]))
             if opening_info:
                 opening_context = f"{opening_info['name']}. {opening_info['context']}"
         
@@ -579,8 +849,7 @@ Bad examples (NEVER use):
         strategic_themes = "Balanced position"
         try:
             if game_context and "fen" in game_context:
-                board = chess.Board(game_context["fen"])
-                themes_dict = analyze_position(board)
+                themes_dict = _cached_themes(game_context["fen"])
                 strategic_themes = format_themes_for_commentary(themes_dict, context.player.lower())
         except Exception as e:
             logger.warning("strategic_analysis_failed", error=str(e))
@@ -598,13 +867,12 @@ Bad examples (NEVER use):
                 if top_moves and len(top_moves) > 0:
                     # Format top alternatives (top 3)
                     try:
-                        # Use the FEN from before the move was played
-                        # We need to reconstruct the board position before the current move
-                        fen = game_context.get("fen", chess.STARTING_FEN)
-                        board = chess.Board(fen)
+                        # Use the position from before the move was played
+                        if context.fen_before_move:
+                            board = chess.Board(context.fen_before_move)
                         
-                        # If we have move history, rebuild from start to get correct position
-                        if "history" in game_context and game_context["history"]:
+                        # Without it, rebuild from the move history to get the pre-move position
+                        elif "history" in game_context and game_context["history"]:
                             board = chess.Board()
                             for move_uci in game_context["history"][:-1]:  # Exclude last move
                                 try:
@@ -612,6 +880,9 @@ Bad examples (NEVER use):
                                 except:
                                     pass  # Skip invalid moves
                         
+                        else:
+                            board = chess.Board(game_context.get("fen", chess.STARTING_FEN))
+                        
                         alternatives = []
                         for i, (move, cp, pv_line) in enumerate(top_moves[:3]):
                             try:
@@ -625,19 +896,20 @@ Bad examples (NEVER use):
                         if len(top_moves[0]) > 2 and top_moves[0][2]:
                             best_move, best_cp, pv_line = top_moves[0]
                             
-                            # Convert PV line to SAN notation
-                            board_copy = board.copy()
-                            try:
-                                pv_sans = [board_copy.san(best_move)]
-                                board_copy.push(best_move)
-                                
-                                for pv_move in pv_line[:4]:  # Show up to 5 moves total
-                                    pv_sans.append(board_copy.san(pv_move))
-                                    board_copy.push(pv_move)
-                                
+                            # Convert PV line to SAN notation, stopping at the first
+                            # move that doesn't fit the position. The board is built
+                            # above for this prompt only, so the PV is played on it
+                            # directly instead of on a copy
+                            pv_sans = []
+                            for pv_move in [best_move, *pv_line[:4]]:  # Show up to 5 moves total
+                                if not board.is_legal(pv_move):
+                                    break
+                                pv_sans.append(board.san_and_push(pv_move))
+                            
+                            if pv_sans:
                                 best_continuation = " ".join(pv_sans)
-                            except Exception as e:
-                                logger.warning("pv_san_conversion_failed", error=str(e))
+                            else:
+                                logger.warning("pv_san_conversion_failed", move=best_move.uci())
                     except Exception as e:
                         logger.warning("pv_line_formatting_failed", error=str(e))
             
@@ -669,7 +941,7 @@ Bad examples (NEVER use):
         }
         
         try:
-            return template.format(**template_vars)
+            return _render_template(template, template_vars)
         except KeyError as e:
             logger.warning("template_formatting_error", error=str(e), missing_key=str(e))
             # Fallback to simple commentary
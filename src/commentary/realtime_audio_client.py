@@ -4,11 +4,15 @@ Provides audio generation using Azure's GPT Realtime API (gpt-realtime-mini)
 for natural-sounding chess commentary.
 """
 
-from typing import Optional, Dict, Any
+from typing import Awaitable, Optional, Dict, Any, Union
 import structlog
 import os
 import base64
 import asyncio
+import hashlib
+import json
+import tempfile
+import threading
 from openai import AsyncAzureOpenAI
 
 logger = structlog.get_logger()
@@ -25,6 +29,19 @@ class RealtimeAudioClient:
         # Use 2024-10-01-preview for realtime API (latest supported version)
         self.api_version = "2024-10-01-preview"
         
+        # Generated audio on disk by (deployment, voice style, text), so stock
+        # phrases repeated across games and restarts skip the realtime round
+        # trip; least recently used files are evicted past the size limit
+        self.cache_dir = os.getenv(
+            "COMMENTARY_AUDIO_CACHE_DIR",
+            os.path.join(tempfile.gettempdir(), "chess_tts"),
+        )
+        self.cache_max_bytes = int(os.getenv("COMMENTARY_AUDIO_CACHE_MB", "2048")) * 1024 * 1024
+        self._cache_bytes: Optional[int] = None  # Unknown until the first eviction scan
+        # Cache files are written from worker threads; the byte count and
+        # eviction are updated under this lock
+        self._cache_lock = threading.Lock()
+        
         if not all([self.endpoint, self.api_key]):
             logger.warning(
                 "realtime_audio_client_not_configured",
@@ -49,13 +66,15 @@ class RealtimeAudioClient:
     
     async def generate_commentary_audio(
         self,
-        prompt: str,
+        prompt: Union[str, Awaitable[str]],
         voice_style: str = "excited",
     ) -> Dict[str, Any]:
         """Generate audio commentary using GPT Realtime API.
         
         Args:
-            prompt: Commentary prompt/text to speak
+            prompt: Commentary prompt/text to speak, or an awaitable producing
+                it; an awaitable is awaited only once the session is open, so
+                text generation overlaps the connection setup
             voice_style: Voice style (excited/professional/calm)
             
         Returns:
@@ -69,11 +88,16 @@ class RealtimeAudioClient:
                 "error": "Client not configured"
             }
         
+        if isinstance(prompt, str):
+            cached = await self._load_cached(prompt, voice_style)
+            if cached is not None:
+                return cached
+        
         try:
             logger.debug(
                 "generating_audio_commentary",
                 voice_style=voice_style,
-                prompt_length=len(prompt),
+                prompt_length=len(prompt) if isinstance(prompt, str) else None,
             )
             
             audio_chunks = []
@@ -127,6 +151,12 @@ Bad examples (NEVER use):
 - "Building pressure on White right out of the gate!" ❌"""
                 })
                 
+                if not isinstance(prompt, str):
+                    prompt = await prompt
+                    cached = await self._load_cached(prompt, voice_style)
+                    if cached is not None:
+                        return cached
+                
                 # Send the prompt
                 await connection.conversation.item.create(
                     item={
@@ -160,12 +190,16 @@ Bad examples (NEVER use):
                 has_audio=audio_data is not None,
             )
             
-            return {
+            result = {
                 "text": transcript_text or prompt,
                 "audio": audio_data,
                 "format": "pcm16",
                 "voice_style": voice_style,
             }
+            if audio_data is not None:
+                await self._store_cached(prompt, voice_style, result)
+            
+            return result
             
         except Exception as e:
             logger.error(
@@ -174,11 +208,102 @@ Bad examples (NEVER use):
                 voice_style=voice_style,
             )
             return {
-                "text": prompt,
+                "text": prompt if isinstance(prompt, str) else "",
                 "audio": None,
                 "error": str(e),
             }
     
+    def _cache_path(self, prompt: str, voice_style: str) -> str:
+        """File holding the cached audio for a prompt and voice style."""
+        key = "\0".join((self.deployment, voice_style, prompt))
+        return os.path.join(self.cache_dir, hashlib.sha256(key.encode("utf-8")).hexdigest() + ".json")
+    
+    async def _load_cached(self, prompt: str, voice_style: str) -> Optional[Dict[str, Any]]:
+        """Get cached audio for a prompt, or None on a miss or when disabled."""
+        if self.cache_max_bytes <= 0:
+            return None
+        
+        result = await asyncio.to_thread(self._read_cache_file, self._cache_path(prompt, voice_style))
+        if result is not None:
+            logger.debug("audio_cache_hit", voice_style=voice_style)
+        return result
+    
+    async def _store_cached(self, prompt: str, voice_style: str, result: Dict[str, Any]) -> None:
+        """Write generated audio to the disk cache; failures are only logged."""
+        if self.cache_max_bytes <= 0:
+            return
+        
+        await asyncio.to_thread(self._write_cache_file, self._cache_path(prompt, voice_style), result)
+    
+    def _read_cache_file(self, path: str) -> Optional[Dict[str, Any]]:
+        """Read a cache file and mark it recently used."""
+        try:
+            with open(path, encoding="utf-8") as f:
+                result = json.load(f)
+            os.utime(path)
+            return result
+        except (OSError, ValueError):
+            return None
+    
+    def _write_cache_file(self, path: str, result: Dict[str, Any]) -> None:
+        """Atomically write a cache file, evicting old files past the size limit."""
+        data = json.dumps(result).encode("utf-8")
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}-{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("audio_cache_write_failed", error=str(e))
+            return
+        
+        with self._cache_lock:
+            if self._cache_bytes is not None:
+                self._cache_bytes += len(data)
+            if self._cache_bytes is None or self._cache_bytes > self.cache_max_bytes:
+                try:
+                    self._evict_cache_files()
+                except OSError as e:
+                    # The write itself succeeded; rescan on the next one
+                    logger.warning("audio_cache_eviction_failed", error=str(e))
+                    self._cache_bytes = None
+    
+    def _evict_cache_files(self) -> None:
+        """Delete least recently used cache files until under the size limit.
+        
+        Called with _cache_lock held.
+        
+        Raises:
+            OSError: If the cache directory can't be scanned
+        """
+        entries = []
+        with os.scandir(self.cache_dir) as scan:
+            for entry in scan:
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue  # Removed since the listing
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        for _, size, path in sorted(entries):
+            if total <= self.cache_max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            evicted += 1
+        
+        self._cache_bytes = total
+        if evicted:
+            logger.info("audio_cache_evicted", files=evicted, cache_bytes=total)
+    
     async def stream_commentary_audio(
         self,
         prompt: str,
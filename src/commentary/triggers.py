@@ -81,6 +81,9 @@ class TriggerContext:
     threat_detected: Optional[str] = None
     historical_reference: Optional[str] = None
     
+    # Position before the move, so prompts needn't replay the game history
+    fen_before_move: Optional[str] = None
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         return {
@@ -105,6 +108,7 @@ class TriggerContext:
             "tactical_motif": self.tactical_motif,
             "threat_detected": self.threat_detected,
             "historical_reference": self.historical_reference,
+            "fen_before_move": self.fen_before_move,
         }
 
 
@@ -299,6 +303,7 @@ class TriggerDetector:
             is_check=game_context.get("is_check", False),
             is_checkmate=game_context.get("is_checkmate", False),
             tactical_motif=tactical_motif,
+            fen_before_move=move_data.get("fen_before_move"),
         )
     
     def _detect_tactical_pattern(
@@ -4,7 +4,9 @@ Coordinates turn-based gameplay, move validation, and game completion.
 Integrates Stockfish evaluation, opening book, and live commentary.
 """
 
-from typing import Optional, Dict, Any, List
+from concurrent.futures import Executor
+from typing import Optional, Dict, Any, List, Tuple
+import asyncio
 import structlog
 import time
 import chess
@@ -33,6 +35,7 @@ class GameOrchestrator:
         agent_manager: ChessAgentManager,
         enable_evaluation: bool = True,
         enable_commentary: bool = True,
+        executor: Optional[Executor] = None,
     ):
         """Initialize the orchestrator.
         
@@ -40,8 +43,11 @@ class GameOrchestrator:
             agent_manager: Agent manager instance
             enable_evaluation: Whether to enable Stockfish move evaluation
             enable_commentary: Whether to enable live commentary generation
+            executor: Executor for blocking move selection in run_game_step
+                (the event loop's default executor if None)
         """
         self.agent_manager = agent_manager
+        self.executor = executor
         self.enable_evaluation = enable_evaluation
         self.enable_commentary = enable_commentary and os.getenv("COMMENTARY_ENABLED", "true").lower() == "true"
         
@@ -323,11 +329,81 @@ class GameOrchestrator:
             )
             raise
     
+    def _select_move(
+        self,
+        env: ChessOpenEnv,
+        agent_id: str,
+        legal_moves: List[str],
+        move_history: List[str],
+    ) -> str:
+        """Choose the agent's move.
+        
+        Blocking; run_game_step calls it in the orchestrator's executor.
+        
+        Args:
+            env: Chess environment instance
+            agent_id: Current agent identifier
+            legal_moves: Legal moves in UCI notation
+            move_history: Game history
+            
+        Returns:
+            Move in UCI notation
+        """
+        # Get agent move using hybrid selector or fallback to direct agent
+        if self.hybrid_selector:
+            move, move_source = self.hybrid_selector.get_move(
+                agent_id=agent_id,
+                board=env.chess.board,
+                board_state=env.game.board_state,
+                game_history=move_history,
+                game_id=env.game.game_id,
+            )
+            logger.debug(
+                "move_selected",
+                game_id=env.game.game_id,
+                agent=agent_id,
+                move=move,
+                source=move_source,
+            )
+            return move
+        
+        # Fallback to direct agent call
+        return self.agent_manager.get_agent_move(
+            agent_id=agent_id,
+            board_state=env.game.board_state,
+            legal_moves=legal_moves,
+            game_history=move_history,
+        )
+    
+    def _evaluate_selected_move(
+        self,
+        board: chess.Board,
+        move: str,
+        before: Optional[Tuple[Optional[int], list]],
+    ) -> Optional[Dict[str, Any]]:
+        """Evaluate move quality with Stockfish.
+        
+        Args:
+            board: Board position before the move
+            move: Move in UCI notation
+            before: Result of evaluator.analyse_before_move for the board
+            
+        Returns:
+            Evaluation dict, or None if evaluation failed
+        """
+        try:
+            chess_move = chess.Move.from_uci(move)
+            return self.evaluator.evaluate_move(board, chess_move, before=before)
+        except Exception as e:
+            logger.warning("move_evaluation_error", error=str(e))
+            return None
+    
     async def run_game_step(
         self,
         env: ChessOpenEnv,
         agent_id: str,
         move_history: Optional[List[str]] = None,
+        move_timeout: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Execute a single move in a game with Stockfish evaluation.
         
@@ -337,9 +413,16 @@ class GameOrchestrator:
             env: Chess environment instance
             agent_id: Current agent identifier
             move_history: Optional game history
+            move_timeout: Optional limit in seconds on move selection and
+                evaluation. It does not cover commentary, so a move that has
+                been applied is always returned.
             
         Returns:
             Step result with move, observation, and evaluation
+            
+        Raises:
+            asyncio.TimeoutError: If move_timeout expires before a move is
+                applied; the board is left unchanged.
         """
         try:
             # Check if game is already over
@@ -360,43 +443,11 @@ class GameOrchestrator:
                     "message": "No legal moves available",
                 }
             
-            # Get agent move using hybrid selector or fallback to direct agent
-            move_source = None
-            if self.hybrid_selector:
-                move, move_source = self.hybrid_selector.get_move(
-                    agent_id=agent_id,
-                    board=env.chess.board,
-                    board_state=env.game.board_state,
-                    game_history=move_history or [],
-                    game_id=env.game.game_id,
-                )
-                logger.debug(
-                    "move_selected",
-                    game_id=env.game.game_id,
-                    agent=agent_id,
-                    move=move,
-                    source=move_source,
-                )
-            else:
-                # Fallback to direct agent call
-                move = self.agent_manager.get_agent_move(
-                    agent_id=agent_id,
-                    board_state=env.game.board_state,
-                    legal_moves=legal_moves,
-                    game_history=move_history or [],
-                )
-            
-            # Evaluate move quality with Stockfish (if enabled)
-            move_evaluation = None
-            if self.enable_evaluation and self.evaluator:
-                try:
-                    chess_move = chess.Move.from_uci(move)
-                    move_evaluation = self.evaluator.evaluate_move(
-                        env.chess.board,
-                        chess_move
-                    )
-                except Exception as e:
-                    logger.warning("move_evaluation_error", error=str(e))
+            board_before = env.chess.board.copy()
+            move, move_evaluation = await asyncio.wait_for(
+                self._choose_move(env, agent_id, board_before, legal_moves, move_history or []),
+                timeout=move_timeout,
+            )
             
             # Execute move
             observation, reward, terminated, truncated, info = env.step(move)
@@ -576,6 +627,7 @@ class GameOrchestrator:
                             "san_move": info["san_move"],
                             "player": "white" if env.game.board_state.current_player == "black" else "black",
                             "move_number": current_move_number,
+                            "fen_before_move": board_before.fen(),
                         }
                         game_context = {
                             "fen": env.game.board_state.fen,
@@ -666,6 +718,62 @@ class GameOrchestrator:
             )
             raise
     
+    async def _choose_move(
+        self,
+        env: ChessOpenEnv,
+        agent_id: str,
+        board_before: chess.Board,
+        legal_moves: List[str],
+        move_history: List[str],
+    ) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """Select the next move and evaluate it without applying it.
+        
+        Move selection and evaluation block on LLM and engine calls, so they
+        run in the executor to keep the event loop serving other games. The
+        move-independent half of the evaluation runs while the agent is still
+        choosing; the evaluator serialises calls on its engine, so this is
+        safe when the hybrid selector shares it.
+        
+        Args:
+            env: Chess environment instance
+            agent_id: Current agent identifier
+            board_before: Copy of the board before the move
+            legal_moves: Legal moves in UCI notation
+            move_history: Game history
+            
+        Returns:
+            Tuple of (move in UCI notation, evaluation or None)
+        """
+        loop = asyncio.get_running_loop()
+        selection = loop.run_in_executor(
+            self.executor,
+            self._select_move,
+            env,
+            agent_id,
+            legal_moves,
+            move_history,
+        )
+        
+        if not (self.enable_evaluation and self.evaluator):
+            return await selection, None
+        
+        move, before = await asyncio.gather(
+            selection,
+            loop.run_in_executor(
+                self.executor,
+                self.evaluator.analyse_before_move,
+                board_before,
+            ),
+        )
+        move_evaluation = await loop.run_in_executor(
+            self.executor,
+            self._evaluate_selected_move,
+            board_before,
+            move,
+            before,
+        )
+        return move, move_evaluation
+    
     def _build_strategic_overview_context(
         self,
         board: chess.Board,
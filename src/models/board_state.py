@@ -1,19 +1,52 @@
 """BoardState model representing the current state of a chess board."""
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import List, Optional
+from functools import cached_property
+from typing import List, Optional, Tuple
 import numpy as np
 import chess
 
+# Positions recur constantly (openings, self-play), so the move-independent
+# part of a BoardState is shared by transposition key: (read-only tensor,
+# legal moves in UCI, is_check). Bounded LRU; a tensor is 3 KB.
+_SNAPSHOT_CACHE_SIZE = 4096
+_snapshots: "OrderedDict[tuple, Tuple[np.ndarray, Tuple[str, ...], bool]]" = OrderedDict()
+
+
+def _position_snapshot(board: chess.Board) -> Tuple[np.ndarray, Tuple[str, ...], bool]:
+    """Return the cached (tensor, legal moves, is_check) for a position."""
+    key = board._transposition_key()
+    snapshot = _snapshots.get(key)
+    if snapshot is not None:
+        try:
+            _snapshots.move_to_end(key)
+        except KeyError:
+            pass
+        return snapshot
+    
+    tensor = BoardState._board_to_tensor(board)
+    tensor.flags.writeable = False
+    snapshot = (tensor, tuple(move.uci() for move in board.legal_moves), board.is_check())
+    _snapshots[key] = snapshot
+    if len(_snapshots) > _SNAPSHOT_CACHE_SIZE:
+        try:
+            _snapshots.popitem(last=False)
+        except KeyError:
+            pass
+    return snapshot
+
 
 @dataclass
 class BoardState:
     """Represents the current state of a chess board.
     
     Attributes:
-        fen: Forsyth-Edwards Notation string representing the board position
+        fen: Forsyth-Edwards Notation string representing the board position,
+            written on first access from the board snapshot
         board_tensor: 8x8x12 numpy array encoding piece positions
-                     (6 piece types × 2 colors = 12 channels)
+                     (6 piece types × 2 colors = 12 channels); read-only,
+                     since it is shared by every state of the same position
         legal_moves: List of legal moves in UCI notation (e.g., ['e2e4', 'g1f3'])
         current_player: 'white' or 'black'
         is_check: Whether the current player is in check
@@ -21,9 +54,10 @@ class BoardState:
         is_stalemate: Whether the position is a stalemate
         move_count: Number of half-moves (plies) made
         fullmove_number: Current move number in the game
+        board: Snapshot of the position (move stack dropped) the FEN is
+            generated from
     """
     
-    fen: str
     board_tensor: np.ndarray  # Shape: (8, 8, 12)
     legal_moves: List[str] = field(default_factory=list)
     current_player: str = "white"
@@ -32,27 +66,34 @@ class BoardState:
     is_stalemate: bool = False
     move_count: int = 0
     fullmove_number: int = 1
+    board: Optional[chess.Board] = field(default=None, repr=False, compare=False)
     
     @classmethod
-    def from_board(cls, board: chess.Board) -> "BoardState":
+    def from_board(cls, board: chess.Board, legal_moves: Optional[List[str]] = None) -> "BoardState":
         """Create BoardState from python-chess Board object.
         
         Args:
             board: python-chess Board instance
+            legal_moves: The position's legal moves in UCI, if already generated
             
         Returns:
             BoardState instance with current board state
         """
+        board_tensor, cached_moves, is_check = _position_snapshot(board)
+        if legal_moves is None:
+            legal_moves = list(cached_moves)
+        
+        # Mate and stalemate follow from the move list, without generating it again
         return cls(
-            fen=board.fen(),
-            board_tensor=cls._board_to_tensor(board),
-            legal_moves=[move.uci() for move in board.legal_moves],
+            board_tensor=board_tensor,
+            legal_moves=legal_moves,
             current_player="white" if board.turn == chess.WHITE else "black",
-            is_check=board.is_check(),
-            is_checkmate=board.is_checkmate(),
-            is_stalemate=board.is_stalemate(),
+            is_check=is_check,
+            is_checkmate=is_check and not legal_moves,
+            is_stalemate=not is_check and not legal_moves,
             move_count=board.halfmove_clock,
             fullmove_number=board.fullmove_number,
+            board=board.copy(stack=False),
         )
     
     @staticmethod
@@ -70,39 +111,55 @@ class BoardState:
         Returns:
             numpy array of shape (8, 8, 12)
         """
-        tensor = np.zeros((8, 8, 12), dtype=np.float32)
+        # One bitboard per channel (bit i = square i, a1 = 0); as little-endian
+        # bytes each byte is a rank, and unpacking with bitorder="little" puts
+        # file a first, so a single unpack yields (channel, rank, file)
+        white = board.occupied_co[chess.WHITE]
+        black = board.occupied_co[chess.BLACK]
+        bitboards = np.array(
+            [
+                board.pawns & white, board.knights & white, board.bishops & white,
+                board.rooks & white, board.queens & white, board.kings & white,
+                board.pawns & black, board.knights & black, board.bishops & black,
+                board.rooks & black, board.queens & black, board.kings & black,
+            ],
+            dtype="<u8",
+        )
+        planes = np.unpackbits(bitboards.view(np.uint8), bitorder="little").reshape(12, 8, 8)
         
-        # Map piece types to channel indices
-        piece_to_channel = {
-            chess.PAWN: 0,
-            chess.KNIGHT: 1,
-            chess.BISHOP: 2,
-            chess.ROOK: 3,
-            chess.QUEEN: 4,
-            chess.KING: 5,
-        }
+        # Rank 8 first for numpy row order, channels last
+        return np.ascontiguousarray(planes[:, ::-1, :].transpose(1, 2, 0), dtype=np.float32)
+    
+    @cached_property
+    def fen(self) -> str:
+        """FEN of the position, built only when something reads it.
         
-        for square in chess.SQUARES:
-            piece = board.piece_at(square)
-            if piece is not None:
-                # Get row and column (0-7)
-                row = 7 - (square // 8)  # Flip row for numpy indexing
-                col = square % 8
-                
-                # Get channel index (0-11)
-                channel = piece_to_channel[piece.piece_type]
-                if piece.color == chess.BLACK:
-                    channel += 6  # Offset for black pieces
-                
-                tensor[row, col, channel] = 1.0
+        Tensor-only consumers never pay for the string; copying the board
+        is far cheaper than writing it out.
+        """
+        return self.board.fen()
+    
+    @cached_property
+    def board_tensor_list(self) -> list:
+        """board_tensor as nested lists, converted once for JSON output.
         
-        return tensor
+        Observations and to_dict share this list, so treat it as read-only.
+        """
+        return self.board_tensor.tolist()
+    
+    @cached_property
+    def board_tensor_packed(self) -> bytes:
+        """board_tensor as a 96-byte bitmap, one bit per square and channel.
+        
+        Unpack with np.unpackbits(np.frombuffer(data, np.uint8)).reshape(8, 8, 12).
+        """
+        return np.packbits(self.board_tensor.astype(bool, copy=False)).tobytes()
     
     def to_dict(self) -> dict:
         """Convert BoardState to dictionary for JSON serialization."""
         return {
             "fen": self.fen,
-            "board_tensor": self.board_tensor.tolist(),
+            "board_tensor": self.board_tensor_list,
             "legal_moves": self.legal_moves,
             "current_player": self.current_player,
             "is_check": self.is_check,
@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from enum import Enum
 
 from .board_state import BoardState
@@ -65,6 +65,10 @@ class Game:
     total_moves: int = 0
     time_control: Optional[dict] = None
     metadata: dict = field(default_factory=dict)
+    # (board_state, updated_at, total_moves, status, state dict) from the last to_state_dict()
+    _state_dict_cache: Optional[Tuple[Any, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     def add_move(self, move: Move) -> None:
         """Add a move to the game history.
@@ -115,6 +119,47 @@ class Game:
                 moves.append(move.san)
         return " ".join(moves)
     
+    def to_state_dict(self) -> Dict[str, Any]:
+        """Get the game state metadata served by the /state endpoint.
+        
+        The dict is cached until the board state, updated_at, move count or
+        status changes, so callers must not mutate it.
+        
+        Returns:
+            Dict with game id, status, result, position and agent metadata
+        """
+        cache = self._state_dict_cache
+        if (
+            cache is not None
+            and cache[0] is self.board_state
+            and cache[1] == self.updated_at
+            and cache[2] == self.total_moves
+            and cache[3] is self.status
+        ):
+            return cache[4]
+        
+        board_state = self.board_state
+        state = {
+            "game_id": self.game_id,
+            "status": self.status.value,
+            "result": self.result.value,
+            "move_count": self.total_moves,
+            "current_player": board_state.current_player,
+            "fen": board_state.fen,
+            "is_terminal": self.status != GameStatus.ACTIVE,
+            "is_check": board_state.is_check,
+            "is_checkmate": board_state.is_checkmate,
+            "is_stalemate": board_state.is_stalemate,
+            "white_agent": self.white_agent_id,
+            "black_agent": self.black_agent_id,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+        }
+        self._state_dict_cache = (
+            board_state, self.updated_at, self.total_moves, self.status, state
+        )
+        return state
+    
     def to_dict(self) -> dict:
         """Convert Game to dictionary for JSON serialization."""
         return {
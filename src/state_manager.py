@@ -3,10 +3,12 @@
 Manages game state with LRU cleanup when max concurrent games reached.
 """
 
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Set
 from collections import OrderedDict
+from itertools import islice
 import structlog
 
+from src.chess_env import ChessOpenEnv
 from src.models.game import Game
 
 logger = structlog.get_logger()
@@ -16,10 +18,14 @@ class StateManager:
     """In-memory state manager with LRU cleanup.
     
     Manages chess game state with automatic cleanup when capacity is reached.
-    Uses OrderedDict for O(1) LRU operations.
+    Uses OrderedDict for O(1) LRU operations. No lock is taken: the API uses
+    it from a single event loop, and each read or write is one dict operation.
     
     Attributes:
         games: Ordered dict of game_id -> Game
+        envs: Live environments by game_id, so requests skip FEN re-parsing
+        terminal_ids: IDs of stored games that have finished, kept current by
+            create_game/update_game so counts don't scan every game
         max_games: Maximum number of concurrent games
     """
     
@@ -30,6 +36,8 @@ class StateManager:
             max_games: Maximum concurrent games before LRU cleanup
         """
         self.games: OrderedDict[str, Game] = OrderedDict()
+        self.envs: Dict[str, ChessOpenEnv] = {}
+        self.terminal_ids: Set[str] = set()
         self.max_games = max_games
         logger.info("state_manager_initialized", max_games=max_games)
     
@@ -54,6 +62,7 @@ class StateManager:
         
         self.games[game.game_id] = game
         self.games.move_to_end(game.game_id)  # Mark as most recently used
+        self._index_status(game)
         
         logger.info(
             "game_created",
@@ -75,14 +84,49 @@ class StateManager:
         game = self.games.get(game_id)
         
         if game:
-            # Move to end (mark as recently accessed)
-            self.games.move_to_end(game_id)
+            # Move to end (mark as recently accessed); tolerate a concurrent delete
+            try:
+                self.games.move_to_end(game_id)
+            except KeyError:
+                pass
             logger.debug("game_accessed", game_id=game_id)
         else:
             logger.warning("game_not_found", game_id=game_id)
         
         return game
     
+    def set_env(self, env: ChessOpenEnv) -> None:
+        """Cache the live environment for a stored game.
+        
+        Args:
+            env: Environment whose game is already stored
+        """
+        self.envs[env.game_id] = env
+    
+    def get_env(self, game_id: str) -> Optional[ChessOpenEnv]:
+        """Get the live environment for a game.
+        
+        The cached environment is reused while it still wraps the stored game
+        object; otherwise it is rebuilt from the game's FEN and cached.
+        
+        Args:
+            game_id: Game identifier
+            
+        Returns:
+            Environment for the game, or None if the game doesn't exist
+        """
+        game = self.get_game(game_id)
+        if not game:
+            return None
+        
+        env = self.envs.get(game_id)
+        if env is None or env.game is not game:
+            env = ChessOpenEnv.from_game(game)
+            self.envs[game_id] = env
+            logger.debug("env_rebuilt", game_id=game_id)
+        
+        return env
+    
     def update_game(self, game: Game) -> Game:
         """Update an existing game.
         
@@ -100,6 +144,7 @@ class StateManager:
         
         self.games[game.game_id] = game
         self.games.move_to_end(game.game_id)  # Mark as recently used
+        self._index_status(game)
         
         logger.debug("game_updated", game_id=game.game_id)
         
@@ -114,8 +159,11 @@ class StateManager:
         Returns:
             True if game was deleted, False if not found
         """
-        if game_id in self.games:
-            del self.games[game_id]
+        # Single pop rather than check-then-delete, so a concurrent delete
+        # can't raise KeyError between the two
+        if self.games.pop(game_id, None) is not None:
+            self.envs.pop(game_id, None)
+            self.terminal_ids.discard(game_id)
             logger.info("game_deleted", game_id=game_id, total_games=len(self.games))
             return True
         
@@ -144,17 +192,24 @@ class StateManager:
             return self.delete_game(game_id)
         return False
     
-    def list_games(self, limit: Optional[int] = None) -> List[Game]:
+    def list_games(self, limit: Optional[int] = None, active_only: bool = False) -> List[Game]:
         """List all games (most recent first).
         
         Args:
             limit: Maximum number of games to return
+            active_only: Skip finished games; the limit applies after filtering
             
         Returns:
             List of Game objects, most recent first
         """
-        games_list = list(reversed(self.games.values()))
-        return games_list[:limit] if limit else games_list
+        games = reversed(self.games.values())
+        if active_only:
+            games = (game for game in games if not game.is_terminal())
+        return list(islice(games, limit or None))
+    
+    def count_active(self) -> int:
+        """Count stored games that haven't finished."""
+        return len(self.games) - len(self.terminal_ids)
     
     def get_stats(self) -> Dict[str, int]:
         """Get state manager statistics.
@@ -162,8 +217,8 @@ class StateManager:
         Returns:
             Dict with total_games, active_games, completed_games
         """
-        active = sum(1 for game in self.games.values() if not game.is_terminal())
-        completed = sum(1 for game in self.games.values() if game.is_terminal())
+        completed = len(self.terminal_ids)
+        active = len(self.games) - completed
         
         return {
             "total_games": len(self.games),
@@ -197,6 +252,15 @@ class StateManager:
         )
         
         del self.games[oldest_id]
+        self.envs.pop(oldest_id, None)
+        self.terminal_ids.discard(oldest_id)
+    
+    def _index_status(self, game: Game) -> None:
+        """Record whether a stored game has finished."""
+        if game.is_terminal():
+            self.terminal_ids.add(game.game_id)
+        else:
+            self.terminal_ids.discard(game.game_id)
     
     def cleanup_completed_games(self, max_age_minutes: Optional[int] = None) -> int:
         """Clean up completed games, optionally filtering by age.
@@ -240,5 +304,7 @@ class StateManager:
         """
         count = len(self.games)
         self.games.clear()
+        self.envs.clear()
+        self.terminal_ids.clear()
         logger.warning("state_cleared", games_removed=count)
         return count
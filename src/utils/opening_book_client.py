@@ -11,6 +11,9 @@ from dataclasses import dataclass
 
 logger = structlog.get_logger()
 
+# Last move number (1-based) that is still considered the opening phase
+OPENING_BOOK_MAX_MOVE = 15
+
 
 @dataclass
 class OpeningMove:
@@ -62,6 +65,7 @@ class OpeningBookClient:
         api_url: str = "https://explorer.lichess.ovh/masters",
         timeout: float = 1.0,
         cache_size: int = 1000,
+        max_move: int = OPENING_BOOK_MAX_MOVE,
     ):
         """Initialize the opening book client.
         
@@ -69,10 +73,12 @@ class OpeningBookClient:
             api_url: Lichess Masters API endpoint
             timeout: Request timeout in seconds
             cache_size: Maximum number of positions to cache
+            max_move: Last move number for which the book is consulted
         """
         self.api_url = api_url
         self.timeout = timeout
         self.cache_size = cache_size
+        self.max_move = max_move
         
         # Position cache: fen -> API response
         self._cache: Dict[str, Dict[str, Any]] = {}
@@ -233,9 +239,9 @@ class OpeningBookClient:
             move_number: Current move number (1-based)
             
         Returns:
-            True if move_number <= 15 (opening phase)
+            True if move_number <= max_move (opening phase)
         """
-        return move_number <= 15
+        return move_number <= self.max_move
     
     def clear_cache(self):
         """Clear the position cache."""
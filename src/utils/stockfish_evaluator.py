@@ -7,13 +7,15 @@ Provides move quality analysis using Stockfish engine to measure:
 - Best move comparison
 """
 
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, Callable, List, Tuple
 import chess
 import chess.engine
 import structlog
 from pathlib import Path
 import subprocess
 import os
+import queue
+import threading
 from dataclasses import dataclass
 
 logger = structlog.get_logger()
@@ -39,6 +41,9 @@ class StockfishEvaluator:
         self.depth = depth
         self.time_limit = time_limit
         self.engine: Optional[chess.engine.SimpleEngine] = None
+        # SimpleEngine runs one command at a time and a new command cancels the
+        # one in progress, so calls from different threads take turns
+        self._engine_lock = threading.Lock()
         # Game-scoped position cache: {game_id: {fen: result}}
         self._position_cache: Dict[str, Dict[str, Any]] = {}
         
@@ -88,9 +93,38 @@ class StockfishEvaluator:
         return None
     
     def is_available(self) -> bool:
-        """Check if Stockfish engine is available."""
+        """Check if Stockfish engine is available.
+        
+        This is a plain attribute check with no process probe, so it is cheap
+        enough to call on every move. The engine is dropped once it is found
+        to have terminated, which turns this False without polling.
+        """
         return self.engine is not None
     
+    def _call_engine(self, fn: Callable[[chess.engine.SimpleEngine], Any]) -> Any:
+        """Run fn(engine), dropping the engine if its process has terminated.
+        
+        Every engine call goes through here so a dead process turns
+        is_available() False no matter which method found it, and so
+        concurrent callers (e.g. move selection and pre-move analysis)
+        don't cut each other's searches short.
+        
+        Raises:
+            chess.engine.EngineTerminatedError: If the engine is gone
+        """
+        engine = self.engine
+        if engine is None:
+            raise chess.engine.EngineTerminatedError("engine is not running")
+        
+        try:
+            with self._engine_lock:
+                return fn(engine)
+        except chess.engine.EngineTerminatedError as e:
+            # The process is gone; stop routing calls to it
+            logger.error("stockfish_engine_terminated", error=str(e))
+            self.engine = None
+            raise
+    
     def evaluate_position(self, board: chess.Board) -> Optional[int]:
         """Evaluate a chess position.
         
@@ -104,10 +138,10 @@ class StockfishEvaluator:
             return None
         
         try:
-            info = self.engine.analyse(
+            info = self._call_engine(lambda engine: engine.analyse(
                 board,
                 chess.engine.Limit(depth=self.depth, time=self.time_limit)
-            )
+            ))
             
             # Get score from white's perspective
             score = info.get("score")
@@ -139,26 +173,44 @@ class StockfishEvaluator:
             return None
         
         try:
-            result = self.engine.play(
+            result = self._call_engine(lambda engine: engine.play(
                 board,
                 chess.engine.Limit(depth=self.depth, time=self.time_limit)
-            )
+            ))
             return result.move
             
         except Exception as e:
             logger.error("best_move_failed", error=str(e))
             return None
     
+    def analyse_before_move(
+        self,
+        board: chess.Board,
+    ) -> Tuple[Optional[int], List[Tuple[chess.Move, int, List[chess.Move]]]]:
+        """Run the part of evaluate_move that doesn't depend on the move.
+        
+        Lets callers analyse the position while the move is still being chosen.
+        
+        Args:
+            board: Board position before the move
+            
+        Returns:
+            Tuple of (eval_before, top 3 moves with PV lines)
+        """
+        return self.evaluate_position(board), self.get_top_moves(board, num_moves=3)
+    
     def evaluate_move(
         self,
         board: chess.Board,
         move: chess.Move,
+        before: Optional[Tuple[Optional[int], List[Tuple[chess.Move, int, List[chess.Move]]]]] = None,
     ) -> Dict[str, Any]:
         """Evaluate quality of a move.
         
         Args:
             board: Board position before the move
             move: Move to evaluate
+            before: Result of analyse_before_move for this board, if already run
             
         Returns:
             Dictionary with evaluation metrics:
@@ -181,11 +233,8 @@ class StockfishEvaluator:
             }
         
         try:
-            # Evaluate position before move
-            eval_before = self.evaluate_position(board)
-            
-            # Get Stockfish's top moves with PV lines
-            top_moves = self.get_top_moves(board, num_moves=3)
+            # Evaluate position before move and get Stockfish's top moves with PV lines
+            eval_before, top_moves = before if before is not None else self.analyse_before_move(board)
             best_move = top_moves[0][0] if top_moves else None
             is_best = (best_move == move) if best_move else False
             
@@ -264,11 +313,11 @@ class StockfishEvaluator:
                 return cached
         
         try:
-            info = self.engine.analyse(
+            info = self._call_engine(lambda engine: engine.analyse(
                 board,
                 chess.engine.Limit(depth=self.depth, time=self.time_limit),
                 multipv=num_moves
-            )
+            ))
             
             # Extract moves, scores, and PV lines
             top_moves = []
@@ -370,6 +419,74 @@ class StockfishEvaluator:
         self.close()
 
 
+class StockfishPool:
+    """Fixed set of warm Stockfish evaluators shared by concurrent callers.
+    
+    Each evaluator owns its own engine process and is lent to one caller at a
+    time, so up to `size` analyses run in parallel without restarting engines.
+    """
+    
+    def __init__(
+        self,
+        size: int,
+        stockfish_path: Optional[str] = None,
+        depth: int = 20,
+        time_limit: float = 0.5,
+    ):
+        """Start the pool's engines.
+        
+        Args:
+            size: Number of engine processes to keep running
+            stockfish_path: Path to Stockfish binary. If None, tries to find it.
+            depth: Search depth for evaluation
+            time_limit: Time limit per evaluation in seconds
+        """
+        # Locate the binary once and reuse the path for the other engines
+        first = StockfishEvaluator(stockfish_path, depth=depth, time_limit=time_limit)
+        self.stockfish_path = first.stockfish_path
+        self.depth = depth
+        self.time_limit = time_limit
+        self._evaluators = [first]
+        if first.is_available():
+            self._evaluators.extend(
+                StockfishEvaluator(self.stockfish_path, depth=depth, time_limit=time_limit)
+                for _ in range(size - 1)
+            )
+        
+        self._idle: "queue.Queue[StockfishEvaluator]" = queue.Queue()
+        for evaluator in self._evaluators:
+            if evaluator.is_available():
+                self._idle.put(evaluator)
+        
+        logger.info("stockfish_pool_initialized", engines=self._idle.qsize())
+    
+    def is_available(self) -> bool:
+        """Check if any engine in the pool is running."""
+        return any(evaluator.is_available() for evaluator in self._evaluators)
+    
+    def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Call fn(evaluator, *args) with an idle evaluator.
+        
+        Blocks until an evaluator is free, so call it from a worker thread.
+        
+        Raises:
+            RuntimeError: If the pool has no running engine
+        """
+        if not self.is_available():
+            raise RuntimeError("Stockfish not available")
+        
+        evaluator = self._idle.get()
+        try:
+            return fn(evaluator, *args)
+        finally:
+            self._idle.put(evaluator)
+    
+    def close(self) -> None:
+        """Quit every engine in the pool."""
+        for evaluator in self._evaluators:
+            evaluator.close()
+
+
 # Global evaluator instance (lazy initialized)
 _global_evaluator: Optional[StockfishEvaluator] = None
 
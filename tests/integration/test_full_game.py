@@ -147,6 +147,24 @@ class TestFullGameFlow:
         assert "<svg" in response.text
         assert "</svg>" in response.text
     
+    def test_render_svg_not_modified(self, client):
+        """Test SVG render revalidation with ETag."""
+        game_id = self._create_game(client)
+        
+        response = client.get(f"/api/v1/render/{game_id}")
+        etag = response.headers["etag"]
+        
+        # Same position: 304 with no body
+        response = client.get(f"/api/v1/render/{game_id}", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        
+        # After a move the ETag changes and the board is sent again
+        client.post("/api/v1/step", json={"game_id": game_id, "action": "e2e4"})
+        response = client.get(f"/api/v1/render/{game_id}", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+    
     def test_random_game_completion(self, client):
         """Test complete game with random moves."""
         game_id = self._create_game(client)
@@ -0,0 +1,95 @@
+"""Unit tests for ChessAgentManager move generation."""
+
+import types
+
+import chess
+import pytest
+
+from src.agents import agent_manager
+from src.agents.agent_manager import ChessAgentManager, MOVE_MAX_TOKENS
+from src.models.board_state import BoardState
+
+
+class FakeModel:
+    """InferenceClientModel stand-in that returns queued replies."""
+    
+    def __init__(self, model_id: str):
+        self.model_id = model_id
+        self.replies = []
+        self.calls = []
+    
+    def generate(self, messages, **kwargs):
+        self.calls.append({"messages": messages, **kwargs})
+        return types.SimpleNamespace(content=self.replies.pop(0))
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    """Agent manager whose agents use FakeModel instead of a hosted model."""
+    monkeypatch.setattr(agent_manager, "InferenceClientModel", FakeModel)
+    monkeypatch.setattr(agent_manager, "CodeAgent", lambda **kwargs: object())
+    
+    manager = ChessAgentManager()
+    manager.create_agent("white", personality="balanced", temperature=0.7)
+    return manager
+
+
+def start_position():
+    """Board state and legal moves for the starting position."""
+    board = chess.Board()
+    return BoardState.from_board(board), [move.uci() for move in board.legal_moves]
+
+
+class TestAgentMove:
+    """Test suite for get_agent_move's direct model completion."""
+    
+    def test_sends_prompt_with_token_cap(self, manager):
+        """The move prompt goes to the model as one capped user message."""
+        model = manager.models["white"]
+        model.replies = ["e2e4"]
+        board_state, legal_moves = start_position()
+        
+        move = manager.get_agent_move("white", board_state, legal_moves)
+        
+        assert move == "e2e4"
+        assert len(model.calls) == 1
+        call = model.calls[0]
+        assert call["max_tokens"] == MOVE_MAX_TOKENS
+        assert call["temperature"] == 0.7
+        
+        [message] = call["messages"]
+        assert message["role"] == "user"
+        [content] = message["content"]
+        assert content["type"] == "text"
+        assert content["text"] == manager._build_move_prompt(
+            board_state=board_state,
+            legal_moves=legal_moves,
+            game_history=None,
+            personality="balanced",
+        )
+    
+    def test_extracts_move_from_wordy_reply(self, manager):
+        """A legal move is found inside surrounding text."""
+        manager.models["white"].replies = ["I'll play <code>g1f3</code> here."]
+        board_state, legal_moves = start_position()
+        
+        assert manager.get_agent_move("white", board_state, legal_moves) == "g1f3"
+    
+    def test_none_content_is_retried(self, manager):
+        """A reply without content counts as a failed attempt, not an error."""
+        model = manager.models["white"]
+        model.replies = [None, "d2d4"]
+        board_state, legal_moves = start_position()
+        
+        assert manager.get_agent_move("white", board_state, legal_moves) == "d2d4"
+        assert len(model.calls) == 2
+    
+    def test_raises_after_all_retries_fail(self, manager):
+        """Replies with no legal move exhaust the retries."""
+        model = manager.models["white"]
+        model.replies = [None, "no idea", "e2e5"]
+        board_state, legal_moves = start_position()
+        
+        with pytest.raises(ValueError, match="failed to generate valid move"):
+            manager.get_agent_move("white", board_state, legal_moves)
+        assert len(model.calls) == manager.configs["white"].max_retries
@@ -1,7 +1,8 @@
 """Unit tests for ChessOpenEnv environment."""
 
+import numpy as np
 import pytest
-from src.chess_env import ChessOpenEnv
+from src.chess_env import ChessOpenEnv, VectorChessEnv
 from src.models.game import GameStatus, GameResult
 
 
@@ -54,6 +55,72 @@ class TestChessOpenEnv:
         assert info["last_move"] == "e2e4"
         assert info["move_count"] == 1
     
+    def test_zobrist_tracks_position(self):
+        """Test Zobrist key updates on step and matches transpositions."""
+        env = ChessOpenEnv()
+        env.reset()
+        start = env.zobrist
+        
+        env.step("g1f3")
+        assert env.zobrist != start
+        
+        # Knights back home: move counters differ, the key does not
+        for move in ["g8f6", "f3g1", "f6g8"]:
+            env.step(move)
+        assert env.zobrist == start
+    
+    def test_tensor_formats(self):
+        """Test observations carry the board tensor in the requested format."""
+        env = ChessOpenEnv(tensor_format="ndarray")
+        observation, _ = env.reset()
+        assert observation["board_state"]["board_tensor"] is env.game.board_state.board_tensor
+        
+        env = ChessOpenEnv(tensor_format="bytes")
+        env.reset()
+        observation, _, _, _, _ = env.step("e2e4")
+        board = observation["board_state"]
+        assert board["board_tensor"] == env.game.board_state.board_tensor.tobytes()
+        assert board["board_tensor_shape"] == (8, 8, 12)
+        
+        env = ChessOpenEnv(tensor_format="packed")
+        env.reset()
+        observation, _, _, _, _ = env.step("e2e4")
+        packed = observation["board_state"]["board_tensor_packed"]
+        assert len(packed) == 96
+        unpacked = np.unpackbits(np.frombuffer(packed, dtype=np.uint8)).reshape(8, 8, 12)
+        assert (unpacked == env.game.board_state.board_tensor).all()
+        
+        with pytest.raises(ValueError):
+            ChessOpenEnv(tensor_format="csv")
+    
+    def test_fen_is_optional_and_snapshotted(self):
+        """Test include_fen=False drops the FEN and stored FENs don't follow later moves."""
+        env = ChessOpenEnv(include_fen=False)
+        observation, _ = env.reset()
+        assert "fen" not in observation["board_state"]
+        
+        start_state = env.game.board_state
+        env.step("e2e4")
+        assert start_state.fen == "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+        assert env.state()["fen"] == "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1"
+    
+    def test_vector_env_batches_steps(self):
+        """Test VectorChessEnv stacks sub-environment results into shared buffers."""
+        for threaded in (False, True):
+            vec = VectorChessEnv(2, threaded=threaded)
+            batch = vec.reset(fens=[None, "7k/8/6QK/8/8/8/8/8 w - - 0 1"])
+            assert batch["board_tensors"].shape == (2, 8, 8, 12)
+            
+            batch = vec.step(["e2e4", "g6g7"])
+            assert (batch["board_tensors"][0] == vec.envs[0].game.board_state.board_tensor).all()
+            assert batch["terminated"].tolist() == [False, True]
+            assert batch["rewards"].tolist() == [0.0, 1.0]
+            
+            batch = vec.step(["e7e5", None])
+            assert batch["rewards"].tolist() == [0.0, 0.0]
+            assert batch["legal_moves"][1] == []
+            vec.close()
+    
     def test_step_illegal_move(self):
         """Test stepping with illegal move raises error."""
         env = ChessOpenEnv()
@@ -129,6 +196,17 @@ class TestChessOpenEnv:
         assert state["current_player"] == "black"
         assert state["is_terminal"] is False
     
+    def test_state_cached_until_step(self):
+        """Test repeated state() calls reuse the dict until the game changes."""
+        env = ChessOpenEnv()
+        env.reset()
+        state = env.state()
+        assert env.state() is state
+        
+        env.step("e2e4")
+        assert env.state() is not state
+        assert env.state()["move_count"] == 1
+    
     def test_state_finished_game(self):
         """Test state() on finished game."""
         env = ChessOpenEnv()
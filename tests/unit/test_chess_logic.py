@@ -32,6 +32,30 @@ class TestChessLogic:
         assert logic.is_legal_move("e2e5") is False  # Pawn can't move 3 squares
         assert logic.is_legal_move("invalid") is False  # Invalid UCI format
     
+    def test_legal_moves_follow_board_changes(self):
+        """Test cached legal moves stay correct when the board is pushed directly."""
+        logic = ChessLogic()
+        assert logic.is_legal_move("e7e5") is False
+        
+        logic.board.push_uci("e2e4")
+        assert logic.is_legal_move("e7e5") is True
+        assert logic.get_legal_moves() == [m.uci() for m in logic.board.legal_moves]
+    
+    def test_transposed_positions_share_snapshot(self):
+        """Test positions reached by different move orders reuse one read-only tensor."""
+        first = ChessLogic()
+        for move in ("g1f3", "g8f6", "b1c3"):
+            first.apply_move(move)
+        second = ChessLogic()
+        for move in ("b1c3", "g8f6", "g1f3"):
+            second.apply_move(move)
+        
+        state_a, state_b = first.get_board_state(), second.get_board_state()
+        assert state_a.board_tensor is state_b.board_tensor
+        assert not state_a.board_tensor.flags.writeable
+        assert state_a.legal_moves == state_b.legal_moves
+        assert state_a.legal_moves is not state_b.legal_moves
+    
     def test_apply_move_legal(self):
         """Test applying a legal move."""
         logic = ChessLogic()
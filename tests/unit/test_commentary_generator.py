@@ -0,0 +1,188 @@
+"""Unit tests for CommentaryGenerator text completions."""
+
+import asyncio
+import gc
+import types
+
+import httpx
+import openai
+import pytest
+
+from src.commentary import commentary_generator
+from src.commentary.commentary_generator import CommentaryGenerator
+from src.commentary.triggers import CommentaryTrigger, TriggerContext
+
+
+def rate_limit_error() -> openai.RateLimitError:
+    """Build the error the SDK raises for an HTTP 429."""
+    response = httpx.Response(429, request=httpx.Request("POST", "https://example.invalid"))
+    return openai.RateLimitError("rate limited", response=response, body=None)
+
+
+class FakeCompletions:
+    """chat.completions stand-in that raises queued errors, then replies."""
+    
+    def __init__(self, reply: str, errors=(), delay: float = 0.0):
+        self.reply = reply
+        self.errors = list(errors)
+        self.delay = delay
+        self.calls = []
+    
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.errors:
+            error = self.errors.pop(0)
+            if error is not None:
+                raise error
+        message = types.SimpleNamespace(content=f" {self.reply} ")
+        return types.SimpleNamespace(choices=[types.SimpleNamespace(message=message)], usage=None)
+
+
+def fake_client(completions: FakeCompletions):
+    """Wrap fake completions in an AsyncAzureOpenAI-shaped object."""
+    return types.SimpleNamespace(chat=types.SimpleNamespace(completions=completions))
+
+
+def make_context(san_move: str = "e4") -> TriggerContext:
+    """Build a tactical trigger context for a move."""
+    return TriggerContext(
+        trigger=CommentaryTrigger.TACTICAL,
+        priority=50,
+        player="white",
+        move="e2e4",
+        san_move=san_move,
+        move_number=1,
+        eval_before=0,
+        eval_after=30,
+        eval_swing=30,
+        centipawn_loss=0,
+        quality="good",
+        is_best_move=True,
+        best_move_alternative=None,
+        game_phase="opening",
+        material_balance=0,
+        position_type="open",
+        is_check=False,
+        is_checkmate=False,
+    )
+
+
+@pytest.fixture
+def generator(monkeypatch):
+    """Text-mode generator with its Azure client replaced per test."""
+    monkeypatch.setenv("COMMENTARY_MODE", "text")
+    monkeypatch.setenv("COMMENTARY_BREAKER_THRESHOLD", "2")
+    monkeypatch.delenv("AZURE_OPENAI_ENDPOINT", raising=False)
+    monkeypatch.delenv("AZURE_OPENAI_API_KEY", raising=False)
+    monkeypatch.setattr(commentary_generator, "_retry_delay", lambda error, attempt: 0)
+    
+    generator = CommentaryGenerator()
+    generator.text_deployment = "primary"
+    return generator
+
+
+class TestCommentaryCompletions:
+    """Test suite for retries, fallback and the circuit breaker."""
+    
+    async def test_retries_rate_limit_then_succeeds(self, generator):
+        """A 429 is retried on the same deployment."""
+        primary = FakeCompletions("Primary text", errors=[rate_limit_error()])
+        generator.text_client = fake_client(primary)
+        
+        text = await generator._complete_text("prompt", {})
+        
+        assert text == "Primary text"
+        assert [call["model"] for call in primary.calls] == ["primary", "primary"]
+    
+    async def test_rate_limit_error_raised_after_last_retry(self, generator):
+        """Retries stop after max_retries."""
+        primary = FakeCompletions("unused", errors=[rate_limit_error()] * 3)
+        generator.text_client = fake_client(primary)
+        
+        with pytest.raises(openai.RateLimitError):
+            await generator._complete_text("prompt", {})
+        assert len(primary.calls) == generator.max_retries + 1
+    
+    async def test_switches_to_fallback_deployment(self, generator):
+        """A failed primary call is retried on the fallback deployment."""
+        primary = FakeCompletions("unused", errors=[rate_limit_error()])
+        fallback = FakeCompletions("Fallback text")
+        generator.text_client = fake_client(primary)
+        generator.fallback_client = fake_client(fallback)
+        generator.fallback_deployment = "fallback"
+        
+        text = await generator._complete_text("prompt", {})
+        
+        assert text == "Fallback text"
+        assert len(primary.calls) == 1
+        assert [call["model"] for call in fallback.calls] == ["fallback"]
+    
+    async def test_breaker_opens_after_threshold(self, generator):
+        """Once open, the breaker sends calls straight to the fallback."""
+        primary = FakeCompletions("unused", errors=[rate_limit_error()] * 10)
+        fallback = FakeCompletions("Fallback text")
+        generator.text_client = fake_client(primary)
+        generator.fallback_client = fake_client(fallback)
+        generator.fallback_deployment = "fallback"
+        
+        for _ in range(generator.breaker_threshold):
+            assert not generator._breaker_open()
+            await generator._complete_text("prompt", {})
+        assert generator._breaker_open()
+        
+        await generator._complete_text("prompt", {})
+        
+        assert len(primary.calls) == generator.breaker_threshold
+        assert len(fallback.calls) == generator.breaker_threshold + 1
+
+
+class TestCommentaryResponses:
+    """Test suite for response caching and shared generations."""
+    
+    async def test_cache_hit_skips_client(self, generator):
+        """A repeated prompt is answered from the response cache."""
+        primary = FakeCompletions("Cached text")
+        generator.text_client = fake_client(primary)
+        
+        first = await generator.generate_commentary(make_context())
+        second = await generator.generate_commentary(make_context())
+        
+        assert first["text"] == second["text"] == "Cached text"
+        assert len(primary.calls) == 1
+    
+    async def test_identical_requests_share_generation(self, generator):
+        """Concurrent identical prompts make one model call."""
+        primary = FakeCompletions("Shared text", delay=0.01)
+        generator.text_client = fake_client(primary)
+        
+        results = await asyncio.gather(
+            generator.generate_commentary(make_context()),
+            generator.generate_commentary(make_context()),
+        )
+        
+        assert [result["text"] for result in results] == ["Shared text", "Shared text"]
+        assert len(primary.calls) == 1
+        assert generator._in_flight == {}
+    
+    async def test_failure_after_cancelled_waiter_is_retrieved(self, generator):
+        """A generation failing after its only waiter is cancelled isn't reported."""
+        primary = FakeCompletions("unused", errors=[ValueError("bad request")], delay=0.01)
+        generator.text_client = fake_client(primary)
+        
+        reported = []
+        loop = asyncio.get_running_loop()
+        loop.set_exception_handler(lambda loop, context: reported.append(context))
+        try:
+            waiter = asyncio.ensure_future(generator.generate_commentary(make_context()))
+            await asyncio.sleep(0)
+            waiter.cancel()
+            await asyncio.sleep(0.05)
+            gc.collect()
+        finally:
+            loop.set_exception_handler(None)
+        
+        assert waiter.cancelled()
+        assert generator._in_flight == {}
+        assert reported == []
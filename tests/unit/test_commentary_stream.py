@@ -0,0 +1,109 @@
+"""Unit tests for commentary SSE frame production."""
+
+import asyncio
+import base64
+import json
+
+from src.api import routes
+from src.api.routes import _produce_commentary_frames, _stream_commentary_events
+
+
+class FakeStreamClient:
+    """Realtime client stand-in that replays fixed stream events."""
+    
+    def __init__(self, events, error=None):
+        self.events = events
+        self.error = error
+    
+    async def stream_commentary_audio(self, prompt, voice_style="excited"):
+        for event in self.events:
+            yield event
+        if self.error:
+            raise self.error
+
+
+def audio_chunk(data: bytes) -> str:
+    """Base64-encode raw PCM bytes like a realtime audio delta."""
+    return base64.b64encode(data).decode("ascii")
+
+
+async def collect_frames(client):
+    """Run the producer and decode every frame it queues."""
+    queue = asyncio.Queue()
+    await _produce_commentary_frames(client, "prompt", "stream_failed", queue)
+    
+    frames = []
+    while True:
+        frame = queue.get_nowait()
+        if frame is None:
+            return frames
+        frames.append(json.loads(frame[len(b"data: "):]))
+
+
+class TestCommentaryFrames:
+    """Test suite for _produce_commentary_frames."""
+    
+    async def test_small_chunks_flushed_before_done(self):
+        """Merged audio frames are queued before the done frame."""
+        client = FakeStreamClient([
+            {"audio": audio_chunk(b"ab")},
+            {"audio": audio_chunk(b"cd")},
+            {"audio": audio_chunk(b"ef"), "done": True},
+        ])
+        
+        frames = await collect_frames(client)
+        
+        assert frames == [
+            {"audio": audio_chunk(b"abcdef")},
+            {"done": True},
+        ]
+    
+    async def test_small_chunks_flushed_before_error_event(self):
+        """Merged audio frames are queued before an error frame."""
+        client = FakeStreamClient([
+            {"audio": audio_chunk(b"ab")},
+            {"audio": audio_chunk(b"cd"), "error": "upstream failed"},
+        ])
+        
+        frames = await collect_frames(client)
+        
+        assert frames == [
+            {"audio": audio_chunk(b"abcd")},
+            {"error": "upstream failed", "done": True},
+        ]
+    
+    async def test_small_chunks_flushed_when_stream_raises(self):
+        """Audio received before a stream exception is still delivered."""
+        client = FakeStreamClient(
+            [{"audio": audio_chunk(b"ab")}, {"audio": audio_chunk(b"cd")}],
+            error=RuntimeError("connection lost"),
+        )
+        
+        frames = await collect_frames(client)
+        
+        assert frames == [
+            {"audio": audio_chunk(b"abcd")},
+            {"error": "connection lost", "done": True},
+        ]
+
+
+class TestCommentaryStream:
+    """Test suite for _stream_commentary_events."""
+    
+    async def test_producer_finishes_when_client_disconnects(self, monkeypatch):
+        """Closing the response stops a producer blocked on a full queue."""
+        monkeypatch.setattr(routes, "SSE_QUEUE_SIZE", 1)
+        client = FakeStreamClient([{"text": f"line {i}"} for i in range(10)])
+        
+        stream = _stream_commentary_events(client, "prompt", "stream_failed")
+        first = await stream.__anext__()
+        # Let the producer fill the queue and block on the next put
+        await asyncio.sleep(0.01)
+        producers = asyncio.all_tasks() - {asyncio.current_task()}
+        await stream.aclose()
+        
+        done, pending = await asyncio.wait(producers, timeout=1)
+        
+        assert json.loads(first[len(b"data: "):]) == {"text": "line 0"}
+        assert len(done) == 1
+        assert pending == set()
@@ -0,0 +1,145 @@
+"""Unit tests for the /evaluate endpoints with a stubbed engine pool."""
+
+import asyncio
+import threading
+import time
+
+import chess
+import httpx
+from fastapi import FastAPI
+
+from src.api import routes
+
+
+class FakeEvaluator:
+    """StockfishEvaluator stand-in with fixed answers."""
+    
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.position_calls = 0
+        self._lock = threading.Lock()
+    
+    def evaluate_position(self, board):
+        with self._lock:
+            self.position_calls += 1
+        time.sleep(self.delay)
+        return 25
+    
+    def get_best_move(self, board):
+        return chess.Move.from_uci("e2e4")
+    
+    def evaluate_move(self, board, move):
+        time.sleep(self.delay)
+        return {"centipawn_loss": 0.0, "quality": "excellent"}
+
+
+class FakePool:
+    """StockfishPool stand-in lending one FakeEvaluator."""
+    
+    def __init__(self, available: bool = True, delay: float = 0.0):
+        self.available = available
+        self.evaluator = FakeEvaluator(delay)
+    
+    def is_available(self):
+        return self.available
+    
+    def run(self, fn, *args):
+        return fn(self.evaluator, *args)
+
+
+def make_client(pool: FakePool) -> httpx.AsyncClient:
+    """Client for an app serving the API routes with pool as the engine pool."""
+    app = FastAPI()
+    app.include_router(routes.router, prefix="/api/v1")
+    app.dependency_overrides[routes.get_evaluator_pool] = lambda: pool
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+class TestEvaluateBatch:
+    """Test suite for the batch evaluation endpoints."""
+    
+    async def test_positions_batch_reports_item_errors(self):
+        """Invalid FENs fail only their own item."""
+        async with make_client(FakePool()) as client:
+            response = await client.post("/api/v1/evaluate/positions/batch", json={"items": [
+                {"fen": chess.STARTING_FEN},
+                {"fen": "not a fen"},
+            ]})
+        
+        assert response.status_code == 200
+        body = response.json()
+        assert body["results"][0] == {
+            "fen": chess.STARTING_FEN,
+            "evaluation": 25,
+            "best_move": "e2e4",
+            "available": True,
+        }
+        assert body["results"][1] is None
+        assert [error["index"] for error in body["errors"]] == [1]
+    
+    async def test_moves_batch_reports_item_errors(self):
+        """Invalid FENs and moves fail only their own items."""
+        async with make_client(FakePool()) as client:
+            response = await client.post("/api/v1/evaluate/moves/batch", json={"items": [
+                {"fen": chess.STARTING_FEN, "move": "e2e4"},
+                {"fen": chess.STARTING_FEN, "move": "zz99"},
+                {"fen": "not a fen", "move": "e2e4"},
+            ]})
+        
+        assert response.status_code == 200
+        body = response.json()
+        assert body["results"][0]["move"] == "e2e4"
+        assert body["results"][0]["evaluation"]["quality"] == "excellent"
+        assert body["results"][1:] == [None, None]
+        assert [error["index"] for error in body["errors"]] == [1, 2]
+    
+    async def test_batches_when_stockfish_unavailable(self):
+        """Without engines every item is returned as unavailable."""
+        async with make_client(FakePool(available=False)) as client:
+            positions = await client.post("/api/v1/evaluate/positions/batch", json={"items": [
+                {"fen": chess.STARTING_FEN},
+            ]})
+            moves = await client.post("/api/v1/evaluate/moves/batch", json={"items": [
+                {"fen": chess.STARTING_FEN, "move": "e2e4"},
+            ]})
+        
+        assert positions.status_code == 200
+        assert positions.json() == {
+            "results": [{"fen": chess.STARTING_FEN, "evaluation": None, "best_move": None, "available": False}],
+            "errors": [],
+        }
+        assert moves.status_code == 200
+        assert moves.json() == {
+            "results": [{"move": "e2e4", "evaluation": {"error": "Stockfish not available"}, "available": False}],
+            "errors": [],
+        }
+    
+    async def test_batch_timeout_returns_504(self, monkeypatch):
+        """A batch running past EVALUATE_BATCH_TIMEOUT is answered with 504."""
+        monkeypatch.setattr(routes, "EVALUATE_BATCH_TIMEOUT", 0.05)
+        
+        async with make_client(FakePool(delay=0.3)) as client:
+            response = await client.post("/api/v1/evaluate/positions/batch", json={"items": [
+                {"fen": chess.STARTING_FEN},
+            ]})
+        
+        assert response.status_code == 504
+
+
+class TestEvaluateCoalescing:
+    """Test suite for sharing identical single-item evaluations."""
+    
+    async def test_identical_requests_share_one_evaluation(self):
+        """Concurrent requests for the same position make one engine call."""
+        pool = FakePool(delay=0.1)
+        
+        async with make_client(pool) as client:
+            responses = await asyncio.gather(*(
+                client.post("/api/v1/evaluate/position", json={"fen": chess.STARTING_FEN})
+                for _ in range(3)
+            ))
+        
+        assert [response.status_code for response in responses] == [200, 200, 200]
+        assert all(response.json()["evaluation"] == 25 for response in responses)
+        assert pool.evaluator.position_calls == 1
+        assert routes._evaluations_in_flight == {}
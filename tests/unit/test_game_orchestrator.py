@@ -0,0 +1,90 @@
+"""Unit tests for GameOrchestrator.run_game_step."""
+
+import asyncio
+import time
+from unittest.mock import Mock
+
+import chess
+import pytest
+
+from src.chess_env import ChessOpenEnv
+from src.commentary.commentary_strategist import CommentaryDecision
+from src.commentary.triggers import CommentaryTrigger
+from src.game_manager.game_orchestrator import GameOrchestrator
+
+
+class SlowCommentaryGenerator:
+    """CommentaryGenerator stand-in that takes delay seconds per line."""
+    
+    def __init__(self, delay: float):
+        self.delay = delay
+    
+    async def generate_commentary(self, trigger_context, game_context=None):
+        await asyncio.sleep(self.delay)
+        return {"text": "What a move!"}
+
+
+@pytest.fixture
+def orchestrator(monkeypatch):
+    """Orchestrator with no engine, book or tablebase; the agent plays e2e4."""
+    monkeypatch.setenv("OPENING_BOOK_ENABLED", "false")
+    monkeypatch.setenv("TABLEBASE_ENABLED", "false")
+    
+    agent_manager = Mock()
+    agent_manager.get_agent_move.return_value = "e2e4"
+    return GameOrchestrator(agent_manager, enable_evaluation=False, enable_commentary=False)
+
+
+def new_env() -> ChessOpenEnv:
+    """Environment reset to the starting position."""
+    env = ChessOpenEnv()
+    env.reset()
+    return env
+
+
+def enable_move_commentary(orchestrator: GameOrchestrator, delay: float):
+    """Turn on evaluation and move commentary, with commentary taking delay seconds."""
+    orchestrator.enable_evaluation = True
+    orchestrator.evaluator = Mock()
+    orchestrator.evaluator.analyse_before_move.return_value = (20, [])
+    orchestrator.evaluator.evaluate_move.return_value = {"centipawns": 30, "quality": "good"}
+    
+    orchestrator.enable_commentary = True
+    orchestrator.commentary_strategist = Mock()
+    orchestrator.commentary_strategist.calculate_position_interest.return_value = 80
+    orchestrator.commentary_strategist.should_generate_commentary.return_value = (
+        CommentaryDecision.MOVE_COMMENT,
+        "interesting",
+    )
+    orchestrator.trigger_detector = Mock()
+    orchestrator.trigger_detector.should_generate_commentary.return_value = Mock(
+        trigger=CommentaryTrigger.TACTICAL,
+        priority=50,
+    )
+    orchestrator.commentary_generator = SlowCommentaryGenerator(delay)
+
+
+class TestRunGameStepTimeout:
+    """Test suite for the move_timeout limit on run_game_step."""
+    
+    async def test_slow_selection_times_out_before_move(self, orchestrator):
+        """A selection past the timeout raises and leaves the board unchanged."""
+        orchestrator.agent_manager.get_agent_move.side_effect = lambda **kwargs: time.sleep(0.3) or "e2e4"
+        env = new_env()
+        
+        with pytest.raises(asyncio.TimeoutError):
+            await orchestrator.run_game_step(env, "white", move_timeout=0.05)
+        
+        assert env.chess.board.fen() == chess.STARTING_FEN
+    
+    async def test_slow_commentary_still_returns_applied_move(self, orchestrator):
+        """Commentary running past the timeout does not lose the applied move."""
+        enable_move_commentary(orchestrator, delay=0.2)
+        env = new_env()
+        
+        result = await orchestrator.run_game_step(env, "white", move_timeout=0.05)
+        
+        assert result["move"] == "e2e4"
+        assert result["evaluation"]["quality"] == "good"
+        assert result["commentary"]["text"] == "What a move!"
+        assert env.chess.board.move_stack == [chess.Move.from_uci("e2e4")]
@@ -0,0 +1,37 @@
+"""Unit tests for HybridAgentMoveSelector."""
+
+from unittest.mock import Mock
+
+import chess
+
+from src.agents.hybrid_agent_selector import HybridAgentMoveSelector
+from src.models.board_state import BoardState
+
+
+class TestForcedMove:
+    """Test suite for the single-legal-move short-circuit."""
+    
+    def test_only_legal_move_skips_all_lookups(self):
+        """With one legal move, no book, tablebase, engine or LLM is consulted."""
+        evaluator = Mock()
+        agent_manager = Mock()
+        opening_book = Mock(max_move=15)
+        tablebase = Mock()
+        selector = HybridAgentMoveSelector(
+            stockfish_evaluator=evaluator,
+            agent_manager=agent_manager,
+            opening_book_client=opening_book,
+            tablebase_client=tablebase,
+        )
+        
+        # The rook covers the g-file, leaving Kh7 as the only move; move 1 with 3 pieces, so
+        # the book and tablebase would both apply otherwise
+        board = chess.Board("7k/8/8/8/8/8/8/6RK b - - 0 1")
+        
+        result = selector.get_move("black", board, BoardState.from_board(board), game_history=[])
+        
+        assert result == ("h8h7", "forced")
+        assert evaluator.mock_calls == []
+        assert agent_manager.mock_calls == []
+        assert opening_book.mock_calls == []
+        assert tablebase.mock_calls == []
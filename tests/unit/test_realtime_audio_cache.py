@@ -0,0 +1,83 @@
+"""Unit tests for the realtime audio client's disk cache."""
+
+import asyncio
+import os
+
+import pytest
+
+from src.commentary.realtime_audio_client import RealtimeAudioClient
+
+
+def cached_result(text: str, audio: str = "QUFB") -> dict:
+    """Build an audio result like generate_commentary_audio returns."""
+    return {"text": text, "audio": audio, "format": "pcm16", "voice_style": "excited"}
+
+
+def cache_files(client: RealtimeAudioClient) -> list:
+    """Cache file paths currently on disk."""
+    return sorted(
+        os.path.join(client.cache_dir, name)
+        for name in os.listdir(client.cache_dir)
+        if name.endswith(".json")
+    )
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    """Unconfigured realtime client caching under a temporary directory."""
+    monkeypatch.delenv("AZURE_OPENAI_ENDPOINT", raising=False)
+    monkeypatch.delenv("AZURE_OPENAI_API_KEY", raising=False)
+    monkeypatch.setenv("COMMENTARY_AUDIO_CACHE_DIR", str(tmp_path / "tts"))
+    return RealtimeAudioClient()
+
+
+class TestAudioCache:
+    """Test suite for the audio disk cache."""
+    
+    async def test_store_then_load_round_trip(self, client):
+        """A stored result is loaded back for the same text and voice."""
+        result = cached_result("Checkmate! White wins with Qh7#")
+        
+        assert await client._load_cached(result["text"], "excited") is None
+        await client._store_cached(result["text"], "excited", result)
+        
+        assert await client._load_cached(result["text"], "excited") == result
+        assert await client._load_cached(result["text"], "calm") is None
+    
+    async def test_disabled_when_size_is_zero(self, client):
+        """A zero size limit neither stores nor loads."""
+        client.cache_max_bytes = 0
+        
+        await client._store_cached("text", "excited", cached_result("text"))
+        
+        assert await client._load_cached("text", "excited") is None
+        assert not os.path.exists(client.cache_dir)
+    
+    async def test_evicts_least_recently_used(self, client):
+        """Past the size limit, the least recently used file is deleted."""
+        await client._store_cached("first", "excited", cached_result("first"))
+        await client._store_cached("second", "excited", cached_result("second"))
+        first_path = client._cache_path("first", "excited")
+        second_path = client._cache_path("second", "excited")
+        os.utime(first_path, (1000, 1000))
+        os.utime(second_path, (2000, 2000))
+        
+        # Loading marks "first" as recently used, so "second" is now oldest
+        assert await client._load_cached("first", "excited") is not None
+        client.cache_max_bytes = os.path.getsize(first_path) * 2 + 8
+        await client._store_cached("third", "excited", cached_result("third"))
+        
+        assert cache_files(client) == sorted([first_path, client._cache_path("third", "excited")])
+        assert client._cache_bytes == sum(os.path.getsize(path) for path in cache_files(client))
+    
+    async def test_concurrent_writes_keep_byte_count(self, client):
+        """Writes from many worker threads leave an exact byte count."""
+        await client._store_cached("seed", "excited", cached_result("seed"))
+        
+        await asyncio.gather(*(
+            client._store_cached(f"line {i}", "excited", cached_result(f"line {i}"))
+            for i in range(50)
+        ))
+        
+        assert len(cache_files(client)) == 51
+        assert client._cache_bytes == sum(os.path.getsize(path) for path in cache_files(client))
@@ -152,6 +152,37 @@ class TestStateManager:
         games = manager.list_games(limit=2)
         assert len(games) == 2
     
+    def test_list_games_active_only(self):
+        """Test the limit counts active games, not games scanned."""
+        manager = StateManager()
+        
+        for i in range(2):
+            game = self.create_test_game(f"active{i}")
+            manager.create_game(game)
+        for i in range(3):
+            game = self.create_test_game(f"completed{i}")
+            game.status = GameStatus.CHECKMATE
+            manager.create_game(game)
+        
+        games = manager.list_games(limit=2, active_only=True)
+        assert [g.game_id for g in games] == ["active1", "active0"]
+        assert manager.count_active() == 2
+    
+    def test_update_game_reindexes_status(self):
+        """Test a game finished via update_game leaves the active count."""
+        manager = StateManager()
+        game = self.create_test_game("game1")
+        manager.create_game(game)
+        assert manager.count_active() == 1
+        
+        game.status = GameStatus.CHECKMATE
+        manager.update_game(game)
+        assert manager.count_active() == 0
+        assert manager.get_stats()["completed_games"] == 1
+        
+        manager.delete_game("game1")
+        assert manager.terminal_ids == set()
+    
     def test_get_stats_empty(self):
         """Test stats for empty manager."""
         manager = StateManager(max_games=100)
@@ -260,6 +291,46 @@ class TestStateManager:
         
         assert cleared == 5
         assert len(manager.games) == 0
+    
+    def test_get_env_reuses_cached_env(self):
+        """Test get_env returns the same environment across calls."""
+        manager = StateManager()
+        manager.create_game(self.create_test_game("game1"))
+        
+        env = manager.get_env("game1")
+        env.step("e2e4")
+        
+        assert manager.get_env("game1") is env
+        assert env.chess.board.move_stack  # Move history kept, not re-parsed
+    
+    def test_get_env_rebuilds_for_replaced_game(self):
+        """Test get_env rebuilds when the stored game object changes."""
+        manager = StateManager()
+        manager.create_game(self.create_test_game("game1"))
+        env = manager.get_env("game1")
+        
+        replacement = self.create_test_game("game1")
+        replacement.board_state = BoardState.from_board(
+            chess.Board("rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1")
+        )
+        manager.update_game(replacement)
+        
+        rebuilt = manager.get_env("game1")
+        assert rebuilt is not env
+        assert rebuilt.game is replacement
+        assert rebuilt.chess.board.fen() == replacement.board_state.fen
+    
+    def test_get_env_missing_and_deleted(self):
+        """Test get_env returns None for unknown and deleted games."""
+        manager = StateManager()
+        assert manager.get_env("missing") is None
+        
+        manager.create_game(self.create_test_game("game1"))
+        manager.get_env("game1")
+        manager.delete_game("game1")
+        
+        assert manager.get_env("game1") is None
+        assert "game1" not in manager.envs
 
 
 if __name__ == "__main__":